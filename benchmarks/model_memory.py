@@ -0,0 +1,101 @@
+"""Bytes per issue held by the model layer, slotted vs. dict-backed dataclasses.
+
+Builds the same synthetic corpus twice, once with the models from ``issue_assistant.models`` and
+once with dict-backed clones of them (what the models were before they became slotted), and
+reports the traced allocation per issue. ``raw`` payloads are left empty so only object overhead
+is measured.
+
+    python benchmarks/model_memory.py --issues 20000 --comments 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import gc
+import sys
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from issue_assistant import models  # noqa: E402
+
+_MODELS = ("IssueAuthor", "IssueLabel", "IssueComment", "Issue", "NormalizedIssue")
+
+
+def _dict_backed(cls: type) -> type:
+    fields = []
+    for f in dataclasses.fields(cls):
+        if f.default is not dataclasses.MISSING:
+            fields.append((f.name, f.type, dataclasses.field(default=f.default)))
+        elif f.default_factory is not dataclasses.MISSING:
+            fields.append((f.name, f.type, dataclasses.field(default_factory=f.default_factory)))
+        else:
+            fields.append((f.name, f.type))
+    return dataclasses.make_dataclass(cls.__name__, fields, frozen=True)
+
+
+def _build(ns: Any, *, issues: int, comments: int) -> list[Any]:
+    t0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    out = []
+    for n in range(issues):
+        author = ns.IssueAuthor(login=f"user{n % 3000}", id=n % 3000)
+        thread = tuple(
+            ns.IssueComment(
+                id=n * 100 + k,
+                author=ns.IssueAuthor(login=f"user{(n + k) % 3000}", id=(n + k) % 3000),
+                body=f"comment {k}",
+                created_at=t0 + timedelta(minutes=k),
+                updated_at=None,
+            )
+            for k in range(comments)
+        )
+        issue = ns.Issue(
+            number=n,
+            title=f"Issue {n}",
+            body="body",
+            author=author,
+            labels=(ns.IssueLabel(name="bug"), ns.IssueLabel(name=f"area-{n % 40}")),
+            state="open",
+            created_at=t0 + timedelta(hours=n),
+            comments=thread,
+        )
+        out.append(
+            ns.NormalizedIssue(issue=issue, normalized_title=f"issue {n}", sections={}, is_low_signal=False)
+        )
+    return out
+
+
+def _bytes_per_issue(ns: Any, *, issues: int, comments: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    corpus = _build(ns, issues=issues, comments=comments)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del corpus
+    return (after - before) / issues
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=20000)
+    parser.add_argument("--comments", type=int, default=8, help="Comments per issue")
+    args = parser.parse_args()
+
+    slotted = SimpleNamespace(**{name: getattr(models, name) for name in _MODELS})
+    dict_backed = SimpleNamespace(**{name: _dict_backed(getattr(models, name)) for name in _MODELS})
+
+    before = _bytes_per_issue(dict_backed, issues=args.issues, comments=args.comments)
+    after = _bytes_per_issue(slotted, issues=args.issues, comments=args.comments)
+    print(f"issues={args.issues} comments_per_issue={args.comments}")
+    print(f"dict-backed: {before:,.0f} bytes/issue")
+    print(f"slotted:     {after:,.0f} bytes/issue ({(1 - after / before) * 100:.1f}% less)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Time to get a run back from ``issues.json`` vs. from the binary ``run.snapshot``.
+
+Builds a synthetic run (analyses assembled directly, since the analysis phases are not what is
+being measured), writes both files, then times ``json.loads`` of
+``issues.json`` (plain dicts only, no models), ``load_snapshot`` (full ``AnalysisRun``) and
+opening a ``RunSnapshot`` for its table alone.
+
+    python benchmarks/snapshot_load.py --issues 20000 --comments 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from issue_assistant.models import (  # noqa: E402
+    AnalysisRun,
+    Issue,
+    IssueAnalysis,
+    IssueAuthor,
+    IssueComment,
+    IssueLabel,
+    LifecycleClassification,
+    MaintainerAction,
+    MaintainerCostEstimate,
+    QualityBreakdown,
+    TriageClassification,
+)
+from issue_assistant.phases.normalization import normalize_issue  # noqa: E402
+from issue_assistant.snapshot import RunSnapshot, load_snapshot, write_snapshot  # noqa: E402
+
+
+def _issues(n: int, comments: int) -> list[Issue]:
+    t0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return [
+        Issue(
+            number=i,
+            title=f"Crash {i} when saving file",
+            body=f"Steps:\n1. open\n2. save\n\nExpected: saved\n\nActual: ValueError at line {i}",
+            author=IssueAuthor(login=f"user{i % 3000}", id=i % 3000),
+            labels=(IssueLabel(name="bug"), IssueLabel(name=f"area-{i % 40}")),
+            state="open",
+            created_at=t0 + timedelta(hours=i),
+            updated_at=t0 + timedelta(hours=i + 1),
+            comments=tuple(
+                IssueComment(
+                    id=i * 100 + k,
+                    author=IssueAuthor(login=f"user{(i + k) % 3000}", id=(i + k) % 3000),
+                    body=f"comment {k} on {i}",
+                    created_at=t0 + timedelta(hours=i, minutes=k),
+                    updated_at=None,
+                )
+                for k in range(comments)
+            ),
+        )
+        for i in range(1, n + 1)
+    ]
+
+
+def _run(issues: list[Issue]) -> AnalysisRun:
+    analyses = tuple(
+        IssueAnalysis(
+            issue_number=i.number,
+            normalized=normalize_issue(i),
+            quality=QualityBreakdown(completeness=60, clarity=70, reproducibility=40, noise=5, reasons=("has steps",)),
+            triage=TriageClassification(category="bug", confidence=0.8, reasons=("crash keyword",)),
+            lifecycle=LifecycleClassification(state="active", confidence="HIGH", reasons=("recent comments",)),
+            maintainer_cost=MaintainerCostEstimate(level="medium", reasons=("long thread",), signals={"comments": len(i.comments)}),
+            duplicates=None,
+            maintainer_action=MaintainerAction(recommended_actions=("reproduce",), recommended_labels=("bug",)),
+        )
+        for i in issues
+    )
+    return AnalysisRun(generated_at=datetime(2024, 6, 1, tzinfo=timezone.utc), repo="o/r", issues=analyses)
+
+
+def _best(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=20000)
+    parser.add_argument("--comments", type=int, default=8, help="Comments per issue")
+    args = parser.parse_args()
+
+    run = _run(_issues(args.issues, args.comments))
+    with tempfile.TemporaryDirectory() as d:
+        json_path = Path(d) / "issues.json"
+        snap_path = Path(d) / "run.snapshot"
+        json_path.write_text(json.dumps(run.as_json_dict(), indent=2, sort_keys=True), encoding="utf-8")
+        write_snapshot(run, snap_path)
+
+        def table_only() -> None:
+            with RunSnapshot(snap_path) as s:
+                len(s.table)
+
+        t_json = _best(lambda: json.loads(json_path.read_text(encoding="utf-8")))
+        t_snap = _best(lambda: load_snapshot(snap_path))
+        t_table = _best(table_only)
+        print(f"issues={args.issues} comments_per_issue={args.comments}")
+        print(f"issues.json:  {json_path.stat().st_size / 1e6:8.1f} MB  json.loads      {t_json:7.3f}s")
+        print(f"run.snapshot: {snap_path.stat().st_size / 1e6:8.1f} MB  load_snapshot   {t_snap:7.3f}s")
+        print(f"{'':24}RunSnapshot.table {t_table:7.3f}s")
+
+
+if __name__ == "__main__":
+    main()
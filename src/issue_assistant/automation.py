@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from .issue_table import is_low_signal
 from .models import Issue, IssueAnalysis
 from .phases.labels import recommend_labels
 
@@ -93,7 +94,7 @@ class _Triggers:
 
 def _comment_triggers(a: IssueAnalysis) -> _Triggers:
     needs_info = a.lifecycle.state == "needs-info"
-    low_signal = bool(a.normalized.is_low_signal) or a.quality.noise >= 70
+    low_signal = is_low_signal(a.normalized.is_low_signal, a.quality.noise)
     duplicates = bool(a.duplicates is not None and a.duplicates.likely_duplicates_of)
 
     return _Triggers(needs_info=needs_info, low_signal=low_signal, duplicates=duplicates)
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator, Mapping
+
+# Request headers that change what the server answers (and so are part of the match key).
+_VARYING_HEADERS = ("If-None-Match", "If-Modified-Since")
+
+
+class CassetteMissError(LookupError):
+    pass
+
+
+@dataclass(frozen=True)
+class Interaction:
+    method: str
+    url: str
+    params: tuple[tuple[str, str], ...]
+    vary: tuple[tuple[str, str], ...]
+    body_sha256: str | None
+    status: int
+    headers: tuple[tuple[str, str], ...]
+    body: bytes
+    elapsed_seconds: float
+
+    def match_key(self) -> tuple[Any, ...]:
+        return (self.method, self.url, self.params, self.vary, self.body_sha256)
+
+    def to_json(self) -> dict[str, object]:
+        try:
+            body: dict[str, str] = {"text": self.body.decode("utf-8")}
+        except UnicodeDecodeError:
+            body = {"base64": base64.b64encode(self.body).decode("ascii")}
+        return {
+            "method": self.method,
+            "url": self.url,
+            "params": [list(p) for p in self.params],
+            "vary": [list(v) for v in self.vary],
+            "body_sha256": self.body_sha256,
+            "status": self.status,
+            "headers": [list(h) for h in self.headers],
+            "body": body,
+            "elapsed_seconds": self.elapsed_seconds,
+        }
+
+    @staticmethod
+    def from_json(d: Mapping[str, Any]) -> "Interaction":
+        body = d.get("body") or {}
+        raw = base64.b64decode(body["base64"]) if "base64" in body else str(body.get("text") or "").encode("utf-8")
+        return Interaction(
+            method=str(d["method"]),
+            url=str(d["url"]),
+            params=tuple((str(k), str(v)) for k, v in d.get("params") or ()),
+            vary=tuple((str(k), str(v)) for k, v in d.get("vary") or ()),
+            body_sha256=d.get("body_sha256"),
+            status=int(d["status"]),
+            headers=tuple((str(k), str(v)) for k, v in d.get("headers") or ()),
+            body=raw,
+            elapsed_seconds=float(d.get("elapsed_seconds") or 0.0),
+        )
+
+
+class CassetteResponse:
+    """In-memory response served from (or captured into) a cassette; quacks like requests.Response."""
+
+    def __init__(self, interaction: Interaction) -> None:
+        from requests.structures import CaseInsensitiveDict
+
+        self.url = interaction.url
+        self.status_code = interaction.status
+        self.headers = CaseInsensitiveDict(dict(interaction.headers))
+        self.content = interaction.body
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i : i + chunk_size]
+
+    def raise_for_status(self) -> None:
+        import requests
+
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)  # type: ignore[arg-type]
+
+    def close(self) -> None:
+        return None
+
+
+class RecordingSession:
+    """Session wrapper that performs real requests and appends each exchange to a JSON-lines cassette.
+
+    Request headers other than the conditional validators are never written, so tokens stay out
+    of the file. Streamed bodies are read in full to be recorded.
+    """
+
+    def __init__(self, path: Path, *, session: Any = None) -> None:
+        import requests
+
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.session = session if session is not None else requests.Session()
+        self._lock = threading.Lock()
+        self._file = self.path.open("w", encoding="utf-8")
+
+    @property
+    def headers(self) -> Any:
+        return self.session.headers
+
+    def mount(self, prefix: str, adapter: Any) -> None:
+        self.session.mount(prefix, adapter)
+
+    def get(self, url: str, **kwargs: Any) -> CassetteResponse:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> CassetteResponse:
+        return self.request("POST", url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> CassetteResponse:
+        started = time.perf_counter()
+        resp = self.session.request(method, url, **kwargs)
+        body = resp.content
+        elapsed = time.perf_counter() - started
+        interaction = Interaction(
+            method=method.upper(),
+            url=url,
+            params=_items(kwargs.get("params")),
+            vary=_vary(kwargs.get("headers")),
+            body_sha256=_body_digest(kwargs.get("json")),
+            status=int(resp.status_code),
+            headers=tuple((str(k), str(v)) for k, v in resp.headers.items()),
+            body=body,
+            elapsed_seconds=round(elapsed, 6),
+        )
+        with self._lock:
+            self._file.write(json.dumps(interaction.to_json(), sort_keys=True) + "\n")
+            self._file.flush()
+        return CassetteResponse(interaction)
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+        self.session.close()
+
+
+class ReplaySession:
+    """Session that serves recorded exchanges from a cassette without touching the network.
+
+    Identical requests are answered in recorded order (so recorded retries replay as retries);
+    once exhausted, the last answer repeats. ``latency`` injects delay per response: ``"none"``,
+    ``"recorded"`` (the captured wall time), or a fixed number of seconds.
+    """
+
+    def __init__(self, path: Path, *, latency: str | float = "none", sleep: Callable[[float], None] = time.sleep) -> None:
+        self.path = Path(path)
+        self.headers: dict[str, str] = {}
+        self._latency = latency
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._queues: dict[tuple[Any, ...], deque[Interaction]] = {}
+        self._last: dict[tuple[Any, ...], Interaction] = {}
+        with self.path.open("r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    interaction = Interaction.from_json(json.loads(line))
+                    self._queues.setdefault(interaction.match_key(), deque()).append(interaction)
+
+    def mount(self, prefix: str, adapter: Any) -> None:
+        return None
+
+    def get(self, url: str, **kwargs: Any) -> CassetteResponse:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> CassetteResponse:
+        return self.request("POST", url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> CassetteResponse:
+        key = (method.upper(), url, _items(kwargs.get("params")), _vary(kwargs.get("headers")), _body_digest(kwargs.get("json")))
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue:
+                interaction = queue.popleft()
+                self._last[key] = interaction
+            else:
+                interaction = self._last.get(key)  # type: ignore[assignment]
+        if interaction is None:
+            raise CassetteMissError(f"no recorded response for {method.upper()} {url} params={dict(key[2])}")
+
+        delay = self._delay(interaction)
+        if delay > 0:
+            self._sleep(delay)
+        return CassetteResponse(interaction)
+
+    def close(self) -> None:
+        return None
+
+    def _delay(self, interaction: Interaction) -> float:
+        if self._latency == "none":
+            return 0.0
+        if self._latency == "recorded":
+            return interaction.elapsed_seconds
+        return float(self._latency)
+
+
+def parse_latency(value: str) -> str | float:
+    v = (value or "none").strip().lower()
+    if v in ("none", "recorded"):
+        return v
+    try:
+        seconds = float(v)
+    except ValueError:
+        raise ValueError("latency must be 'none', 'recorded' or a number of seconds") from None
+    if seconds < 0:
+        raise ValueError("latency must not be negative")
+    return seconds
+
+
+def _items(m: Mapping[str, Any] | None) -> tuple[tuple[str, str], ...]:
+    return tuple(sorted((str(k), str(v)) for k, v in (m or {}).items()))
+
+
+def _vary(headers: Mapping[str, Any] | None) -> tuple[tuple[str, str], ...]:
+    hdrs = {str(k).lower(): str(v) for k, v in (headers or {}).items()}
+    return tuple((h, hdrs[h.lower()]) for h in _VARYING_HEADERS if h.lower() in hdrs)
+
+
+def _body_digest(payload: Any) -> str | None:
+    if payload is None:
+        return None
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Mapping
+
+
+@dataclass(frozen=True)
+class CheckpointPage:
+    items: list[Any]
+    last_page: int | None
+
+
+class FetchCheckpoint:
+    """Append-only JSON-lines log of fully fetched list pages, so an interrupted run can resume.
+
+    Every page a listing or comment thread finishes reading is appended (raw items plus the
+    ``Link`` last-page hint) and flushed straight away. Opened with ``resume=True``, pages from the
+    previous attempt are served back instead of being requested again; a torn last line left by a
+    crash is ignored. Newly recorded pages are written to disk only, never kept in memory. Pages cut short (limit reached, decode error) are never recorded.
+    """
+
+    def __init__(self, path: Path, *, resume: bool = False) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        # Only pages loaded for resume stay in memory; pages recorded by this run go to disk only.
+        self._pages: dict[tuple[str, int], CheckpointPage] = {}
+        self._recorded = 0
+        if resume and self.path.exists():
+            self._load()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("a" if resume else "w", encoding="utf-8")
+        if resume and self._file.tell() > 0 and _last_byte(self.path) != b"\n":
+            # Terminate the torn line so the next record starts on a line of its own.
+            self._file.write("\n")
+
+    def __len__(self) -> int:
+        """Pages available for resume plus pages recorded by this run."""
+        with self._lock:
+            return len(self._pages) + self._recorded
+
+    def page(self, url: str, params: Mapping[str, Any], page: int, items_key: str | None = None) -> CheckpointPage | None:
+        with self._lock:
+            return self._pages.get((_stream_key(url, params, items_key), int(page)))
+
+    def record(
+        self,
+        url: str,
+        params: Mapping[str, Any],
+        page: int,
+        items_key: str | None,
+        *,
+        items: list[Any],
+        last_page: int | None,
+    ) -> None:
+        stream = _stream_key(url, params, items_key)
+        line = json.dumps({"stream": stream, "page": int(page), "last_page": last_page, "items": items}, sort_keys=True)
+        with self._lock:
+            self._recorded += 1
+            if not self._file.closed:
+                self._file.write(line + "\n")
+                self._file.flush()
+
+    def recording(
+        self,
+        url: str,
+        params: Mapping[str, Any],
+        page: int,
+        items_key: str | None,
+        *,
+        items: Iterable[Any],
+        last_page: int | None,
+    ) -> Iterator[Any]:
+        """Pass ``items`` through and record the page once all of them were read."""
+        seen: list[Any] = []
+        for item in items:
+            seen.append(item)
+            yield item
+        self.record(url, params, page, items_key, items=seen, last_page=last_page)
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def discard(self) -> None:
+        """Close and delete the checkpoint (the run it belongs to completed)."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+    def _load(self) -> None:
+        with self.path.open("r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    d = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if not isinstance(d, dict) or not isinstance(d.get("items"), list):
+                    continue
+                last_page = d.get("last_page")
+                self._pages[(str(d.get("stream")), int(d.get("page") or 0))] = CheckpointPage(
+                    items=d["items"], last_page=int(last_page) if last_page is not None else None
+                )
+
+
+def _last_byte(path: Path) -> bytes:
+    with path.open("rb") as f:
+        f.seek(-1, 2)
+        return f.read(1)
+
+
+def _stream_key(url: str, params: Mapping[str, Any], items_key: str | None) -> str:
+    p = sorted((str(k), str(v)) for k, v in params.items() if k != "page")
+    return json.dumps([url, p, items_key], separators=(",", ":"))
@@ -1,27 +1,184 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import subprocess
-from typing import Any
+from typing import Any, Callable
 
 from .artifacts import ArtifactWriter
 from .automation import decide_auto_comment
+from .cassette import RecordingSession, ReplaySession, parse_latency
+from .checkpoint import FetchCheckpoint
 from .github import GitHubClient, GitHubRepoRef
-from .models import Commit, Issue, IssueAuthor, IssueComment, IssueLabel, PullRequest
+from .ingest import ingest_concurrently
+from .interning import InternTable
+from .mirror import IssueMirror
+from .models import Commit, Issue, IssueComment, PullRequest
 from .phase_registry import enabled_phases_require_comments, normalize_enabled_phases
 from .pipeline import analyze_issues
+from .retention import DEFAULT_RAW_RETENTION, RAW_RETENTION_POLICIES, retain_raw
+from .scheduler import RetryPolicy
+from .snapshot import RunSnapshot, write_snapshot
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(prog="issue-assistant")
     sub = parser.add_subparsers(dest="command", required=True)
 
-    analyze = sub.add_parser("analyze")
+    # Options shared by single-repo and batch analysis.
+    shared = argparse.ArgumentParser(add_help=False)
+    shared.add_argument("--github-token", default=None, help="GitHub token (uses GitHub API when provided)")
+    shared.add_argument("--state", default="open", choices=["open", "closed", "all"], help="Issue state")
+    shared.add_argument("--limit", type=int, default=200, help="Max issues to fetch/analyze")
+    shared.add_argument(
+        "--include-pull-requests",
+        action="store_true",
+        help="Include pull requests from /issues endpoint",
+    )
+    shared.add_argument(
+        "--github-pull-requests",
+        action="store_true",
+        help="Optional: fetch pull requests (with their comments) from the GitHub API, concurrently with issues. "
+        "Ignored when --pull-requests-file is given.",
+    )
+    shared.add_argument(
+        "--pull-request-limit",
+        type=int,
+        default=200,
+        help="Max pull requests to fetch with --github-pull-requests (default: 200).",
+    )
+    shared.add_argument(
+        "--github-commits",
+        action="store_true",
+        help="Optional: fetch default-branch commits from the GitHub API, concurrently with issues. "
+        "Ignored when --commits-file is given.",
+    )
+    shared.add_argument(
+        "--commit-limit",
+        type=int,
+        default=200,
+        help="Max commits to fetch with --github-commits (default: 200).",
+    )
+    shared.add_argument(
+        "--governance-mode",
+        default="dry-run",
+        choices=["dry-run", "strict", "aggressive"],
+        help="Trust mode: dry-run (default), strict, aggressive.",
+    )
+    shared.add_argument(
+        "--comments-mode",
+        default="all",
+        choices=["none", "needed", "all"],
+        help="GitHub comment fetching mode: none, needed, or all (default: all).",
+    )
+    shared.add_argument(
+        "--transport",
+        default="rest",
+        choices=["rest", "graphql"],
+        help="GitHub API used to fetch issues: rest (default) or graphql (issues + first comment page in bulk).",
+    )
+    shared.add_argument(
+        "--comments-strategy",
+        default="per-issue",
+        choices=["per-issue", "bulk"],
+        help="How comment threads are fetched over REST: per-issue (default) or bulk (one pass over the "
+        "repo-wide comments endpoint; fewer requests when most issues are being analyzed).",
+    )
+    shared.add_argument(
+        "--pull-request-filter",
+        default="client",
+        choices=["client", "server"],
+        help="Where pull requests are excluded from the issue listing: client (default; /issues, PRs dropped "
+        "locally) or server (search is:issue, so --limit and every page are spent on issues only).",
+    )
+    shared.add_argument(
+        "--partition-by",
+        default=None,
+        choices=["created", "updated"],
+        help="Optional: fetch the issue listing as concurrent search queries over created:/updated: date windows "
+        "(split until each is under the 1000-result search cap), newest first by that field (--sort does not apply). "
+        "Only the windows holding the first --limit issues are fetched. For very large repositories; throughput then follows the search rate budget "
+        "instead of page round trips.",
+    )
+    shared.add_argument(
+        "--http-cassette",
+        default=None,
+        help="Optional: JSON-lines cassette of GitHub API exchanges, for reproducible offline benchmarking. "
+        "See --http-cassette-mode.",
+    )
+    shared.add_argument(
+        "--http-cassette-mode",
+        default="replay",
+        choices=["record", "replay"],
+        help="record: hit the API and capture every response (headers, pagination, timing) to --http-cassette; "
+        "replay (default): serve responses from the cassette without network access.",
+    )
+    shared.add_argument(
+        "--http-replay-latency",
+        default="none",
+        help="Latency injected per replayed response: none (default), recorded, or a fixed number of seconds.",
+    )
+    shared.add_argument(
+        "--http-concurrency",
+        type=int,
+        default=4,
+        help="Max concurrent GitHub API requests per client: issue, pull request and commit listing pages, search "
+        "windows and comment threads all share this cap (default: 4; 1 = serial).",
+    )
+    shared.add_argument(
+        "--http-cache-dir",
+        default=None,
+        help="Optional: directory for a persistent ETag/If-None-Match cache of GitHub GET responses (reused across runs).",
+    )
+    shared.add_argument(
+        "--http-max-attempts",
+        type=int,
+        default=6,
+        help="Max attempts per GitHub request; transient errors and rate limits are retried with backoff (default: 6).",
+    )
+    shared.add_argument(
+        "--checkpoint",
+        default=None,
+        help="Optional: file that records every fetched REST page (issue listings and comment threads) as the run "
+        "goes, so an interrupted fetch can be resumed with --resume. Deleted once the run completes.",
+    )
+    shared.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run from --checkpoint: pages it already fetched are not requested again.",
+    )
+    shared.add_argument(
+        "--raw-retention",
+        default=DEFAULT_RAW_RETENTION,
+        choices=list(RAW_RETENTION_POLICIES),
+        help="How much of each GitHub payload parsed issues, pull requests and commits keep in memory: none "
+        "(only the comment count), minimal (default; identifiers, links and the comment count) or full. No "
+        "analysis phase reads it; every policy keeps the comment count, so comment-free threads are still skipped.",
+    )
+    shared.add_argument(
+        "--phases",
+        default=None,
+        help="Optional comma-separated phase list to emit (e.g. dependencies,weekly_digest). Default: all.",
+    )
+    shared.add_argument(
+        "--http-metrics",
+        default=None,
+        help="Optional: write GitHub API telemetry (per-endpoint latency, bytes, retries, 304 ratio, rate-limit "
+        "samples) to this JSON file. It differs on every run, so keep it out of committed artifacts.",
+    )
+    shared.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print lightweight run metrics (elapsed time, GitHub API call counts) to stderr.",
+    )
+
+    analyze = sub.add_parser("analyze", parents=[shared])
     analyze.add_argument("--repo", default=None, help="Repository name (e.g. owner/name)")
     analyze.add_argument("--repo-path", default=".", help="Path to the repo root (default: .)")
     analyze.add_argument(
@@ -29,14 +186,6 @@ def main() -> None:
         default=None,
         help="Path to a JSON file containing a GitHub Issues API-like payload.",
     )
-    analyze.add_argument("--github-token", default=None, help="GitHub token (uses GitHub API when provided)")
-    analyze.add_argument("--state", default="open", choices=["open", "closed", "all"], help="Issue state")
-    analyze.add_argument("--limit", type=int, default=200, help="Max issues to fetch/analyze")
-    analyze.add_argument(
-        "--include-pull-requests",
-        action="store_true",
-        help="Include pull requests from /issues endpoint",
-    )
     analyze.add_argument(
         "--output-dir",
         default=None,
@@ -63,20 +212,18 @@ def main() -> None:
         default=200,
         help="Max commits to scan when --scan-git-commits is enabled.",
     )
-
-    analyze.add_argument(
-        "--governance-mode",
-        default="dry-run",
-        choices=["dry-run", "strict", "aggressive"],
-        help="Trust mode: dry-run (default), strict, aggressive.",
-    )
-
     analyze.add_argument(
         "--issue-number",
         type=int,
         default=None,
         help="Optional: analyze a single issue number (recommended for issue-triggered GitHub Actions).",
     )
+    analyze.add_argument(
+        "--event-file",
+        default=None,
+        help="Optional: webhook event payload carrying the issue (e.g. $GITHUB_EVENT_PATH for issues/issue_comment "
+        "events). The issue is built from the payload; the API is only used for comments it lacks.",
+    )
     analyze.add_argument(
         "--auto-comment",
         action="store_true",
@@ -87,24 +234,58 @@ def main() -> None:
         default=None,
         help="Optional: URL prefix used to link to committed artifacts (e.g. https://github.com/<owner>/<repo>/blob/<ref>/.issue-assistant).",
     )
-
     analyze.add_argument(
-        "--comments-mode",
-        default="all",
-        choices=["none", "needed", "all"],
-        help="GitHub comment fetching mode: none, needed, or all (default: all).",
+        "--snapshot",
+        default=None,
+        help="Optional: also write the run as a binary snapshot to this path, for `render` and other local tools. "
+        "Snapshots are only safe to load from trusted local runs; keep them out of committed artifacts.",
     )
-
     analyze.add_argument(
-        "--phases",
+        "--mirror",
         default=None,
-        help="Optional comma-separated phase list to emit (e.g. dependencies,weekly_digest). Default: all.",
+        help="Optional: path to a local SQLite issue mirror. Each run syncs only issues updated since the previous "
+        "sync, then analyzes the full mirrored corpus (--limit is not applied).",
     )
 
-    analyze.add_argument(
-        "--verbose",
-        action="store_true",
-        help="Print lightweight run metrics (elapsed time, GitHub API call counts) to stderr.",
+    analyze_many = sub.add_parser(
+        "analyze-many",
+        parents=[shared],
+        help="Analyze many repositories in one process, sharing one GitHub client and rate budget.",
+    )
+    analyze_many.add_argument(
+        "--repos-file",
+        required=True,
+        help="Text file with one owner/name per line (blank lines and #-comments are ignored).",
+    )
+    analyze_many.add_argument(
+        "--output-root",
+        default=".",
+        help="Artifacts for each repo go to <output-root>/<owner>/<name>/.issue-assistant (default: .).",
+    )
+    analyze_many.add_argument(
+        "--repo-concurrency",
+        type=int,
+        default=4,
+        help="Repositories processed at the same time (default: 4). API requests from all of them share "
+        "--http-concurrency slots, handed out round-robin across repos.",
+    )
+    analyze_many.set_defaults(mirror=None)
+
+    render = sub.add_parser(
+        "render",
+        help="Re-write artifacts from a saved run snapshot, without fetching or re-analyzing issues.",
+    )
+    render.add_argument(
+        "--snapshot",
+        required=True,
+        help="Path to a snapshot written by a previous `analyze --snapshot` run. Snapshots are decoded with "
+        "marshal, which is not safe against crafted input: only render snapshots you wrote yourself.",
+    )
+    render.add_argument("--output-dir", required=True, help="Output directory for the artifacts.")
+    render.add_argument(
+        "--phases",
+        default=None,
+        help="Optional comma-separated phase list to emit (e.g. dependencies,weekly_digest). Default: all.",
     )
 
     args = parser.parse_args()
@@ -125,65 +306,103 @@ def main() -> None:
                 "[issue-assistant] warning: comment-dependent phase enabled but --comments-mode=none; results may be less accurate\n"
             )
 
-        issues: list[Issue] = []
+        issue_number: int | None = int(args.issue_number) if args.issue_number is not None else None
+        event_issue: Issue | None = None
+        if args.event_file:
+            event_issue, event_repo = _load_event_file(Path(args.event_file), raw_retention=str(args.raw_retention))
+            if event_issue is None and issue_number is None:
+                raise SystemExit("--event-file payload has no issue object; pass --issue-number instead")
+            if event_issue is not None and issue_number is not None and event_issue.number != issue_number:
+                # The event is about another issue; fall back to fetching the requested one.
+                event_issue = None
+            if event_issue is not None:
+                issue_number = event_issue.number
+            if not args.repo and event_repo:
+                args.repo = event_repo
+
+        if (bool(args.github_pull_requests) or bool(args.github_commits)) and not args.github_token:
+            raise SystemExit("--github-pull-requests/--github-commits require --github-token")
+
         gh: GitHubClient | None = None
         repo_ref: GitHubRepoRef | None = None
+        load_issues: Callable[[], list[Issue]]
+        load_prs: Callable[[], list[PullRequest]] | None = None
+        load_commits: Callable[[], list[Commit]] | None = None
         if args.github_token:
             if not args.repo:
                 raise SystemExit("--repo is required when using --github-token")
             repo_ref = GitHubRepoRef.parse(args.repo)
-            gh = GitHubClient(token=args.github_token)
+            gh = _github_client(args)
 
             cmode = str(args.comments_mode)
             include_comments = cmode == "all" or (cmode == "needed" and (bool(args.auto_comment) or phases_need_comments))
-
-            if args.issue_number is not None:
-                issues = [gh.get_issue(repo_ref, int(args.issue_number), include_comments=include_comments)]
-            else:
-                issues = gh.list_issues(
-                    repo_ref,
-                    state=args.state,
-                    limit=args.limit,
-                    include_pull_requests=bool(args.include_pull_requests),
-                    include_comments=include_comments,
+            load_issues = _github_issue_loader(
+                args,
+                gh,
+                repo_ref,
+                event_issue=event_issue,
+                issue_number=issue_number,
+                include_comments=include_comments,
+            )
+            # PR and commit listings share the client's connection pool and scheduler.
+            if bool(args.github_pull_requests):
+                load_prs = functools.partial(
+                    gh.list_pull_requests, repo_ref, limit=int(args.pull_request_limit), include_comments=cmode != "none"
                 )
+            if bool(args.github_commits):
+                load_commits = functools.partial(gh.list_commits, repo_ref, limit=int(args.commit_limit))
+        elif event_issue is not None:
+            load_issues = lambda: [event_issue]
         elif args.issues_file:
-            issues = _load_issues_from_file(Path(args.issues_file))
+            load_issues = functools.partial(_load_issues_from_file, Path(args.issues_file), raw_retention=str(args.raw_retention))
         else:
-            raise SystemExit("Provide either --github-token (and --repo) or --issues-file")
+            raise SystemExit("Provide either --github-token (and --repo), --event-file or --issues-file")
 
-        prs: list[PullRequest] | None = None
+        # Explicit files win over API ingestion; the local git scan is the fallback for commits.
         if args.pull_requests_file:
-            prs = _load_pull_requests_from_file(Path(args.pull_requests_file))
-
-        commits: list[Commit] | None = None
+            load_prs = functools.partial(
+                _load_pull_requests_from_file, Path(args.pull_requests_file), raw_retention=str(args.raw_retention)
+            )
         if args.commits_file:
-            commits = _load_commits_from_file(Path(args.commits_file))
-        elif args.scan_git_commits:
-            commits = _scan_git_commits(repo_path=repo_path, limit=int(args.git_commit_limit))
+            load_commits = functools.partial(_load_commits_from_file, Path(args.commits_file), raw_retention=str(args.raw_retention))
+        elif load_commits is None and args.scan_git_commits:
+            load_commits = functools.partial(_scan_git_commits, repo_path=repo_path, limit=int(args.git_commit_limit))
+
+        ingested = ingest_concurrently(issues=load_issues, pull_requests=load_prs, commits=load_commits)
+        issues = ingested.issues
+        t_fetched = time.perf_counter()
 
         run = analyze_issues(
             issues=issues,
             repo=args.repo,
-            pull_requests=prs,
-            commits=commits,
+            pull_requests=ingested.pull_requests,
+            commits=ingested.commits,
             governance_mode=str(args.governance_mode),
+            normalized=ingested.normalized,
         )
+        t_analyzed = time.perf_counter()
         ArtifactWriter(output_dir=output_dir, enabled_phases=enabled_phases).write(run)
+        if args.snapshot:
+            write_snapshot(run, Path(args.snapshot).resolve())
+        t_written = time.perf_counter()
+        if gh is not None and gh.checkpoint is not None:
+            gh.checkpoint.discard()
 
         if bool(args.auto_comment):
-            if not args.github_token or not args.repo or args.issue_number is None:
-                raise SystemExit("--auto-comment requires --github-token, --repo, and --issue-number")
+            if not args.github_token or not args.repo or issue_number is None:
+                raise SystemExit("--auto-comment requires --github-token, --repo, and --issue-number (or --event-file)")
 
             mode = str(args.governance_mode)
             if mode != "dry-run":
                 if gh is None or repo_ref is None:
                     repo_ref = GitHubRepoRef.parse(args.repo)
-                    gh = GitHubClient(token=args.github_token)
+                    gh = _github_client(args)
 
-                issue = gh.get_issue(repo_ref, int(args.issue_number), include_comments=True)
+                issue = next((i for i in issues if i.number == issue_number), None)
+                if issue is None:
+                    issue = gh.get_issue(repo_ref, issue_number, include_comments=True)
 
-                analysis = next((a for a in run.issues if a.issue_number == int(args.issue_number)), None)
+                analysis = next((a for a in run.issues if a.issue_number == issue_number), None)
                 if analysis is None:
                     raise SystemExit("--issue-number was requested but analysis was not produced")
 
@@ -195,15 +414,231 @@ def main() -> None:
                 if decision.should_comment and decision.body:
                     gh.create_issue_comment(repo_ref, issue.number, body=decision.body)
 
+        if gh is not None and args.http_metrics:
+            timings = {
+                "fetch_seconds": t_fetched - t0,
+                "analyze_seconds": t_analyzed - t_fetched,
+                "write_seconds": t_written - t_analyzed,
+                "total_seconds": time.perf_counter() - t0,
+            }
+            _write_http_metrics(Path(args.http_metrics).resolve(), gh, timings)
+
         if bool(args.verbose):
             elapsed = time.perf_counter() - t0
             if gh is not None:
-                sys.stderr.write(f"[issue-assistant] elapsed_seconds={elapsed:.3f} github_api_calls={gh.api_call_counts}\n")
+                avoided = int(gh.api_call_counts.get("comment_fetch_skipped_empty", 0)) + int(
+                    gh.api_call_counts.get("comment_fetch_reused", 0)
+                )
+                sys.stderr.write(
+                    f"[issue-assistant] elapsed_seconds={elapsed:.3f} comment_fetches_avoided={avoided} "
+                    f"github_api_calls={gh.api_call_counts}\n"
+                )
             else:
                 sys.stderr.write(f"[issue-assistant] elapsed_seconds={elapsed:.3f}\n")
 
+    elif args.command == "analyze-many":
+        _analyze_many(args)
+    elif args.command == "render":
+        snapshot_path = Path(args.snapshot).resolve()
+        try:
+            snapshot = RunSnapshot(snapshot_path)
+        except (OSError, ValueError) as e:
+            raise SystemExit(f"render: cannot load snapshot: {e}")
+        output_dir = Path(args.output_dir).resolve()
+        enabled_phases = normalize_enabled_phases(str(args.phases) if args.phases is not None else None)
+        with snapshot:
+            # Analyses are decoded only when an artifact reads them; table-based phases decode none.
+            ArtifactWriter(output_dir=output_dir, enabled_phases=enabled_phases).write(snapshot.run(lazy=True))
+
+
+def _analyze_many(args: argparse.Namespace) -> None:
+    t0 = time.perf_counter()
+    if not args.github_token:
+        raise SystemExit("analyze-many requires --github-token")
+    repos = _load_repos_file(Path(args.repos_file))
+    if not repos:
+        raise SystemExit("--repos-file lists no repositories")
+    output_root = Path(args.output_root).resolve()
+
+    enabled_phases = normalize_enabled_phases(str(args.phases) if args.phases is not None else None)
+    cmode = str(args.comments_mode)
+    include_comments = cmode == "all" or (cmode == "needed" and enabled_phases_require_comments(enabled_phases))
 
-def _load_issues_from_file(path: Path) -> list[Issue]:
+    # One client for the whole batch: one connection pool, HTTP cache and rate budget. Its scheduler
+    # hands request slots out round-robin across repos, so a large repo cannot starve the others.
+    gh = _github_client(args)
+
+    def analyze_repo(repo_ref: GitHubRepoRef) -> int:
+        try:
+            load_prs: Callable[[], list[PullRequest]] | None = None
+            load_commits: Callable[[], list[Commit]] | None = None
+            if bool(args.github_pull_requests):
+                load_prs = functools.partial(
+                    gh.list_pull_requests, repo_ref, limit=int(args.pull_request_limit), include_comments=cmode != "none"
+                )
+            if bool(args.github_commits):
+                load_commits = functools.partial(gh.list_commits, repo_ref, limit=int(args.commit_limit))
+            ingested = ingest_concurrently(
+                issues=_github_issue_loader(
+                    args, gh, repo_ref, event_issue=None, issue_number=None, include_comments=include_comments
+                ),
+                pull_requests=load_prs,
+                commits=load_commits,
+            )
+            run = analyze_issues(
+                issues=ingested.issues,
+                repo=f"{repo_ref.owner}/{repo_ref.name}",
+                pull_requests=ingested.pull_requests,
+                commits=ingested.commits,
+                governance_mode=str(args.governance_mode),
+                normalized=ingested.normalized,
+            )
+            output_dir = output_root / repo_ref.owner / repo_ref.name / ".issue-assistant"
+            ArtifactWriter(output_dir=output_dir, enabled_phases=enabled_phases).write(run)
+            return len(ingested.issues)
+        finally:
+            # The shared client would otherwise keep every repo's issues and threads until the batch ends.
+            gh.forget_repo(repo_ref)
+
+    failed: list[str] = []
+    with ThreadPoolExecutor(max_workers=max(1, int(args.repo_concurrency)), thread_name_prefix="issue-assistant-repo") as pool:
+        futures = [(ref, pool.submit(analyze_repo, ref)) for ref in repos]
+        for ref, future in futures:
+            full_name = f"{ref.owner}/{ref.name}"
+            try:
+                count = future.result()
+            except Exception as e:  # one broken repo must not abort the rest of the batch
+                failed.append(full_name)
+                sys.stderr.write(f"[issue-assistant] {full_name}: failed: {e}\n")
+            else:
+                if bool(args.verbose):
+                    sys.stderr.write(f"[issue-assistant] {full_name}: issues={count}\n")
+
+    if not failed and gh.checkpoint is not None:
+        gh.checkpoint.discard()
+
+    if args.http_metrics:
+        _write_http_metrics(Path(args.http_metrics).resolve(), gh, {"total_seconds": time.perf_counter() - t0})
+
+    if bool(args.verbose):
+        sys.stderr.write(
+            f"[issue-assistant] repos={len(repos)} failed={len(failed)} elapsed_seconds={time.perf_counter() - t0:.3f} "
+            f"github_api_calls={gh.api_call_counts}\n"
+        )
+    if failed:
+        raise SystemExit(f"analyze-many: {len(failed)} of {len(repos)} repositories failed: {', '.join(failed)}")
+
+
+def _load_repos_file(path: Path) -> list[GitHubRepoRef]:
+    """Repositories listed one ``owner/name`` per line, deduplicated in file order."""
+    repos: list[GitHubRepoRef] = []
+    seen: set[tuple[str, str]] = set()
+    for line in path.read_text(encoding="utf-8").splitlines():
+        entry = line.split("#", 1)[0].strip()
+        if not entry:
+            continue
+        ref = GitHubRepoRef.parse(entry)
+        key = (ref.owner.lower(), ref.name.lower())
+        if key not in seen:
+            seen.add(key)
+            repos.append(ref)
+    return repos
+
+
+def _github_issue_loader(
+    args: argparse.Namespace,
+    gh: GitHubClient,
+    repo_ref: GitHubRepoRef,
+    *,
+    event_issue: Issue | None,
+    issue_number: int | None,
+    include_comments: bool,
+) -> Callable[[], list[Issue]]:
+    def load() -> list[Issue]:
+        if event_issue is not None:
+            return [gh.complete_issue(repo_ref, event_issue, include_comments=include_comments)]
+        if issue_number is not None:
+            return [gh.get_issue(repo_ref, issue_number, include_comments=include_comments)]
+        if args.mirror:
+            with IssueMirror(Path(args.mirror)) as mirror:
+                sync = mirror.sync(
+                    gh,
+                    repo_ref,
+                    include_pull_requests=bool(args.include_pull_requests),
+                    include_comments=include_comments,
+                )
+                issues = mirror.load_issues(repo_ref, state=str(args.state))
+            if bool(args.verbose):
+                sys.stderr.write(
+                    f"[issue-assistant] mirror_sync issues_fetched={sync.issues_fetched} "
+                    f"comment_threads_fetched={sync.comment_threads_fetched} issues_total={sync.issues_total}\n"
+                )
+            return issues
+        return gh.list_issues(
+            repo_ref,
+            state=args.state,
+            limit=args.limit,
+            include_pull_requests=bool(args.include_pull_requests),
+            include_comments=include_comments,
+            comments_strategy=str(args.comments_strategy),
+            pull_request_filter=str(args.pull_request_filter),
+            partition_by=str(args.partition_by) if args.partition_by else None,
+        )
+
+    return load
+
+
+def _github_client(args: argparse.Namespace) -> GitHubClient:
+    kwargs: dict[str, Any] = {}
+    if args.http_cassette:
+        if str(args.http_cassette_mode) == "record":
+            kwargs["session"] = RecordingSession(Path(args.http_cassette))
+        else:
+            try:
+                latency = parse_latency(str(args.http_replay_latency))
+            except ValueError as e:
+                raise SystemExit(f"--http-replay-latency: {e}") from None
+            kwargs["session"] = ReplaySession(Path(args.http_cassette), latency=latency)
+    if args.checkpoint:
+        kwargs["checkpoint"] = FetchCheckpoint(Path(args.checkpoint), resume=bool(args.resume))
+    elif bool(args.resume):
+        raise SystemExit("--resume requires --checkpoint")
+    return GitHubClient(
+        token=args.github_token,
+        http_concurrency=int(args.http_concurrency),
+        http_cache_dir=Path(args.http_cache_dir) if args.http_cache_dir else None,
+        retry_policy=RetryPolicy(max_attempts=max(1, int(args.http_max_attempts))),
+        transport=str(args.transport),
+        raw_retention=str(args.raw_retention),
+        **kwargs,
+    )
+
+
+def _write_http_metrics(path: Path, gh: GitHubClient, timings: dict[str, float]) -> None:
+    # Not part of the deterministic analysis artifacts: latencies and samples differ on every run.
+    payload = gh.metrics.to_json()
+    payload["run"] = {k: round(v, 6) for k, v in timings.items()}
+    payload["api_call_counts"] = dict(sorted(gh.api_call_counts.items()))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def _load_event_file(path: Path, *, raw_retention: str = "full") -> tuple[Issue | None, str | None]:
+    """Issue and ``owner/name`` carried by a webhook event payload (either may be missing)."""
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(payload, dict):
+        raise ValueError("event-file must be a webhook event JSON object")
+
+    repository = payload.get("repository")
+    repo = str(repository.get("full_name") or "") or None if isinstance(repository, dict) else None
+
+    raw = payload.get("issue")
+    if not isinstance(raw, dict) or raw.get("number") is None:
+        return None, repo
+    return _parse_issue(raw, raw_retention=raw_retention), repo
+
+
+def _load_issues_from_file(path: Path, *, raw_retention: str = "full") -> list[Issue]:
     payload = json.loads(path.read_text(encoding="utf-8"))
 
     if isinstance(payload, dict) and "items" in payload and isinstance(payload["items"], list):
@@ -213,27 +648,21 @@ def _load_issues_from_file(path: Path) -> list[Issue]:
     else:
         raise ValueError("issues-file must be a list of issues or an object with an 'items' list")
 
+    interner = InternTable()
     issues: list[Issue] = []
     for raw in raw_issues:
-        issues.append(_parse_issue(raw))
+        issues.append(_parse_issue(raw, interner, raw_retention=raw_retention))
     return issues
 
 
-def _parse_issue(raw: dict[str, Any]) -> Issue:
+def _parse_issue(raw: dict[str, Any], interner: InternTable | None = None, *, raw_retention: str = "full") -> Issue:
+    interner = interner if interner is not None else InternTable()
     number = int(raw.get("number"))
     title = str(raw.get("title") or "").strip()
     body = str(raw.get("body") or "")
-    user = raw.get("user") or None
-    author = None if not isinstance(user, dict) else IssueAuthor(login=str(user.get("login") or ""), id=_opt_int(user.get("id")))
-
-    labels_raw = raw.get("labels") or []
-    labels: list[IssueLabel] = []
-    if isinstance(labels_raw, list):
-        for l in labels_raw:
-            if isinstance(l, str):
-                labels.append(IssueLabel(name=l))
-            elif isinstance(l, dict):
-                labels.append(IssueLabel(name=str(l.get("name") or "")))
+    author = interner.user(raw.get("user"))
+
+    labels = interner.labels(raw.get("labels"))
 
     comments_raw = raw.get("comments") or []
     comments: list[IssueComment] = []
@@ -241,16 +670,10 @@ def _parse_issue(raw: dict[str, Any]) -> Issue:
         for c in comments_raw:
             if not isinstance(c, dict):
                 continue
-            c_user = c.get("user") or None
-            c_author = (
-                None
-                if not isinstance(c_user, dict)
-                else IssueAuthor(login=str(c_user.get("login") or ""), id=_opt_int(c_user.get("id")))
-            )
             comments.append(
                 IssueComment(
                     id=int(c.get("id")),
-                    author=c_author,
+                    author=interner.user(c.get("user")),
                     body=str(c.get("body") or ""),
                     created_at=_opt_dt(c.get("created_at")),
                     updated_at=_opt_dt(c.get("updated_at")),
@@ -262,17 +685,17 @@ def _parse_issue(raw: dict[str, Any]) -> Issue:
         title=title,
         body=body,
         author=author,
-        labels=tuple(labels),
-        state=str(raw.get("state")) if raw.get("state") is not None else None,
+        labels=labels,
+        state=interner.string(str(raw.get("state"))) if raw.get("state") is not None else None,
         created_at=_opt_dt(raw.get("created_at")),
         updated_at=_opt_dt(raw.get("updated_at")),
         closed_at=_opt_dt(raw.get("closed_at")),
         comments=tuple(comments),
-        raw=raw,
+        raw=retain_raw(raw, raw_retention),
     )
 
 
-def _load_pull_requests_from_file(path: Path) -> list[PullRequest]:
+def _load_pull_requests_from_file(path: Path, *, raw_retention: str = "full") -> list[PullRequest]:
     payload = json.loads(path.read_text(encoding="utf-8"))
     if isinstance(payload, dict) and "items" in payload and isinstance(payload["items"], list):
         raw_prs = payload["items"]
@@ -281,19 +704,20 @@ def _load_pull_requests_from_file(path: Path) -> list[PullRequest]:
     else:
         raise ValueError("pull-requests-file must be a list or an object with an 'items' list")
 
+    interner = InternTable()
     prs: list[PullRequest] = []
     for raw in raw_prs:
         if isinstance(raw, dict):
-            prs.append(_parse_pull_request(raw))
+            prs.append(_parse_pull_request(raw, interner, raw_retention=raw_retention))
     return prs
 
 
-def _parse_pull_request(raw: dict[str, Any]) -> PullRequest:
+def _parse_pull_request(raw: dict[str, Any], interner: InternTable | None = None, *, raw_retention: str = "full") -> PullRequest:
+    interner = interner if interner is not None else InternTable()
     number = int(raw.get("number"))
     title = str(raw.get("title") or "").strip()
     body = str(raw.get("body") or "")
-    user = raw.get("user") or None
-    author = None if not isinstance(user, dict) else IssueAuthor(login=str(user.get("login") or ""), id=_opt_int(user.get("id")))
+    author = interner.user(raw.get("user"))
 
     comments_raw = raw.get("comments") or []
     comments: list[IssueComment] = []
@@ -301,16 +725,10 @@ def _parse_pull_request(raw: dict[str, Any]) -> PullRequest:
         for c in comments_raw:
             if not isinstance(c, dict):
                 continue
-            c_user = c.get("user") or None
-            c_author = (
-                None
-                if not isinstance(c_user, dict)
-                else IssueAuthor(login=str(c_user.get("login") or ""), id=_opt_int(c_user.get("id")))
-            )
             comments.append(
                 IssueComment(
                     id=int(c.get("id")),
-                    author=c_author,
+                    author=interner.user(c.get("user")),
                     body=str(c.get("body") or ""),
                     created_at=_opt_dt(c.get("created_at")),
                     updated_at=_opt_dt(c.get("updated_at")),
@@ -322,35 +740,35 @@ def _parse_pull_request(raw: dict[str, Any]) -> PullRequest:
         title=title,
         body=body,
         author=author,
-        state=str(raw.get("state")) if raw.get("state") is not None else None,
+        state=interner.string(str(raw.get("state"))) if raw.get("state") is not None else None,
         created_at=_opt_dt(raw.get("created_at")),
         updated_at=_opt_dt(raw.get("updated_at")),
         closed_at=_opt_dt(raw.get("closed_at")),
         merged_at=_opt_dt(raw.get("merged_at")),
         comments=tuple(comments),
-        raw=raw,
+        raw=retain_raw(raw, raw_retention),
     )
 
 
-def _load_commits_from_file(path: Path) -> list[Commit]:
+def _load_commits_from_file(path: Path, *, raw_retention: str = "full") -> list[Commit]:
     payload = json.loads(path.read_text(encoding="utf-8"))
     if not isinstance(payload, list):
         raise ValueError("commits-file must be a JSON list")
     commits: list[Commit] = []
     for raw in payload:
         if isinstance(raw, dict):
-            commits.append(_parse_commit(raw))
+            commits.append(_parse_commit(raw, raw_retention=raw_retention))
     return commits
 
 
-def _parse_commit(raw: dict[str, Any]) -> Commit:
+def _parse_commit(raw: dict[str, Any], *, raw_retention: str = "full") -> Commit:
     sha = str(raw.get("sha") or raw.get("id") or "").strip()
     message = str(raw.get("message") or "")
     author = None
     if isinstance(raw.get("author"), str):
         author = str(raw.get("author"))
     authored_at = _opt_dt(raw.get("authored_at") or raw.get("date"))
-    return Commit(sha=sha, message=message, author=author, authored_at=authored_at, raw=raw)
+    return Commit(sha=sha, message=message, author=author, authored_at=authored_at, raw=retain_raw(raw, raw_retention))
 
 
 def _scan_git_commits(*, repo_path: Path, limit: int) -> list[Commit]:
@@ -384,15 +802,6 @@ def _scan_git_commits(*, repo_path: Path, limit: int) -> list[Commit]:
     return commits
 
 
-def _opt_int(v: Any) -> int | None:
-    if v is None:
-        return None
-    try:
-        return int(v)
-    except (TypeError, ValueError):
-        return None
-
-
 def _opt_dt(v: Any):
     if v is None:
         return None
@@ -1,9 +1,38 @@
 from __future__ import annotations
 
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Iterable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Mapping, TypeVar
 
-from .models import Issue, IssueAuthor, IssueComment, IssueLabel
+from . import github_graphql as gql
+from .checkpoint import FetchCheckpoint
+from .http_cache import HttpCache
+from .http_metrics import HttpMetrics, endpoint_template
+from .interning import InternTable
+from .jsonstream import iter_json_array
+from .models import Commit, Issue, IssueComment, PullRequest
+from .retention import DEFAULT_RAW_RETENTION, retain_raw, validate_raw_retention
+from .scheduler import DEFAULT_RETRY_POLICY, RequestScheduler, RetryPolicy, fairness_key, rate_limit_resource
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+_SENTINEL = object()
+_STREAM_CHUNK_BYTES = 64 * 1024
+# Completed single-resource GETs kept for reuse within a run (least recently used evicted first).
+_RESPONSE_MEMO_SIZE = 256
+# Pagination limit for endpoints that must be read to the end.
+_UNBOUNDED = 1_000_000_000
+_ISSUE_URL_NUMBER_RE = re.compile(r"/issues/(\d+)$")
+_LINK_LAST_RE = re.compile(r'<([^>]*)>\s*;\s*rel="last"')
+_PAGE_PARAM_RE = re.compile(r"[?&]page=(\d+)")
 
 
 @dataclass(frozen=True)
@@ -24,14 +53,73 @@ class GitHubRepoRef:
         return GitHubRepoRef(owner=owner, name=name)
 
 
+class GitHubGraphQLError(RuntimeError):
+    pass
+
+
+TRANSPORTS = ("rest", "graphql")
+COMMENTS_STRATEGIES = ("per-issue", "bulk")
+PULL_REQUEST_FILTERS = ("client", "server")
+PARTITION_FIELDS = ("created", "updated")
+# The search API never returns more than this many results for one query.
+SEARCH_RESULT_CAP = 1000
+
+
 class GitHubClient:
-    def __init__(self, *, token: str, base_url: str = "https://api.github.com") -> None:
+    def __init__(
+        self,
+        *,
+        token: str,
+        base_url: str = "https://api.github.com",
+        http_concurrency: int = 1,
+        http_cache_dir: Path | None = None,
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+        transport: str = "rest",
+        graphql_url: str | None = None,
+        session: Any = None,
+        checkpoint: FetchCheckpoint | None = None,
+        raw_retention: str = DEFAULT_RAW_RETENTION,
+    ) -> None:
+        """``session`` swaps the HTTP transport for any requests.Session-compatible object
+        (e.g. a cassette.RecordingSession / ReplaySession); by default a pooled requests.Session is used.
+        ``checkpoint`` records every completed REST list page (listings and comment threads) and
+        serves pages recorded by an interrupted earlier run instead of requesting them again.
+        ``raw_retention`` (none/minimal/full) decides how much of each API payload parsed issues,
+        pull requests and commits keep as ``raw``; see retention.MINIMAL_RAW_KEYS.
+        """
         import requests
+        from requests.adapters import HTTPAdapter
+
+        if transport not in TRANSPORTS:
+            raise ValueError(f"transport must be one of: {', '.join(TRANSPORTS)}")
 
+        self.raw_retention = validate_raw_retention(raw_retention)
         self.base_url = base_url.rstrip("/")
-        self.session = requests.Session()
+        self.transport = transport
+        self.graphql_url = graphql_url or gql.graphql_url(self.base_url)
+        self.http_concurrency = max(1, int(http_concurrency))
+        self.session = session if session is not None else requests.Session()
+        # One pooled connection per worker so concurrent fetches never block on (or discard) connections.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.http_concurrency)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._lock = threading.Lock()
+        self.http_cache = HttpCache(Path(http_cache_dir)) if http_cache_dir is not None else None
+        self.checkpoint = checkpoint
+        # Labels and authors repeat across every issue and comment; parse them into shared objects.
+        self.interner = InternTable()
+        self.scheduler = RequestScheduler(max_concurrency=self.http_concurrency, policy=retry_policy)
+        self._sleep: Callable[[float], None] = time.sleep
+        self.metrics = HttpMetrics()
         self._comment_cache: dict[tuple[str, str, int], list[IssueComment]] = {}
-        self.api_call_counts: dict[str, int] = {"http_get": 0, "http_post": 0, "issues_list": 0, "issue_get": 0, "issue_comments_list": 0, "issue_comment_create": 0}
+        # In-run coalescing: issues seen by any listing/fetch (without comments), recently completed
+        # single-resource GETs, and the futures of requests currently in flight.
+        self._issue_cache: dict[tuple[str, str, int], Issue] = {}
+        self._responses: OrderedDict[tuple[Any, ...], Any] = OrderedDict()
+        self._in_flight: dict[tuple[Any, ...], Future[Any]] = {}
+        # (updated_at, comment count) of the issue each cached thread was loaded for.
+        self._comment_signatures: dict[tuple[str, str, int], tuple[datetime | None, int | None]] = {}
+        self.api_call_counts: dict[str, int] = {"http_get": 0, "http_post": 0, "issues_list": 0, "issue_get": 0, "issue_comments_list": 0, "issue_comment_create": 0, "http_not_modified": 0, "http_retry": 0, "graphql_query": 0, "comment_fetch_skipped_empty": 0, "comment_fetch_reused": 0, "http_coalesced": 0, "issue_reused": 0, "pulls_list": 0, "commits_list": 0}
         self.session.headers.update(
             {
                 "Accept": "application/vnd.github+json",
@@ -41,7 +129,27 @@ class GitHubClient:
         )
 
     def get_issue(self, repo: GitHubRepoRef, number: int, *, include_comments: bool = True) -> Issue:
-        self.api_call_counts["issue_get"] = int(self.api_call_counts.get("issue_get", 0)) + 1
+        """Fetch one issue; an issue already listed or fetched in this run is reused without a request."""
+        self._count("issue_get")
+        key = (repo.owner, repo.name, int(number))
+        with self._lock:
+            cached = self._issue_cache.get(key)
+        if cached is not None:
+            self._count("issue_reused")
+            return self.complete_issue(repo, cached, include_comments=include_comments)
+        return self._single_flight(
+            ("issue", *key, include_comments),
+            lambda: self._fetch_issue(repo, int(number), include_comments=include_comments),
+        )
+
+    def _fetch_issue(self, repo: GitHubRepoRef, number: int, *, include_comments: bool) -> Issue:
+        if self.transport == "graphql":
+            issue = self._get_issue_graphql(repo, number, include_comments=include_comments)
+            # Pull requests are not Issue nodes in GraphQL; REST still serves them.
+            if issue is not None:
+                self._remember_issues(repo, [issue])
+                return issue
+
         resp = self._get(
             f"{self.base_url}/repos/{repo.owner}/{repo.name}/issues/{number}",
             timeout=30,
@@ -52,22 +160,20 @@ class GitHubClient:
             raise TypeError("GitHub issue response must be a JSON object")
 
         issue = self._parse_issue(raw)
-        raw_comments: list[IssueComment] = []
+        self._remember_issues(repo, [issue])
         if include_comments:
-            raw_comments = self.list_issue_comments(repo, issue.number)
-        return Issue(
-            number=issue.number,
-            title=issue.title,
-            body=issue.body,
-            author=issue.author,
-            labels=issue.labels,
-            state=issue.state,
-            created_at=issue.created_at,
-            updated_at=issue.updated_at,
-            closed_at=issue.closed_at,
-            comments=tuple(raw_comments),
-            raw=issue.raw,
-        )
+            issue = _with_comments(issue, self._planned_comments(repo, issue))
+        return issue
+
+    def complete_issue(self, repo: GitHubRepoRef, issue: Issue, *, include_comments: bool = True) -> Issue:
+        """Fill in what an already-parsed issue payload (e.g. a webhook event's) lacks, calling the API only if needed.
+
+        Webhook issue objects carry everything but the comment thread; threads reported as empty
+        are not requested at all.
+        """
+        if not include_comments or issue.comments:
+            return issue
+        return _with_comments(issue, self._planned_comments(repo, issue))
 
     def list_issues(
         self,
@@ -77,73 +183,474 @@ class GitHubClient:
         limit: int = 200,
         include_pull_requests: bool = False,
         include_comments: bool = True,
+        since: datetime | None = None,
+        sort: str = "created",
+        direction: str = "desc",
+        comments_strategy: str = "per-issue",
+        pull_request_filter: str = "client",
+        partition_by: str | None = None,
     ) -> list[Issue]:
-        self.api_call_counts["issues_list"] = int(self.api_call_counts.get("issues_list", 0)) + 1
-        issues: list[Issue] = []
+        """List issues; ``since`` limits the listing to issues updated at or after that instant.
+
+        ``comments_strategy="bulk"`` loads comments from the repo-wide comments endpoint instead of
+        one request per issue (REST transport only; GraphQL already inlines comments).
 
-        for raw in self._paginate(
-            f"{self.base_url}/repos/{repo.owner}/{repo.name}/issues",
-            params={"state": state, "per_page": 100},
-            limit=limit,
+        ``pull_request_filter="server"`` excludes pull requests on the server (search ``is:issue``,
+        or the GraphQL issues connection past the search result cap), so every listed item counts
+        toward ``limit``. With ``"client"`` they are listed by ``/issues`` and dropped locally.
+
+        ``partition_by="created"|"updated"`` fetches the corpus as concurrent search queries over
+        date windows small enough to stay under the search result cap. Issues come back ordered by
+        that field (newest first unless ``direction="asc"``) and only the windows and pages holding
+        the first ``limit`` of them are requested. ``sort`` does not apply: the order is always by
+        the partition field. ``since`` still filters on the update time.
+        """
+        if partition_by is not None and partition_by not in PARTITION_FIELDS:
+            raise ValueError(f"partition_by must be one of: {', '.join(PARTITION_FIELDS)}")
+        if comments_strategy not in COMMENTS_STRATEGIES:
+            raise ValueError(f"comments_strategy must be one of: {', '.join(COMMENTS_STRATEGIES)}")
+        if pull_request_filter not in PULL_REQUEST_FILTERS:
+            raise ValueError(f"pull_request_filter must be one of: {', '.join(PULL_REQUEST_FILTERS)}")
+        self._count("issues_list")
+        server_filter = pull_request_filter == "server" and not include_pull_requests
+        if partition_by is None and (
+            (self.transport == "graphql" and not include_pull_requests) or (server_filter and limit > SEARCH_RESULT_CAP)
         ):
+            listed = self._list_issues_graphql(
+                repo,
+                state=state,
+                limit=limit,
+                include_comments=include_comments,
+                since=since,
+                sort=sort,
+                direction=direction,
+            )
+            self._remember_issues(repo, listed)
+            return listed
+
+        def parse(raw: Any) -> Issue | None:
             if not include_pull_requests and isinstance(raw, dict) and "pull_request" in raw:
-                continue
-            issues.append(self._parse_issue(raw))
+                return None
+            return self._parse_issue(raw)
 
-        if include_comments:
-            for i, issue in enumerate(issues):
-                raw_comments = self.list_issue_comments(repo, issue.number)
-                issues[i] = Issue(
-                    number=issue.number,
-                    title=issue.title,
-                    body=issue.body,
-                    author=issue.author,
-                    labels=issue.labels,
-                    state=issue.state,
-                    created_at=issue.created_at,
-                    updated_at=issue.updated_at,
-                    closed_at=issue.closed_at,
-                    comments=tuple(raw_comments),
-                    raw=issue.raw,
+        if partition_by is not None:
+            issues = self._list_issues_partitioned(
+                repo,
+                field=partition_by,
+                state=state,
+                since=since,
+                include_pull_requests=include_pull_requests,
+                limit=limit,
+                direction=direction,
+                parse=parse,
+            )
+        elif server_filter:
+            issues = list(
+                self._paginate(
+                    f"{self.base_url}/search/issues",
+                    params=_search_params(repo, state=state, since=since, sort=sort, direction=direction),
+                    limit=limit,
+                    parallel=True,
+                    transform=parse,
+                    items_key="items",
                 )
+            )
+        else:
+            params: dict[str, Any] = {"state": state, "per_page": 100}
+            # Only send non-default ordering so existing request URLs (and their cache entries) stay stable.
+            if sort != "created" or direction != "desc":
+                params["sort"] = sort
+                params["direction"] = direction
+            if since is not None:
+                params["since"] = _iso_z(since)
+            issues = list(
+                self._paginate(
+                    f"{self.base_url}/repos/{repo.owner}/{repo.name}/issues",
+                    params=params,
+                    limit=limit,
+                    parallel=True,
+                    transform=parse,
+                )
+            )
+
+        self._remember_issues(repo, issues)
+
+        if include_comments and comments_strategy == "bulk":
+            pending = [i for i in issues if self._comment_fetch_needed(repo, i)]
+            if pending:
+                self._prime_comments_from_repo_stream(repo, pending)
+
+        if include_comments:
+            # Comment threads are independent, so fetch them on the worker pool; map() keeps issue order.
+            fetched = self._map_concurrent(lambda issue: self._planned_comments(repo, issue), issues)
+            issues = [_with_comments(issue, comments) for issue, comments in zip(issues, fetched)]
 
         return issues
 
+    def _list_issues_partitioned(
+        self,
+        repo: GitHubRepoRef,
+        *,
+        field: str,
+        state: str,
+        since: datetime | None,
+        include_pull_requests: bool,
+        limit: int,
+        direction: str,
+        parse: Callable[[Any], Issue | None],
+    ) -> list[Issue]:
+        """Search the repo window by window over ``field`` (created/updated), splitting any window
+        whose ``total_count`` exceeds the search cap, and fetch the windows' pages concurrently.
+
+        Windows are walked in ``direction`` order and each window's ``total_count`` is known from
+        its first page, so windows (and pages) past the first ``limit`` issues are never requested.
+        """
+        if limit <= 0:
+            return []
+        url = f"{self.base_url}/search/issues"
+        terms = [f"repo:{repo.owner}/{repo.name}"]
+        if not include_pull_requests:
+            terms.append("is:issue")
+        if state in ("open", "closed"):
+            terms.append(f"state:{state}")
+        if since is not None and field == "created":
+            # The windows bound the creation time; `since` is about updates, so filter on it separately.
+            terms.append(f"updated:>={_iso_z(since)}")
+        per_page = 100
+        order = "asc" if direction == "asc" else "desc"
+
+        def window_params(window: tuple[int, int]) -> dict[str, Any]:
+            lo, hi = (_iso_z(datetime.fromtimestamp(t, tz=timezone.utc)) for t in window)
+            return {"q": " ".join([*terms, f"{field}:{lo}..{hi}"]), "sort": field, "order": order, "per_page": per_page}
+
+        def first_page(window: tuple[int, int]) -> tuple[tuple[int, int], int, list[Any]]:
+            resp = self._get(url, params={**window_params(window), "page": 1}, timeout=30)
+            resp.raise_for_status()
+            data = resp.json()
+            items = data.get("items") if isinstance(data, dict) else None
+            return window, int(data.get("total_count") or 0), items if isinstance(items, list) else []
+
+        lower = int(since.timestamp()) if since is not None and field == "updated" else self._repo_created_epoch(repo)
+        pending = [(lower, int(time.time()) + 1)]
+        windows: dict[tuple[int, int], tuple[int, list[Any]]] = {}
+        # Breadth-first: probe every open window at once, then split the ones that are too large,
+        # dropping whatever lies behind the first ``limit`` issues.
+        while pending:
+            for window, total, items in self._map_concurrent(first_page, pending):
+                windows[window] = (total, items)
+            pending = []
+            kept: dict[tuple[int, int], tuple[int, list[Any]]] = {}
+            reached = 0
+            for window in sorted(windows, reverse=order == "desc"):
+                if reached >= limit:
+                    break
+                total, items = windows[window]
+                reached += total
+                lo, hi = window
+                if total > SEARCH_RESULT_CAP and hi > lo:
+                    mid = lo + (hi - lo) // 2
+                    pending += [(lo, mid), (mid + 1, hi)]
+                else:
+                    kept[window] = (total, items)
+            windows = kept
+
+        ordered = sorted(windows, reverse=order == "desc")
+        # A one-second window over the cap cannot be split further.
+        capped = sum(1 for w in ordered if windows[w][0] > SEARCH_RESULT_CAP)
+        with self._lock:
+            self.api_call_counts["search_windows"] = int(self.api_call_counts.get("search_windows", 0)) + len(ordered)
+            if capped:
+                self.api_call_counts["search_window_capped"] = int(self.api_call_counts.get("search_window_capped", 0)) + capped
+        rest: list[tuple[tuple[int, int], int]] = []
+        wanted = limit
+        for window in ordered:
+            take = min(windows[window][0], SEARCH_RESULT_CAP, wanted)
+            wanted -= take
+            rest += [(window, page) for page in range(2, -(-take // per_page) + 1)]
+        fetched: dict[tuple[int, int], list[list[Any]]] = {}
+        pages = self._map_concurrent(lambda t: self._fetch_page(url, window_params(t[0]), t[1], parse, "items"), rest)
+        for (window, _), page in zip(rest, pages):
+            fetched.setdefault(window, []).append(page)
+
+        # Adjacent windows never overlap, but an issue updated mid-run can show up in two of them.
+        issues: list[Issue] = []
+        seen: set[int] = set()
+        for window in ordered:
+            first = [parse(raw) for raw in windows[window][1]]
+            for page in [first, *fetched.get(window, [])]:
+                for item in page:
+                    if item is None or item.number in seen:
+                        continue
+                    seen.add(item.number)
+                    issues.append(item)
+                    if len(issues) >= limit:
+                        return issues
+        return issues
+
+    def _repo_created_epoch(self, repo: GitHubRepoRef) -> int:
+        resp = self._get(f"{self.base_url}/repos/{repo.owner}/{repo.name}", timeout=30)
+        resp.raise_for_status()
+        created = _opt_dt(resp.json().get("created_at"))
+        # GitHub itself launched in 2008; nothing can have been created before that.
+        return int(created.timestamp()) if created is not None else int(datetime(2008, 1, 1, tzinfo=timezone.utc).timestamp())
+
+    def list_pull_requests(
+        self,
+        repo: GitHubRepoRef,
+        *,
+        state: str = "all",
+        limit: int = 200,
+        include_comments: bool = True,
+    ) -> list[PullRequest]:
+        """List pull requests (newest first); conversation comments come from the shared issue-comment path."""
+        self._count("pulls_list")
+        prs: list[PullRequest] = list(
+            self._paginate(
+                f"{self.base_url}/repos/{repo.owner}/{repo.name}/pulls",
+                params={"state": state, "per_page": 100},
+                limit=limit,
+                parallel=True,
+                transform=lambda raw: (
+                    parse_pull_request_payload(raw, interner=self.interner, raw_retention=self.raw_retention)
+                    if isinstance(raw, dict)
+                    else None
+                ),
+            )
+        )
+        if include_comments:
+            fetched = self._map_concurrent(lambda pr: self.list_issue_comments(repo, pr.number), prs)
+            prs = [_pr_with_comments(pr, comments) for pr, comments in zip(prs, fetched)]
+        return prs
+
+    def list_commits(self, repo: GitHubRepoRef, *, limit: int = 200, ref: str | None = None) -> list[Commit]:
+        """List commits reachable from ``ref`` (default branch when None), newest first."""
+        self._count("commits_list")
+        params: dict[str, Any] = {"per_page": 100}
+        if ref:
+            params["sha"] = ref
+        return list(
+            self._paginate(
+                f"{self.base_url}/repos/{repo.owner}/{repo.name}/commits",
+                params=params,
+                limit=limit,
+                parallel=True,
+                transform=lambda raw: parse_commit_payload(raw, raw_retention=self.raw_retention) if isinstance(raw, dict) else None,
+            )
+        )
+
+    def list_repo_comments(self, repo: GitHubRepoRef, *, since: datetime | None = None) -> dict[int, list[IssueComment]]:
+        """Stream every issue/PR comment in the repo (optionally updated since ``since``), bucketed by issue number."""
+        self._count("repo_comments_list")
+        params: dict[str, Any] = {"sort": "created", "direction": "asc", "per_page": 100}
+        if since is not None:
+            params["since"] = _iso_z(since)
+
+        def parse(raw: Any) -> tuple[int, IssueComment] | None:
+            if not isinstance(raw, dict):
+                return None
+            number = _issue_number_from_url(raw.get("issue_url"))
+            return (number, self._parse_comment(raw)) if number is not None else None
+
+        buckets: dict[int, list[IssueComment]] = {}
+        for number, comment in self._paginate(
+            f"{self.base_url}/repos/{repo.owner}/{repo.name}/issues/comments",
+            params=params,
+            limit=_UNBOUNDED,
+            parallel=True,
+            transform=parse,
+        ):
+            buckets.setdefault(number, []).append(comment)
+        return buckets
+
+    def _prime_comments_from_repo_stream(self, repo: GitHubRepoRef, issues: list[Issue]) -> None:
+        # A comment is never older than its issue, so the oldest listed issue bounds the stream.
+        created = [i.created_at for i in issues if i.created_at is not None]
+        since = min(created) if len(created) == len(issues) else None
+        buckets = self.list_repo_comments(repo, since=since)
+        with self._lock:
+            for issue in issues:
+                comments = buckets.get(issue.number, [])
+                comments.sort(key=lambda c: (c.created_at is None, c.created_at or datetime.min.replace(tzinfo=timezone.utc), c.id))
+                key = (repo.owner, repo.name, issue.number)
+                self._comment_cache[key] = comments
+                self._comment_signatures[key] = _comment_signature(issue)
+
+    def fetch_comments(self, repo: GitHubRepoRef, numbers: list[int]) -> dict[int, list[IssueComment]]:
+        """Fetch comment threads for many issues on the worker pool."""
+        fetched = self._map_concurrent(lambda n: self.list_issue_comments(repo, n), list(numbers))
+        return {int(n): comments for n, comments in zip(numbers, fetched)}
+
     def list_issue_comments(self, repo: GitHubRepoRef, number: int) -> list[IssueComment]:
         key = (repo.owner, repo.name, int(number))
-        cached = self._comment_cache.get(key)
+        with self._lock:
+            cached = self._comment_cache.get(key)
         if cached is not None:
             return list(cached)
+        return self._fetch_issue_comments(repo, int(number))
 
-        self.api_call_counts["issue_comments_list"] = int(self.api_call_counts.get("issue_comments_list", 0)) + 1
-        comments: list[IssueComment] = []
-        for raw in self._paginate(
-            f"{self.base_url}/repos/{repo.owner}/{repo.name}/issues/{number}/comments",
-            params={"per_page": 100},
-            limit=10_000,
-        ):
-            if not isinstance(raw, dict):
-                continue
-            user = raw.get("user") or None
-            author = None
-            if isinstance(user, dict):
-                author = IssueAuthor(login=str(user.get("login") or ""), id=_opt_int(user.get("id")))
-
-            comments.append(
-                IssueComment(
-                    id=int(raw.get("id")),
-                    author=author,
-                    body=str(raw.get("body") or ""),
-                    created_at=_opt_dt(raw.get("created_at")),
-                    updated_at=_opt_dt(raw.get("updated_at")),
-                )
+    def _comment_fetch_needed(self, repo: GitHubRepoRef, issue: Issue) -> bool:
+        signature = _comment_signature(issue)
+        if signature[1] == 0:
+            return False
+        key = (repo.owner, repo.name, issue.number)
+        with self._lock:
+            return not (key in self._comment_cache and self._comment_signatures.get(key) == signature)
+
+    def _planned_comments(self, repo: GitHubRepoRef, issue: Issue) -> list[IssueComment]:
+        """Comment thread of a listed/fetched issue, requested only when the issue payload says it may differ.
+
+        The payload's ``comments`` count and ``updated_at`` decide: a count of 0 needs no request, and a
+        cached thread loaded for the same (updated_at, count) is reused as is.
+        """
+        signature = _comment_signature(issue)
+        key = (repo.owner, repo.name, issue.number)
+        if signature[1] == 0:
+            self._count("comment_fetch_skipped_empty")
+            with self._lock:
+                self._comment_cache[key] = []
+                self._comment_signatures[key] = signature
+            return []
+        if not self._comment_fetch_needed(repo, issue):
+            self._count("comment_fetch_reused")
+            with self._lock:
+                return list(self._comment_cache[key])
+        return self._fetch_issue_comments(repo, issue.number, signature=signature)
+
+    def _fetch_issue_comments(
+        self,
+        repo: GitHubRepoRef,
+        number: int,
+        *,
+        signature: tuple[datetime | None, int | None] = (None, None),
+    ) -> list[IssueComment]:
+        key = (repo.owner, repo.name, int(number))
+        # Concurrent requests for the same thread (e.g. list + get on two workers) share one fetch.
+        return list(self._single_flight(("comments", *key), lambda: self._load_issue_comments(repo, key, signature)))
+
+    def _load_issue_comments(
+        self,
+        repo: GitHubRepoRef,
+        key: tuple[str, str, int],
+        signature: tuple[datetime | None, int | None],
+    ) -> list[IssueComment]:
+        number = key[2]
+        self._count("issue_comments_list")
+        comments: list[IssueComment] = list(
+            self._paginate(
+                f"{self.base_url}/repos/{repo.owner}/{repo.name}/issues/{number}/comments",
+                params={"per_page": 100},
+                limit=10_000,
+                transform=lambda raw: self._parse_comment(raw) if isinstance(raw, dict) else None,
             )
+        )
 
-        self._comment_cache[key] = list(comments)
+        with self._lock:
+            self._comment_cache[key] = list(comments)
+            self._comment_signatures[key] = signature
         return comments
 
+    def _list_issues_graphql(
+        self,
+        repo: GitHubRepoRef,
+        *,
+        state: str,
+        limit: int,
+        include_comments: bool,
+        since: datetime | None = None,
+        sort: str = "created",
+        direction: str = "desc",
+    ) -> list[Issue]:
+        order_field, order_direction = gql.graphql_order(sort, direction)
+        issues: list[Issue] = []
+        overflow: list[int] = []
+        after: str | None = None
+
+        while len(issues) < limit:
+            data = self._graphql(
+                gql.LIST_ISSUES_QUERY,
+                {
+                    "owner": repo.owner,
+                    "name": repo.name,
+                    "first": min(gql.ISSUES_PER_PAGE, limit - len(issues)),
+                    "after": after,
+                    "states": gql.graphql_states(state),
+                    "commentsFirst": gql.COMMENTS_PER_ISSUE if include_comments else 0,
+                    "since": _iso_z(since) if since is not None else None,
+                    "orderField": order_field,
+                    "orderDirection": order_direction,
+                },
+            )
+            conn = ((data.get("repository") or {}).get("issues")) or {}
+            for node in conn.get("nodes") or []:
+                if not isinstance(node, dict):
+                    continue
+                issue, complete = self._issue_from_graphql(repo, node, include_comments=include_comments)
+                issues.append(issue)
+                if include_comments and not complete:
+                    overflow.append(len(issues) - 1)
+
+            page_info = conn.get("pageInfo") or {}
+            after = page_info.get("endCursor")
+            if not page_info.get("hasNextPage") or not after:
+                break
+
+        # Only threads longer than one inline page need REST pagination.
+        fetched = self._map_concurrent(lambda i: self.list_issue_comments(repo, issues[i].number), overflow)
+        for i, comments in zip(overflow, fetched):
+            issues[i] = _with_comments(issues[i], comments)
+        return issues
+
+    def _get_issue_graphql(self, repo: GitHubRepoRef, number: int, *, include_comments: bool) -> Issue | None:
+        data = self._graphql(
+            gql.GET_ISSUE_QUERY,
+            {
+                "owner": repo.owner,
+                "name": repo.name,
+                "number": int(number),
+                "commentsFirst": gql.COMMENTS_PER_ISSUE if include_comments else 0,
+            },
+            allow_partial=True,
+        )
+        node = (data.get("repository") or {}).get("issue")
+        if not isinstance(node, dict):
+            return None
+        issue, complete = self._issue_from_graphql(repo, node, include_comments=include_comments)
+        if include_comments and not complete:
+            issue = _with_comments(issue, self.list_issue_comments(repo, issue.number))
+        return issue
+
+    def _issue_from_graphql(self, repo: GitHubRepoRef, node: dict[str, Any], *, include_comments: bool) -> tuple[Issue, bool]:
+        issue = self._parse_issue(gql.issue_node_to_rest(node))
+        if not include_comments:
+            return issue, True
+        if gql.comments_overflow(node):
+            return issue, False
+        comments = [self._parse_comment(c) for c in gql.comment_nodes_to_rest(node)]
+        key = (repo.owner, repo.name, issue.number)
+        with self._lock:
+            self._comment_cache[key] = list(comments)
+            self._comment_signatures[key] = _comment_signature(issue)
+        return _with_comments(issue, comments), True
+
+    def _graphql(self, query: str, variables: dict[str, Any], *, allow_partial: bool = False) -> dict[str, Any]:
+        self._count("graphql_query")
+        # Queries are reads, so they are as safe to retry as a GET.
+        resp = self._post(self.graphql_url, json={"query": query, "variables": variables}, timeout=60, idempotent=True)
+        resp.raise_for_status()
+        payload = resp.json()
+        if not isinstance(payload, dict):
+            raise GitHubGraphQLError("GitHub GraphQL response must be a JSON object")
+        errors = payload.get("errors")
+        data = payload.get("data")
+        if errors and not (allow_partial and isinstance(data, dict)):
+            messages = "; ".join(str(e.get("message") or e) if isinstance(e, dict) else str(e) for e in errors)
+            raise GitHubGraphQLError(f"GitHub GraphQL error: {messages}")
+        if not isinstance(data, dict):
+            raise GitHubGraphQLError("GitHub GraphQL response has no data")
+        return data
+
     def create_issue_comment(self, repo: GitHubRepoRef, number: int, *, body: str) -> None:
-        self.api_call_counts["issue_comment_create"] = int(self.api_call_counts.get("issue_comment_create", 0)) + 1
+        self._count("issue_comment_create")
         payload = {"body": body}
         resp = self._post(
             f"{self.base_url}/repos/{repo.owner}/{repo.name}/issues/{number}/comments",
@@ -152,65 +659,436 @@ class GitHubClient:
         )
         resp.raise_for_status()
 
-    def _get(self, url: str, **kwargs: Any):
-        self.api_call_counts["http_get"] = int(self.api_call_counts.get("http_get", 0)) + 1
-        return self.session.get(url, **kwargs)
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.api_call_counts[key] = int(self.api_call_counts.get(key, 0)) + 1
+
+    def _map_concurrent(self, fn: Callable[[_T], _R], items: list[_T]) -> list[_R]:
+        return list(self._imap_concurrent(fn, items))
+
+    def _imap_concurrent(self, fn: Callable[[_T], _R], items: list[_T]) -> Iterator[_R]:
+        """Lazily yield fn(item) in input order, keeping a bounded window of calls in flight.
+
+        Closing the iterator early cancels whatever has not started yet.
+        """
+        if self.http_concurrency <= 1 or len(items) <= 1:
+            for item in items:
+                yield fn(item)
+            return
+
+        workers = min(self.http_concurrency, len(items))
+        window = workers * 2
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="issue-assistant-http")
+        try:
+            pending: deque[Future[_R]] = deque()
+            it = iter(items)
+            for item in it:
+                pending.append(pool.submit(fn, item))
+                if len(pending) >= window:
+                    break
+            while pending:
+                result = pending.popleft().result()
+                nxt = next(it, _SENTINEL)
+                if nxt is not _SENTINEL:
+                    pending.append(pool.submit(fn, nxt))
+                yield result
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def forget_repo(self, repo: GitHubRepoRef) -> None:
+        """Drop the issues, comment threads and responses cached for ``repo``.
+
+        A client shared across repositories (``analyze-many``) calls this once a repo is done, so
+        memory tracks the repos in progress rather than the whole batch.
+        """
+        owner_name = (repo.owner, repo.name)
+        prefix = f"{self.base_url}/repos/{repo.owner}/{repo.name}"
+        with self._lock:
+            for cache in (self._issue_cache, self._comment_cache, self._comment_signatures):
+                for key in [k for k in cache if k[:2] == owner_name]:
+                    del cache[key]
+            for key in [k for k in self._responses if k[1] == prefix or k[1].startswith(prefix + "/")]:
+                del self._responses[key]
+
+    def _remember_issues(self, repo: GitHubRepoRef, issues: Iterable[Issue]) -> None:
+        with self._lock:
+            for issue in issues:
+                self._issue_cache[(repo.owner, repo.name, issue.number)] = _with_comments(issue, []) if issue.comments else issue
+
+    def _single_flight(self, key: tuple[Any, ...], fn: Callable[[], _R]) -> _R:
+        """Run ``fn`` once for concurrent callers with the same ``key``; the others wait for its result."""
+        with self._lock:
+            fut = self._in_flight.get(key)
+            leader = fut is None
+            if fut is None:
+                fut = self._in_flight[key] = Future()
+        if not leader:
+            self._count("http_coalesced")
+            return fut.result()
+        try:
+            result = fn()
+        except BaseException as e:
+            fut.set_exception(e)
+            raise
+        else:
+            fut.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def _get(self, url: str, *, params: dict[str, Any] | None = None, **kwargs: Any):
+        """GET ``url``; concurrent identical plain (non-streamed) GETs share one request.
+
+        Completed responses are reused only for single-resource GETs (no query parameters, such
+        as an issue or the repository), and only for the most recent ``_RESPONSE_MEMO_SIZE`` of
+        them. Listing and search pages are never kept. Streamed responses can only be read once,
+        so they are not shared at all.
+        """
+        if kwargs.get("stream"):
+            return self._get_uncoalesced(url, params=params, **kwargs)
+
+        key = ("GET", url, _items_key(params), _items_key(kwargs.get("headers")))
+        memoize = not params
+        if memoize:
+            with self._lock:
+                memo = self._responses.get(key)
+                if memo is not None:
+                    self._responses.move_to_end(key)
+            if memo is not None:
+                self._count("http_coalesced")
+                return memo
+        resp = self._single_flight(key, lambda: self._get_uncoalesced(url, params=params, **kwargs))
+        if memoize and resp.status_code == 200:
+            with self._lock:
+                self._responses[key] = resp
+                self._responses.move_to_end(key)
+                while len(self._responses) > _RESPONSE_MEMO_SIZE:
+                    self._responses.popitem(last=False)
+        return resp
+
+    def _get_uncoalesced(self, url: str, *, params: dict[str, Any] | None = None, **kwargs: Any):
+        self._count("http_get")
+        if self.http_cache is None:
+            return self._send("get", url, params=params, **kwargs)
+
+        entry = self.http_cache.lookup(url, params)
+        headers = dict(kwargs.pop("headers", None) or {})
+        if entry is not None:
+            headers.update(entry.validators())
+            self.metrics.record_conditional()
+        resp = self._send("get", url, params=params, headers=headers or None, **kwargs)
+
+        if resp.status_code == 304 and entry is not None:
+            # 304s carry no body and do not count against the primary rate limit.
+            self._count("http_not_modified")
+            self.metrics.record_cache_hit()
+            return self.http_cache.replay(entry, resp.headers)
+        if resp.status_code == 200:
+            if kwargs.get("stream"):
+                return self.http_cache.tee(url, params, resp)
+            self.http_cache.store(url, params, headers=resp.headers, body=resp.content)
+        return resp
+
+    def _post(self, url: str, *, idempotent: bool = False, **kwargs: Any):
+        self._count("http_post")
+        return self._send("post", url, idempotent=idempotent, **kwargs)
+
+    def _send(self, method: str, url: str, *, idempotent: bool = True, **kwargs: Any):
+        """Issue one logical request through the scheduler, retrying transient failures.
+
+        Non-idempotent requests are only retried when GitHub rejected them before processing
+        (rate limits); 5xx and transport errors are surfaced to the caller as-is.
+        """
+        import requests
+
+        resource = rate_limit_resource(url)
+        endpoint = endpoint_template(method, url)
+        key = fairness_key(url, kwargs.get("params"))
+        attempt = 0
+        while True:
+            with self.scheduler.slot(key):
+                pace = self.scheduler.pacing_delay(resource)
+                if pace > 0:
+                    self._sleep(pace)
+                # Latency is time to response headers; streamed bodies are metered as they are read.
+                started = time.perf_counter()
+                try:
+                    resp = getattr(self.session, method)(url, **kwargs)
+                except (requests.ConnectionError, requests.Timeout):
+                    self.metrics.record_response(endpoint, status=None, seconds=time.perf_counter() - started)
+                    delay = self.scheduler.retry_delay(attempt=attempt) if idempotent else None
+                    if delay is None:
+                        raise
+                else:
+                    status = int(resp.status_code)
+                    self.metrics.record_response(endpoint, status=status, seconds=time.perf_counter() - started, headers=resp.headers)
+                    body = resp.text if status in (403, 429) else ""
+                    self.scheduler.observe(status, resp.headers, body)
+                    delay = self.scheduler.retry_delay(attempt=attempt, status=status, headers=resp.headers, body=body)
+                    if delay is None or (not idempotent and status not in (403, 429)):
+                        if not kwargs.get("stream"):
+                            self.metrics.add_bytes(endpoint, len(resp.content or b""))
+                        return resp
+                    resp.close()
+
+            self._count("http_retry")
+            self.metrics.record_retry(endpoint)
+            self._sleep(delay)
+            attempt += 1
+
+    def _paginate(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any],
+        limit: int,
+        parallel: bool = False,
+        transform: Callable[[Any], Any] | None = None,
+        items_key: str | None = None,
+    ) -> Iterable[Any]:
+        """Yield list items page by page, in page order, until ``limit`` items were produced.
 
-    def _post(self, url: str, **kwargs: Any):
-        self.api_call_counts["http_post"] = int(self.api_call_counts.get("http_post", 0)) + 1
-        return self.session.post(url, **kwargs)
+        Pages are decoded incrementally from the response stream and each item goes through
+        ``transform`` as soon as it is decoded; items it maps to None still count toward ``limit``.
+        The page on which ``limit`` is reached is still read to its end.
+        ``items_key`` names the list member of object-shaped pages (search results).
 
-    def _paginate(self, url: str, *, params: dict[str, Any], limit: int) -> Iterable[Any]:
+        With ``parallel=True`` the ``Link: rel="last"`` header of the first page is used to fetch the
+        remaining pages (up to what ``limit`` needs) concurrently. Only top-level listings use it:
+        comment threads are paginated from inside worker threads and must not fan out again.
+        """
+        per_page = max(1, int(params.get("per_page") or 30))
         page = 1
         remaining = limit
 
         while remaining > 0:
-            p = dict(params)
-            p["page"] = page
-            resp = self._get(url, params=p, timeout=30)
-            resp.raise_for_status()
-            data = resp.json()
-
-            if not isinstance(data, list) or not data:
+            count = 0
+            with self._open_page(url, params, page, items_key) as (last_page, raws):
+                for raw in raws:
+                    if remaining <= 0:
+                        # Limit reached mid-page: still read the page to its end, or the HTTP cache
+                        # and the checkpoint (which commit complete pages only) never see it.
+                        continue
+                    count += 1
+                    item = transform(raw) if transform is not None else raw
+                    if item is not None:
+                        yield item
+                    remaining -= 1
+            if remaining <= 0 or count < per_page:
                 return
+            page += 1
 
-            for item in data:
-                yield item
-                remaining -= 1
-                if remaining <= 0:
-                    return
+            if parallel and last_page is not None and last_page >= page:
+                wanted = min(last_page, page - 1 + -(-remaining // per_page))
+                pages = list(range(page, wanted + 1))
+                for items in self._imap_concurrent(lambda n: self._fetch_page(url, params, n, transform, items_key), pages):
+                    for item in items:
+                        if item is not None:
+                            yield item
+                        remaining -= 1
+                        if remaining <= 0:
+                            return
+                    if len(items) < per_page:
+                        return
+                # Items added while we were fetching can push the listing past the advertised last page.
+                page = wanted + 1
+                parallel = False
 
-            page += 1
+    def _get_page(self, url: str, params: dict[str, Any], page: int):
+        p = dict(params)
+        p["page"] = page
+        resp = self._get(url, params=p, timeout=30, stream=True)
+        if resp.status_code >= 400:
+            resp.close()
+        resp.raise_for_status()
+        return resp
+
+    def _iter_body(self, url: str, resp: Any) -> Iterator[bytes]:
+        chunks = resp.iter_content(_STREAM_CHUNK_BYTES)
+        if getattr(resp, "from_cache", False):
+            # Replayed from the HTTP cache: nothing crossed the network.
+            return chunks
+        return self.metrics.count_bytes(endpoint_template("get", url), chunks)
+
+    def _fetch_page(
+        self,
+        url: str,
+        params: dict[str, Any],
+        page: int,
+        transform: Callable[[Any], Any] | None,
+        items_key: str | None = None,
+    ) -> list[Any]:
+        with self._open_page(url, params, page, items_key) as (_, raws):
+            return [transform(raw) if transform is not None else raw for raw in raws]
+
+    @contextmanager
+    def _open_page(
+        self, url: str, params: dict[str, Any], page: int, items_key: str | None
+    ) -> Iterator[tuple[int | None, Iterator[Any]]]:
+        """``(last page from Link, raw items)`` of one page, from the checkpoint when it has it."""
+        if self.checkpoint is not None:
+            saved = self.checkpoint.page(url, params, page, items_key)
+            if saved is not None:
+                self._count("checkpoint_page_reused")
+                yield saved.last_page, iter(saved.items)
+                return
+        resp = self._get_page(url, params, page)
+        try:
+            last_page = _last_page(resp.headers.get("Link"))
+            raws = iter_json_array(self._iter_body(url, resp), key=items_key)
+            if self.checkpoint is not None:
+                raws = self.checkpoint.recording(url, params, page, items_key, items=raws, last_page=last_page)
+            yield last_page, raws
+        finally:
+            resp.close()
+
+    def _parse_comment(self, raw: dict[str, Any]) -> IssueComment:
+        return parse_comment_payload(raw, interner=self.interner)
 
     def _parse_issue(self, raw: dict[str, Any]) -> Issue:
-        number = int(raw.get("number"))
-        title = str(raw.get("title") or "").strip()
-        body = str(raw.get("body") or "")
-        user = raw.get("user") or None
-        author = None if not isinstance(user, dict) else IssueAuthor(login=str(user.get("login") or ""), id=_opt_int(user.get("id")))
-
-        labels_raw = raw.get("labels") or []
-        labels: list[IssueLabel] = []
-        if isinstance(labels_raw, list):
-            for l in labels_raw:
-                if isinstance(l, str):
-                    labels.append(IssueLabel(name=l))
-                elif isinstance(l, dict):
-                    labels.append(IssueLabel(name=str(l.get("name") or "")))
-
-        return Issue(
-            number=number,
-            title=title,
-            body=body,
-            author=author,
-            labels=tuple(labels),
-            state=str(raw.get("state")) if raw.get("state") is not None else None,
-            created_at=_opt_dt(raw.get("created_at")),
-            updated_at=_opt_dt(raw.get("updated_at")),
-            closed_at=_opt_dt(raw.get("closed_at")),
-            comments=(),
-            raw=raw,
-        )
+        return parse_issue_payload(raw, interner=self.interner, raw_retention=self.raw_retention)
+
+
+def parse_comment_payload(raw: dict[str, Any], *, interner: InternTable | None = None) -> IssueComment:
+    interner = interner if interner is not None else InternTable()
+    return IssueComment(
+        id=int(raw.get("id")),
+        author=interner.user(raw.get("user")),
+        body=str(raw.get("body") or ""),
+        created_at=_opt_dt(raw.get("created_at")),
+        updated_at=_opt_dt(raw.get("updated_at")),
+    )
+
+
+def parse_pull_request_payload(
+    raw: dict[str, Any], *, interner: InternTable | None = None, raw_retention: str = "full"
+) -> PullRequest:
+    interner = interner if interner is not None else InternTable()
+    return PullRequest(
+        number=int(raw.get("number")),
+        title=str(raw.get("title") or "").strip(),
+        body=str(raw.get("body") or ""),
+        author=interner.user(raw.get("user")),
+        state=interner.string(str(raw.get("state"))) if raw.get("state") is not None else None,
+        created_at=_opt_dt(raw.get("created_at")),
+        updated_at=_opt_dt(raw.get("updated_at")),
+        closed_at=_opt_dt(raw.get("closed_at")),
+        merged_at=_opt_dt(raw.get("merged_at")),
+        comments=(),
+        raw=retain_raw(raw, raw_retention),
+    )
+
+
+def parse_commit_payload(raw: dict[str, Any], *, raw_retention: str = "full") -> Commit:
+    commit = raw.get("commit") if isinstance(raw.get("commit"), dict) else {}
+    git_author = commit.get("author") if isinstance(commit.get("author"), dict) else {}
+    user = raw.get("author")
+    # Prefer the GitHub account; fall back to the git author name for unlinked emails.
+    author = str(user.get("login") or "") if isinstance(user, dict) else ""
+    author = author or str(git_author.get("name") or "")
+    return Commit(
+        sha=str(raw.get("sha") or "").strip(),
+        message=str(commit.get("message") or ""),
+        author=author or None,
+        authored_at=_opt_dt(git_author.get("date")),
+        raw=retain_raw(raw, raw_retention),
+    )
+
+
+def parse_issue_payload(raw: dict[str, Any], *, interner: InternTable | None = None, raw_retention: str = "full") -> Issue:
+    interner = interner if interner is not None else InternTable()
+    return Issue(
+        number=int(raw.get("number")),
+        title=str(raw.get("title") or "").strip(),
+        body=str(raw.get("body") or ""),
+        author=interner.user(raw.get("user")),
+        labels=interner.labels(raw.get("labels")),
+        state=interner.string(str(raw.get("state"))) if raw.get("state") is not None else None,
+        created_at=_opt_dt(raw.get("created_at")),
+        updated_at=_opt_dt(raw.get("updated_at")),
+        closed_at=_opt_dt(raw.get("closed_at")),
+        comments=(),
+        raw=retain_raw(raw, raw_retention),
+    )
+
+
+def _comment_signature(issue: Issue) -> tuple[datetime | None, int | None]:
+    # REST issue payloads (and reshaped GraphQL nodes) carry the thread length as ``comments``.
+    return issue.updated_at, _opt_int(issue.raw.get("comments"))
+
+
+def _pr_with_comments(pr: PullRequest, comments: list[IssueComment]) -> PullRequest:
+    return PullRequest(
+        number=pr.number,
+        title=pr.title,
+        body=pr.body,
+        author=pr.author,
+        state=pr.state,
+        created_at=pr.created_at,
+        updated_at=pr.updated_at,
+        closed_at=pr.closed_at,
+        merged_at=pr.merged_at,
+        comments=tuple(comments),
+        raw=pr.raw,
+    )
+
+
+def _with_comments(issue: Issue, comments: list[IssueComment]) -> Issue:
+    return Issue(
+        number=issue.number,
+        title=issue.title,
+        body=issue.body,
+        author=issue.author,
+        labels=issue.labels,
+        state=issue.state,
+        created_at=issue.created_at,
+        updated_at=issue.updated_at,
+        closed_at=issue.closed_at,
+        comments=tuple(comments),
+        raw=issue.raw,
+    )
+
+
+def _issue_number_from_url(url: Any) -> int | None:
+    if not isinstance(url, str):
+        return None
+    m = _ISSUE_URL_NUMBER_RE.search(url.rstrip("/"))
+    return int(m.group(1)) if m else None
+
+
+def _last_page(link_header: str | None) -> int | None:
+    if not link_header:
+        return None
+    m = _LINK_LAST_RE.search(link_header)
+    if m is None:
+        return None
+    p = _PAGE_PARAM_RE.search(m.group(1))
+    return int(p.group(1)) if p else None
+
+
+def _items_key(m: Mapping[str, Any] | None) -> tuple[tuple[str, str], ...]:
+    return tuple(sorted((str(k), str(v)) for k, v in (m or {}).items()))
+
+
+def _search_params(repo: GitHubRepoRef, *, state: str, since: datetime | None, sort: str, direction: str) -> dict[str, Any]:
+    terms = [f"repo:{repo.owner}/{repo.name}", "is:issue"]
+    if state in ("open", "closed"):
+        terms.append(f"state:{state}")
+    if since is not None:
+        terms.append(f"updated:>={_iso_z(since)}")
+    return {
+        "q": " ".join(terms),
+        "sort": "updated" if sort == "updated" else "created",
+        "order": "asc" if direction == "asc" else "desc",
+        "per_page": 100,
+    }
+
+
+def _iso_z(dt: datetime) -> str:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 def _opt_int(v: Any) -> int | None:
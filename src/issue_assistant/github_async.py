@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, AsyncIterator
+
+from .github import GitHubRepoRef, _with_comments, parse_comment_payload, parse_issue_payload
+from .http_metrics import HttpMetrics, endpoint_template
+from .interning import InternTable
+from .models import Issue, IssueComment
+from .retention import DEFAULT_RAW_RETENTION, validate_raw_retention
+from .scheduler import DEFAULT_RETRY_POLICY, RequestScheduler, RetryPolicy, rate_limit_resource
+
+
+class AsyncGitHubClient:
+    """asyncio counterpart of GitHubClient built on httpx (``pip install issue-assistant[async]``).
+
+    Exposes the same surface (``list_issues``, ``get_issue``, ``list_issue_comments``,
+    ``create_issue_comment``) and shares RequestScheduler's pacing and retry policy, but keeps
+    up to ``max_in_flight`` requests outstanding on a single event loop thread.
+    """
+
+    def __init__(
+        self,
+        *,
+        token: str,
+        base_url: str = "https://api.github.com",
+        max_in_flight: int = 64,
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+        http_client: Any = None,
+        raw_retention: str = DEFAULT_RAW_RETENTION,
+    ) -> None:
+        try:
+            import httpx
+        except ImportError as e:  # pragma: no cover - exercised only without the optional extra
+            raise ImportError("AsyncGitHubClient requires httpx; install it with `pip install issue-assistant[async]`") from e
+
+        self.raw_retention = validate_raw_retention(raw_retention)
+        self.base_url = base_url.rstrip("/")
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.client = http_client or httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=self.max_in_flight, max_keepalive_connections=self.max_in_flight),
+            timeout=30.0,
+        )
+        self.client.headers.update(
+            {
+                "Accept": "application/vnd.github+json",
+                "Authorization": f"Bearer {token}",
+                "X-GitHub-Api-Version": "2022-11-28",
+            }
+        )
+        self.scheduler = RequestScheduler(max_concurrency=self.max_in_flight, policy=retry_policy)
+        self._in_flight = asyncio.Semaphore(self.max_in_flight)
+        self.metrics = HttpMetrics()
+        self.interner = InternTable()
+        self._comment_cache: dict[tuple[str, str, int], list[IssueComment]] = {}
+        self.api_call_counts: dict[str, int] = {
+            "http_get": 0,
+            "http_post": 0,
+            "http_retry": 0,
+            "issues_list": 0,
+            "issue_get": 0,
+            "issue_comments_list": 0,
+            "issue_comment_create": 0,
+        }
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncGitHubClient":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.aclose()
+
+    async def get_issue(self, repo: GitHubRepoRef, number: int, *, include_comments: bool = True) -> Issue:
+        self._count("issue_get")
+        resp = await self._send("GET", f"{self.base_url}/repos/{repo.owner}/{repo.name}/issues/{number}")
+        resp.raise_for_status()
+        raw = resp.json()
+        if not isinstance(raw, dict):
+            raise TypeError("GitHub issue response must be a JSON object")
+
+        issue = parse_issue_payload(raw, interner=self.interner, raw_retention=self.raw_retention)
+        if include_comments:
+            issue = _with_comments(issue, await self.list_issue_comments(repo, issue.number))
+        return issue
+
+    async def list_issues(
+        self,
+        repo: GitHubRepoRef,
+        *,
+        state: str = "open",
+        limit: int = 200,
+        include_pull_requests: bool = False,
+        include_comments: bool = True,
+    ) -> list[Issue]:
+        return [
+            issue
+            async for issue in self.iter_issues(
+                repo,
+                state=state,
+                limit=limit,
+                include_pull_requests=include_pull_requests,
+                include_comments=include_comments,
+            )
+        ]
+
+    async def iter_issues(
+        self,
+        repo: GitHubRepoRef,
+        *,
+        state: str = "open",
+        limit: int = 200,
+        include_pull_requests: bool = False,
+        include_comments: bool = True,
+    ) -> AsyncIterator[Issue]:
+        """Yield issues in listing order as soon as each one (and its comments) is available.
+
+        The next listing page is requested while comment threads of the current page download.
+        """
+        self._count("issues_list")
+        url = f"{self.base_url}/repos/{repo.owner}/{repo.name}/issues"
+        per_page = 100
+        params = {"state": state, "per_page": per_page}
+        remaining = limit
+        page = 1
+        next_page: asyncio.Task[list[Any]] | None = asyncio.ensure_future(self._fetch_page(url, params, page))
+        comment_tasks: list[asyncio.Task[list[IssueComment]]] = []
+        try:
+            while next_page is not None and remaining > 0:
+                data = await next_page
+                next_page = None
+                if not data:
+                    return
+                batch = data[:remaining]
+                remaining -= len(batch)
+                if remaining > 0 and len(data) >= per_page:
+                    page += 1
+                    next_page = asyncio.ensure_future(self._fetch_page(url, params, page))
+
+                issues = [
+                    parse_issue_payload(raw, interner=self.interner, raw_retention=self.raw_retention)
+                    for raw in batch
+                    if isinstance(raw, dict) and (include_pull_requests or "pull_request" not in raw)
+                ]
+                if not include_comments:
+                    for issue in issues:
+                        yield issue
+                    continue
+
+                comment_tasks = [asyncio.ensure_future(self.list_issue_comments(repo, i.number)) for i in issues]
+                for issue, task in zip(issues, comment_tasks):
+                    yield _with_comments(issue, await task)
+                comment_tasks = []
+        finally:
+            for t in [next_page, *comment_tasks]:
+                if t is not None and not t.done():
+                    t.cancel()
+
+    async def list_issue_comments(self, repo: GitHubRepoRef, number: int) -> list[IssueComment]:
+        key = (repo.owner, repo.name, int(number))
+        cached = self._comment_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
+        self._count("issue_comments_list")
+        url = f"{self.base_url}/repos/{repo.owner}/{repo.name}/issues/{number}/comments"
+        comments: list[IssueComment] = []
+        page = 1
+        while True:
+            data = await self._fetch_page(url, {"per_page": 100}, page)
+            comments.extend(parse_comment_payload(raw, interner=self.interner) for raw in data if isinstance(raw, dict))
+            if len(data) < 100:
+                break
+            page += 1
+
+        self._comment_cache[key] = list(comments)
+        return comments
+
+    async def create_issue_comment(self, repo: GitHubRepoRef, number: int, *, body: str) -> None:
+        self._count("issue_comment_create")
+        resp = await self._send(
+            "POST",
+            f"{self.base_url}/repos/{repo.owner}/{repo.name}/issues/{number}/comments",
+            json={"body": body},
+            idempotent=False,
+        )
+        resp.raise_for_status()
+
+    async def _fetch_page(self, url: str, params: dict[str, Any], page: int) -> list[Any]:
+        resp = await self._send("GET", url, params={**params, "page": page})
+        resp.raise_for_status()
+        data = resp.json()
+        return data if isinstance(data, list) else []
+
+    async def _send(self, method: str, url: str, *, idempotent: bool = True, **kwargs: Any):
+        import httpx
+
+        self._count("http_get" if method == "GET" else "http_post")
+        resource = rate_limit_resource(url)
+        endpoint = endpoint_template(method, url)
+        attempt = 0
+        while True:
+            async with self._in_flight:
+                pace = self.scheduler.pacing_delay(resource)
+                if pace > 0:
+                    await asyncio.sleep(pace)
+                started = time.perf_counter()
+                try:
+                    resp = await self.client.request(method, url, **kwargs)
+                except httpx.TransportError:
+                    self.metrics.record_response(endpoint, status=None, seconds=time.perf_counter() - started)
+                    delay = self.scheduler.retry_delay(attempt=attempt) if idempotent else None
+                    if delay is None:
+                        raise
+                else:
+                    status = int(resp.status_code)
+                    self.metrics.record_response(endpoint, status=status, seconds=time.perf_counter() - started, headers=resp.headers)
+                    self.metrics.add_bytes(endpoint, len(resp.content))
+                    body = resp.text if status in (403, 429) else ""
+                    self.scheduler.observe(status, resp.headers, body)
+                    delay = self.scheduler.retry_delay(attempt=attempt, status=status, headers=resp.headers, body=body)
+                    if delay is None or (not idempotent and status not in (403, 429)):
+                        return resp
+
+            self._count("http_retry")
+            self.metrics.record_retry(endpoint)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _count(self, key: str) -> None:
+        # Single event-loop thread: no lock needed.
+        self.api_call_counts[key] = int(self.api_call_counts.get(key, 0)) + 1
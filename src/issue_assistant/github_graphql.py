@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from typing import Any
+
+# Issues per GraphQL page and comments inlined per issue. 50 x 100 stays far below GitHub's
+# node limit while replacing 1 + 50 REST round-trips with a single query.
+ISSUES_PER_PAGE = 50
+COMMENTS_PER_ISSUE = 100
+
+_ACTOR_FIELDS = "login ... on User { databaseId } ... on Bot { databaseId } ... on Mannequin { databaseId }"
+
+_ISSUE_FIELDS = f"""
+fragment IssueFields on Issue {{
+  number
+  title
+  body
+  state
+  createdAt
+  updatedAt
+  closedAt
+  author {{ {_ACTOR_FIELDS} }}
+  labels(first: 100) {{ nodes {{ name }} }}
+  comments(first: $commentsFirst) {{
+    totalCount
+    pageInfo {{ hasNextPage }}
+    nodes {{
+      databaseId
+      body
+      createdAt
+      updatedAt
+      author {{ {_ACTOR_FIELDS} }}
+    }}
+  }}
+}}
+"""
+
+LIST_ISSUES_QUERY = (
+    """
+query(
+  $owner: String!, $name: String!, $first: Int!, $after: String, $states: [IssueState!], $commentsFirst: Int!,
+  $since: DateTime, $orderField: IssueOrderField!, $orderDirection: OrderDirection!
+) {
+  repository(owner: $owner, name: $name) {
+    issues(
+      first: $first, after: $after, states: $states, filterBy: {since: $since},
+      orderBy: {field: $orderField, direction: $orderDirection}
+    ) {
+      pageInfo { hasNextPage endCursor }
+      nodes { ...IssueFields }
+    }
+  }
+}
+"""
+    + _ISSUE_FIELDS
+)
+
+GET_ISSUE_QUERY = (
+    """
+query($owner: String!, $name: String!, $number: Int!, $commentsFirst: Int!) {
+  repository(owner: $owner, name: $name) {
+    issue(number: $number) { ...IssueFields }
+  }
+}
+"""
+    + _ISSUE_FIELDS
+)
+
+
+def graphql_url(base_url: str) -> str:
+    base = base_url.rstrip("/")
+    # GitHub Enterprise Server serves REST under /api/v3 and GraphQL under /api/graphql.
+    if base.endswith("/api/v3"):
+        return base[: -len("/v3")] + "/graphql"
+    return base + "/graphql"
+
+
+def graphql_states(state: str) -> list[str] | None:
+    s = (state or "").strip().lower()
+    if s == "open":
+        return ["OPEN"]
+    if s == "closed":
+        return ["CLOSED"]
+    return None
+
+
+def graphql_order(sort: str, direction: str) -> tuple[str, str]:
+    field = "UPDATED_AT" if (sort or "").strip().lower() == "updated" else "CREATED_AT"
+    return field, "ASC" if (direction or "").strip().lower() == "asc" else "DESC"
+
+
+def issue_node_to_rest(node: dict[str, Any]) -> dict[str, Any]:
+    """Reshape a GraphQL Issue node into the REST payload shape the parsers already understand."""
+    labels = ((node.get("labels") or {}).get("nodes")) or []
+    comments = node.get("comments") or {}
+    state = node.get("state")
+    return {
+        "number": node.get("number"),
+        "title": node.get("title"),
+        "body": node.get("body"),
+        "state": str(state).lower() if state is not None else None,
+        "created_at": node.get("createdAt"),
+        "updated_at": node.get("updatedAt"),
+        "closed_at": node.get("closedAt"),
+        "user": _actor_to_rest(node.get("author")),
+        "labels": [{"name": l.get("name")} for l in labels if isinstance(l, dict)],
+        "comments": int(comments.get("totalCount") or 0),
+    }
+
+
+def comment_nodes_to_rest(node: dict[str, Any]) -> list[dict[str, Any]]:
+    comments = node.get("comments") or {}
+    out: list[dict[str, Any]] = []
+    for c in comments.get("nodes") or []:
+        if not isinstance(c, dict) or c.get("databaseId") is None:
+            continue
+        out.append(
+            {
+                "id": c.get("databaseId"),
+                "body": c.get("body"),
+                "created_at": c.get("createdAt"),
+                "updated_at": c.get("updatedAt"),
+                "user": _actor_to_rest(c.get("author")),
+            }
+        )
+    return out
+
+
+def comments_overflow(node: dict[str, Any]) -> bool:
+    page_info = (node.get("comments") or {}).get("pageInfo") or {}
+    return bool(page_info.get("hasNextPage"))
+
+
+def _actor_to_rest(actor: Any) -> dict[str, Any] | None:
+    if not isinstance(actor, dict):
+        return None
+    return {"login": actor.get("login"), "id": actor.get("databaseId")}
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator, Mapping
+
+# Response headers worth replaying alongside a cached body (pagination + validators).
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Link")
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    key: str
+    url: str
+    etag: str | None
+    last_modified: str | None
+    headers: dict[str, str]
+    body_path: Path
+
+    def validators(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class CachedResponse:
+    """Stand-in for a 200 response whose body is replayed from the on-disk cache after a 304."""
+
+    status_code = 200
+    from_cache = True
+
+    def __init__(self, *, url: str, headers: Mapping[str, str], body_path: Path) -> None:
+        from requests.structures import CaseInsensitiveDict
+
+        self.url = url
+        self.headers = CaseInsensitiveDict(headers)
+        self._body_path = body_path
+        self._content: bytes | None = None
+
+    @property
+    def content(self) -> bytes:
+        if self._content is None:
+            self._content = self._body_path.read_bytes()
+        return self._content
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        if self._content is not None:
+            for i in range(0, len(self._content), chunk_size):
+                yield self._content[i : i + chunk_size]
+            return
+        with self._body_path.open("rb") as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+class HttpCache:
+    """On-disk conditional-request cache (ETag / Last-Modified) for GitHub GET responses.
+
+    Each entry is a pair of files: ``<key>.json`` holds validators and replayable headers,
+    ``<key>.body`` holds the raw response bytes. Writes go through a temp file and ``os.replace``
+    so concurrent workers and interrupted runs never leave a torn entry behind.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def key(self, url: str, params: Mapping[str, Any] | None) -> str:
+        canonical = json.dumps([url, sorted((str(k), str(v)) for k, v in (params or {}).items())])
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def lookup(self, url: str, params: Mapping[str, Any] | None) -> CacheEntry | None:
+        key = self.key(url, params)
+        meta_path, body_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(meta, dict) or not body_path.exists():
+            return None
+        etag = meta.get("etag") or None
+        last_modified = meta.get("last_modified") or None
+        if etag is None and last_modified is None:
+            return None
+        headers = meta.get("headers") if isinstance(meta.get("headers"), dict) else {}
+        return CacheEntry(
+            key=key,
+            url=str(meta.get("url") or url),
+            etag=etag,
+            last_modified=last_modified,
+            headers={str(k): str(v) for k, v in headers.items()},
+            body_path=body_path,
+        )
+
+    def store(self, url: str, params: Mapping[str, Any] | None, *, headers: Mapping[str, str], body: bytes) -> None:
+        self._commit(url, params, headers, lambda dest: _atomic_write(dest, body))
+
+    def store_file(self, url: str, params: Mapping[str, Any] | None, *, headers: Mapping[str, str], path: Path) -> None:
+        """Like store(), but adopts an already-written body file (must live under the cache directory)."""
+        self._commit(url, params, headers, lambda dest: os.replace(path, dest))
+
+    def _commit(self, url: str, params: Mapping[str, Any] | None, headers: Mapping[str, str], write_body: Callable[[Path], None]) -> None:
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        key = self.key(url, params)
+        meta_path, body_path = self._paths(key)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "headers": {h: headers[h] for h in _KEPT_HEADERS if headers.get(h) is not None},
+        }
+        # Body first: a meta file must never point at a body from an older response.
+        write_body(body_path)
+        _atomic_write(meta_path, json.dumps(meta, sort_keys=True).encode("utf-8"))
+
+    def tee(self, url: str, params: Mapping[str, Any] | None, resp: Any) -> "_CachingStream":
+        """Wrap a streamed 200 response so its body is spooled to the cache while being consumed."""
+        return _CachingStream(self, url, params, resp)
+
+    def replay(self, entry: CacheEntry, live_headers: Mapping[str, str] | None = None) -> CachedResponse:
+        headers = dict(entry.headers)
+        # A 304 carries fresh rate-limit headers; let them win over the stored ones.
+        for k, v in (live_headers or {}).items():
+            headers[str(k)] = str(v)
+        return CachedResponse(url=entry.url, headers=headers, body_path=entry.body_path)
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        base = self.directory / key[:2]
+        return base / f"{key}.json", base / f"{key}.body"
+
+
+class _CachingStream:
+    """Streamed response proxy: chunks go to the caller and to a temp file committed at end of body."""
+
+    def __init__(self, cache: HttpCache, url: str, params: Mapping[str, Any] | None, resp: Any) -> None:
+        self._cache = cache
+        self._url = url
+        self._params = dict(params or {})
+        self._resp = resp
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resp, name)
+
+    @property
+    def content(self) -> bytes:
+        body = self._resp.content
+        self._cache.store(self._url, self._params, headers=self._resp.headers, body=body)
+        return body
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        headers = self._resp.headers
+        if not headers.get("ETag") and not headers.get("Last-Modified"):
+            yield from self._resp.iter_content(chunk_size)
+            return
+
+        self._cache.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=str(self._cache.directory), prefix=".spool-")
+        complete = False
+        try:
+            with os.fdopen(fd, "wb") as spool:
+                for chunk in self._resp.iter_content(chunk_size):
+                    spool.write(chunk)
+                    yield chunk
+            complete = True
+            self._cache.store_file(self._url, self._params, headers=headers, path=Path(tmp))
+        finally:
+            # An abandoned stream (limit reached mid-page) must not be cached as a full body.
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            if not complete:
+                self._resp.close()
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=".tmp-", suffix=path.suffix)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, Mapping
+from urllib.parse import urlsplit
+
+# Upper bounds (milliseconds) of the latency histogram buckets; the last bucket is open-ended.
+LATENCY_BUCKETS_MS: tuple[float, ...] = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+# Rate-limit samples kept per client; past this the series is thinned to every other sample.
+MAX_RATE_LIMIT_SAMPLES = 512
+
+_REPO_PATH_RE = re.compile(r"^/repos/[^/]+/[^/]+")
+_NUMBER_SEGMENT_RE = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_template(method: str, url: str) -> str:
+    """Group a request URL by API route: ``GET /repos/{owner}/{repo}/issues/{number}/comments``."""
+    path = urlsplit(url).path
+    # GitHub Enterprise Server prefixes REST with /api/v3.
+    if path.startswith("/api/v3/"):
+        path = path[len("/api/v3") :]
+    path = _REPO_PATH_RE.sub("/repos/{owner}/{repo}", path)
+    path = _NUMBER_SEGMENT_RE.sub("/{number}", path)
+    return f"{method.upper()} {path or '/'}"
+
+
+@dataclass
+class EndpointStats:
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    not_modified: int = 0
+    response_bytes: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    statuses: dict[str, int] = field(default_factory=dict)
+    # One count per LATENCY_BUCKETS_MS bound, plus the overflow bucket.
+    latency_buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+
+    def to_json(self) -> dict[str, object]:
+        bounds = [f"le_{int(b)}ms" for b in LATENCY_BUCKETS_MS] + ["gt_{}ms".format(int(LATENCY_BUCKETS_MS[-1]))]
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "not_modified": self.not_modified,
+            "response_bytes": self.response_bytes,
+            "total_seconds": round(self.total_seconds, 6),
+            "mean_seconds": round(self.total_seconds / self.requests, 6) if self.requests else None,
+            "max_seconds": round(self.max_seconds, 6),
+            "statuses": dict(sorted(self.statuses.items())),
+            "latency_histogram": dict(zip(bounds, self.latency_buckets)),
+        }
+
+
+@dataclass(frozen=True)
+class RateLimitSample:
+    at_seconds: float
+    resource: str
+    remaining: int | None
+    used: int | None
+    limit: int | None
+
+
+class HttpMetrics:
+    """Thread-safe per-endpoint HTTP telemetry for one client over one run.
+
+    Every attempt (including retried ones) is recorded with its latency and status; response
+    bytes are added as bodies are read, since streamed pages are consumed after the request.
+    Rate-limit minima and maxima are exact; the sample series is bounded by halving its
+    resolution whenever it reaches ``MAX_RATE_LIMIT_SAMPLES``.
+    """
+
+    def __init__(self, *, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self._started = clock()
+        self._lock = threading.Lock()
+        self.endpoints: dict[str, EndpointStats] = {}
+        self.conditional_requests = 0
+        self.cache_hits = 0
+        self.rate_limit_samples: list[RateLimitSample] = []
+        self._rate_limit: dict[str, dict[str, int | None]] = {}
+        self._sample_stride = 1
+        self._samples_seen = 0
+
+    def record_response(
+        self,
+        endpoint: str,
+        *,
+        status: int | None,
+        seconds: float,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """Record one attempt; ``status=None`` means it failed at the transport level."""
+        with self._lock:
+            stats = self.endpoints.setdefault(endpoint, EndpointStats())
+            stats.requests += 1
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.latency_buckets[_bucket(seconds * 1000.0)] += 1
+            key = str(status) if status is not None else "transport_error"
+            stats.statuses[key] = stats.statuses.get(key, 0) + 1
+            if status is None or status >= 400:
+                stats.errors += 1
+            if status == 304:
+                stats.not_modified += 1
+            if headers is not None and headers.get("X-RateLimit-Remaining") is not None:
+                self._record_rate_limit(
+                    RateLimitSample(
+                        at_seconds=round(self._clock() - self._started, 6),
+                        resource=str(headers.get("X-RateLimit-Resource") or "core"),
+                        remaining=_opt_int(headers.get("X-RateLimit-Remaining")),
+                        used=_opt_int(headers.get("X-RateLimit-Used")),
+                        limit=_opt_int(headers.get("X-RateLimit-Limit")),
+                    )
+                )
+
+    def _record_rate_limit(self, s: RateLimitSample) -> None:
+        r = self._rate_limit.setdefault(s.resource, {"min_remaining": None, "max_used": None, "limit": None})
+        if s.remaining is not None and (r["min_remaining"] is None or s.remaining < r["min_remaining"]):
+            r["min_remaining"] = s.remaining
+        if s.used is not None and (r["max_used"] is None or s.used > r["max_used"]):
+            r["max_used"] = s.used
+        if s.limit is not None:
+            r["limit"] = s.limit
+
+        self._samples_seen += 1
+        if self._samples_seen % self._sample_stride:
+            return
+        self.rate_limit_samples.append(s)
+        if len(self.rate_limit_samples) >= MAX_RATE_LIMIT_SAMPLES:
+            del self.rate_limit_samples[1::2]
+            self._sample_stride *= 2
+
+    def record_retry(self, endpoint: str) -> None:
+        with self._lock:
+            self.endpoints.setdefault(endpoint, EndpointStats()).retries += 1
+
+    def record_conditional(self) -> None:
+        with self._lock:
+            self.conditional_requests += 1
+
+    def record_cache_hit(self) -> None:
+        with self._lock:
+            self.cache_hits += 1
+
+    def add_bytes(self, endpoint: str, n: int) -> None:
+        with self._lock:
+            self.endpoints.setdefault(endpoint, EndpointStats()).response_bytes += int(n)
+
+    def count_bytes(self, endpoint: str, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Pass ``chunks`` through, adding their size to ``endpoint`` as they are read."""
+        for chunk in chunks:
+            self.add_bytes(endpoint, len(chunk))
+            yield chunk
+
+    def to_json(self) -> dict[str, object]:
+        with self._lock:
+            endpoints = {k: v.to_json() for k, v in sorted(self.endpoints.items())}
+            samples = list(self.rate_limit_samples)
+            rate_limit: dict[str, Any] = {k: {**v, "samples": []} for k, v in self._rate_limit.items()}
+            requests = sum(v.requests for v in self.endpoints.values())
+            retries = sum(v.retries for v in self.endpoints.values())
+            request_seconds = sum(v.total_seconds for v in self.endpoints.values())
+            response_bytes = sum(v.response_bytes for v in self.endpoints.values())
+            conditional = self.conditional_requests
+            hits = self.cache_hits
+
+        for s in samples:
+            rate_limit[s.resource]["samples"].append([s.at_seconds, s.remaining, s.used])
+
+        return {
+            "totals": {
+                "requests": requests,
+                "retries": retries,
+                "request_seconds": round(request_seconds, 6),
+                "response_bytes": response_bytes,
+                "conditional_requests": conditional,
+                "not_modified": hits,
+                "not_modified_ratio": round(hits / conditional, 6) if conditional else None,
+            },
+            "endpoints": endpoints,
+            "rate_limit": dict(sorted(rate_limit.items())),
+        }
+
+
+def _bucket(ms: float) -> int:
+    for i, bound in enumerate(LATENCY_BUCKETS_MS):
+        if ms <= bound:
+            return i
+    return len(LATENCY_BUCKETS_MS)
+
+
+def _opt_int(v: object) -> int | None:
+    if v is None:
+        return None
+    try:
+        return int(str(v).strip())
+    except ValueError:
+        return None
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
+from .models import Commit, Issue, NormalizedIssue, PullRequest
+from .phases.normalization import normalize_issue
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True)
+class IngestResult:
+    issues: list[Issue]
+    normalized: list[NormalizedIssue]
+    pull_requests: list[PullRequest] | None
+    commits: list[Commit] | None
+
+
+def ingest_concurrently(
+    *,
+    issues: Callable[[], list[Issue]],
+    pull_requests: Callable[[], list[PullRequest]] | None = None,
+    commits: Callable[[], list[Commit]] | None = None,
+) -> IngestResult:
+    """Run the independent ingestion sources at the same time.
+
+    Pull requests and commits load on worker threads while issues load on the calling thread;
+    issues are then normalized while the other sources may still be running, so ingestion takes
+    as long as its slowest stage rather than the sum of all of them.
+    """
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="issue-assistant-ingest") as pool:
+        prs_future = pool.submit(pull_requests) if pull_requests is not None else None
+        commits_future = pool.submit(commits) if commits is not None else None
+        try:
+            loaded = issues()
+            normalized = [normalize_issue(i) for i in loaded]
+        except BaseException:
+            for f in (prs_future, commits_future):
+                if f is not None:
+                    f.cancel()
+            raise
+        return IngestResult(
+            issues=loaded,
+            normalized=normalized,
+            pull_requests=_result(prs_future),
+            commits=_result(commits_future),
+        )
+
+
+def _result(future: Future[_T] | None) -> _T | None:
+    return future.result() if future is not None else None
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import sys
+from functools import lru_cache
+from typing import Any
+
+from .models import IssueAuthor, IssueLabel
+
+
+class InternTable:
+    """Ingest-time flyweights: one shared object per distinct label, author and repeated string.
+
+    A repository has a few dozen labels and a few thousand authors repeated across every issue
+    and comment, so parsers route them through one table per client (or per loaded file). The
+    models are frozen, which makes sharing instances safe. Strings go through ``sys.intern`` so
+    equal label names and logins are the same object and compare by identity.
+    """
+
+    def __init__(self) -> None:
+        # dict.setdefault is atomic, so concurrent parser threads need no lock.
+        self._labels: dict[str, IssueLabel] = {}
+        self._authors: dict[tuple[str, int | None], IssueAuthor] = {}
+
+    def __len__(self) -> int:
+        return len(self._labels) + len(self._authors)
+
+    def string(self, s: str | None) -> str | None:
+        return sys.intern(s) if s is not None else None
+
+    def label(self, name: str) -> IssueLabel:
+        found = self._labels.get(name)
+        if found is None:
+            name = sys.intern(name)
+            found = self._labels.setdefault(name, IssueLabel(name=name))
+        return found
+
+    def author(self, login: str, id: int | None = None) -> IssueAuthor:
+        key = (login, id)
+        found = self._authors.get(key)
+        if found is None:
+            found = self._authors.setdefault(key, IssueAuthor(login=sys.intern(login), id=id))
+        return found
+
+    def user(self, raw: Any) -> IssueAuthor | None:
+        """Author for a GitHub ``user`` object (None when absent)."""
+        if not isinstance(raw, dict) or not raw:
+            return None
+        return self.author(str(raw.get("login") or ""), _opt_int(raw.get("id")))
+
+    def labels(self, raw: Any) -> tuple[IssueLabel, ...]:
+        """Labels from a GitHub ``labels`` list of names or label objects."""
+        if not isinstance(raw, list):
+            return ()
+        out: list[IssueLabel] = []
+        for l in raw:
+            if isinstance(l, str):
+                out.append(self.label(l))
+            elif isinstance(l, dict):
+                out.append(self.label(str(l.get("name") or "")))
+        return tuple(out)
+
+
+@lru_cache(maxsize=4096)
+def folded(name: str) -> str:
+    """Interned lower-case form of a label name, computed once per distinct name."""
+    return sys.intern(name.lower())
+
+
+def _opt_int(v: Any) -> int | None:
+    if v is None:
+        return None
+    try:
+        return int(v)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import compress
+from typing import Iterable, Sequence
+
+from .models import IssueAnalysis
+
+# Maintainer-cost level -> score; unknown levels count as medium.
+COST_SCORES = {"low": 1, "medium": 2, "high": 3}
+HIGH_COST_SCORE = COST_SCORES["high"]
+# Noise score at or above which an issue counts as low signal even if normalization did not flag it.
+HIGH_NOISE = 70
+# Completeness/reproducibility below this mark an issue as low quality.
+LOW_QUALITY_SCORE = 50
+
+
+def is_low_signal(flagged: bool, noise: int) -> bool:
+    """Low signal: flagged during normalization, or noise >= 70."""
+    return bool(flagged) or noise >= HIGH_NOISE
+
+
+def is_low_quality(needs_info: bool, completeness: int, reproducibility: int, noise: int, flagged: bool) -> bool:
+    """Low quality: needs-info, completeness or reproducibility < 50, or low signal."""
+    return (
+        bool(needs_info)
+        or completeness < LOW_QUALITY_SCORE
+        or reproducibility < LOW_QUALITY_SCORE
+        or is_low_signal(flagged, noise)
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class IssueTable:
+    """Columnar view of a run's per-issue scalars, one row per analysis in run order.
+
+    Aggregate phases scan these flat arrays instead of walking the nested analysis objects for
+    every metric. Categorical columns hold codes into the ``*_values`` vocabularies;
+    ``activity_at`` is ``updated_at or created_at`` in epoch seconds (naive times read as UTC,
+    NaN when the issue has neither).
+    """
+
+    numbers: array
+    lifecycle: array
+    lifecycle_values: tuple[str, ...]
+    triage: array
+    triage_values: tuple[str, ...]
+    cost_score: array
+    completeness: array
+    clarity: array
+    reproducibility: array
+    noise: array
+    low_signal: array
+    duplicate: array
+    activity_at: array
+
+    @staticmethod
+    def from_analyses(analyses: Sequence[IssueAnalysis]) -> "IssueTable":
+        lifecycle_codes: dict[str, int] = {}
+        triage_codes: dict[str, int] = {}
+        numbers = array("q")
+        lifecycle = array("H")
+        triage = array("H")
+        cost_score = array("b")
+        completeness = array("h")
+        clarity = array("h")
+        reproducibility = array("h")
+        noise = array("h")
+        low_signal = array("b")
+        duplicate = array("b")
+        activity_at = array("d")
+
+        for a in analyses:
+            numbers.append(a.issue_number)
+            lifecycle.append(lifecycle_codes.setdefault(a.lifecycle.state, len(lifecycle_codes)))
+            triage.append(triage_codes.setdefault(a.triage.category, len(triage_codes)))
+            cost_score.append(COST_SCORES.get(a.maintainer_cost.level, 2))
+            q = a.quality
+            completeness.append(q.completeness)
+            clarity.append(q.clarity)
+            reproducibility.append(q.reproducibility)
+            noise.append(q.noise)
+            low_signal.append(1 if a.normalized.is_low_signal else 0)
+            duplicate.append(1 if a.duplicates is not None and a.duplicates.likely_duplicates_of else 0)
+            issue = a.normalized.issue
+            activity_at.append(_epoch(issue.updated_at or issue.created_at))
+
+        return IssueTable(
+            numbers=numbers,
+            lifecycle=lifecycle,
+            lifecycle_values=tuple(lifecycle_codes),
+            triage=triage,
+            triage_values=tuple(triage_codes),
+            cost_score=cost_score,
+            completeness=completeness,
+            clarity=clarity,
+            reproducibility=reproducibility,
+            noise=noise,
+            low_signal=low_signal,
+            duplicate=duplicate,
+            activity_at=activity_at,
+        )
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    def lifecycle_mask(self, state: str) -> list[bool]:
+        return _code_mask(self.lifecycle, self.lifecycle_values, (state,))
+
+    def triage_mask(self, *categories: str) -> list[bool]:
+        return _code_mask(self.triage, self.triage_values, categories)
+
+    def high_cost_mask(self) -> list[bool]:
+        return list(map(HIGH_COST_SCORE.__eq__, self.cost_score))
+
+    def low_signal_mask(self) -> list[bool]:
+        return [is_low_signal(flagged, noise) for flagged, noise in zip(self.low_signal, self.noise)]
+
+    def low_quality_mask(self) -> list[bool]:
+        return [
+            is_low_quality(needs_info, completeness, repro, noise, flagged)
+            for needs_info, completeness, repro, noise, flagged in zip(
+                self.lifecycle_mask("needs-info"), self.completeness, self.reproducibility, self.noise, self.low_signal
+            )
+        ]
+
+    def select(self, mask: Iterable[bool]) -> list[int]:
+        """Issue numbers of the rows where ``mask`` is true, in run order."""
+        return list(compress(self.numbers, mask))
+
+    def lifecycle_counts(self, rows: Iterable[int] | None = None) -> dict[str, int]:
+        return _counts(self.lifecycle, self.lifecycle_values, rows)
+
+    def triage_counts(self, rows: Iterable[int] | None = None) -> dict[str, int]:
+        return _counts(self.triage, self.triage_values, rows)
+
+
+def _code_mask(column: array, values: tuple[str, ...], wanted: tuple[str, ...]) -> list[bool]:
+    codes = {values.index(v) for v in wanted if v in values}
+    if not codes:
+        return [False] * len(column)
+    if len(codes) == 1:
+        return list(map(next(iter(codes)).__eq__, column))
+    return list(map(codes.__contains__, column))
+
+
+def _counts(column: array, values: tuple[str, ...], rows: Iterable[int] | None) -> dict[str, int]:
+    if rows is None:
+        # Vocabularies are built from the rows, so every value occurs at least once.
+        return {v: column.count(code) for code, v in enumerate(values)}
+    counts: dict[str, int] = {}
+    for r in rows:
+        v = values[column[r]]
+        counts[v] = counts.get(v, 0) + 1
+    return counts
+
+
+def _epoch(dt: datetime | None) -> float:
+    if dt is None:
+        return math.nan
+    return (dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)).timestamp()
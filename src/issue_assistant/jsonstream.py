@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+_WS = " \t\n\r"
+# What may follow a complete value inside an array or object.
+_VALUE_END = _WS + ",]}:"
+
+
+def iter_json_array(chunks: Iterable[bytes], *, key: str | None = None, encoding: str = "utf-8") -> Iterator[Any]:
+    """Incrementally decode a top-level JSON array, yielding one element at a time.
+
+    Only the element being decoded (plus one network chunk) is held in memory, instead of the
+    whole response body, its decoded text and the full list at once. A top-level value that is
+    not an array yields nothing, mirroring how paginated endpoints treat non-list payloads.
+
+    With ``key``, the top-level value is an object (e.g. a search response) and the elements of
+    its ``key`` member are streamed; the other members are decoded and discarded.
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder(encoding)()
+    source = iter(chunks)
+    buf = ""
+    pos = 0
+    eof = False
+
+    def fill() -> bool:
+        nonlocal buf, pos, eof
+        if eof:
+            return False
+        for chunk in source:
+            if not chunk:
+                continue
+            if pos:
+                buf = buf[pos:]
+                pos = 0
+            buf += text.decode(chunk)
+            return True
+        buf = buf[pos:] + text.decode(b"", final=True)
+        pos = 0
+        eof = True
+        return False
+
+    def skip_ws() -> bool:
+        # Returns False when the input is exhausted.
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in _WS:
+                pos += 1
+            if pos < len(buf):
+                return True
+            if not fill():
+                return pos < len(buf)
+
+    def peek(what: str) -> str:
+        if not skip_ws():
+            raise ValueError(f"truncated JSON {what}")
+        return buf[pos]
+
+    def decode_value() -> Any:
+        nonlocal pos
+        peek("value")
+        retry_at = 0
+        while True:
+            if len(buf) - pos >= retry_at or eof:
+                try:
+                    value, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                else:
+                    # A bare number cut at the buffer edge ("1", "1.", "1e", "1e-") decodes to a
+                    # shorter prefix; accept a value only once a delimiter shows it is complete.
+                    if eof or (end < len(buf) and buf[end] in _VALUE_END):
+                        break
+                # Wait until the pending value has doubled before re-parsing it, so a huge element
+                # costs amortised O(n) rather than one full re-parse per network chunk.
+                retry_at = max(1, 2 * (len(buf) - pos))
+            fill()
+        pos = end
+        return value
+
+    def elements() -> Iterator[Any]:
+        # Positioned on "["; leaves pos just past the matching "]".
+        nonlocal pos
+        pos += 1
+        if peek("array") == "]":
+            pos += 1
+            return
+        while True:
+            yield decode_value()
+            c = peek("array")
+            pos += 1
+            if c == "]":
+                return
+            if c != ",":
+                raise ValueError(f"expected ',' or ']' in JSON array, got {c!r}")
+
+    def finish() -> None:
+        # Read to the end of the body: trailing garbage is an error, and a fully consumed stream is
+        # what lets a caching tee commit the page.
+        if skip_ws():
+            raise ValueError(f"unexpected data after JSON value: {buf[pos]!r}")
+
+    if not skip_ws():
+        return
+    if key is None:
+        if buf[pos] != "[":
+            return
+        yield from elements()
+        finish()
+        return
+
+    if buf[pos] != "{":
+        return
+    pos += 1
+    if peek("object") == "}":
+        pos += 1
+        finish()
+        return
+    while True:
+        name = decode_value()
+        if peek("object") != ":":
+            raise ValueError(f"expected ':' in JSON object, got {buf[pos]!r}")
+        pos += 1
+        if name == key and peek("object") == "[":
+            yield from elements()
+        else:
+            decode_value()
+        c = peek("object")
+        pos += 1
+        if c == "}":
+            break
+        if c != ",":
+            raise ValueError(f"expected ',' or '}}' in JSON object, got {c!r}")
+    finish()
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .github import GitHubClient, GitHubRepoRef
+from .interning import InternTable
+from .models import Issue, IssueAuthor, IssueComment
+
+# Listing cap for a mirror sync; the watermark, not --limit, bounds how much is transferred.
+_SYNC_LIMIT = 1_000_000_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sync_state (
+    repo TEXT PRIMARY KEY,
+    watermark TEXT,
+    synced_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS issues (
+    repo TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    body TEXT NOT NULL,
+    author_login TEXT,
+    author_id INTEGER,
+    labels TEXT NOT NULL,
+    state TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    closed_at TEXT,
+    comments_synced_at TEXT,
+    PRIMARY KEY (repo, number)
+);
+CREATE TABLE IF NOT EXISTS comments (
+    repo TEXT NOT NULL,
+    issue_number INTEGER NOT NULL,
+    id INTEGER NOT NULL,
+    author_login TEXT,
+    author_id INTEGER,
+    body TEXT NOT NULL,
+    created_at TEXT,
+    updated_at TEXT,
+    PRIMARY KEY (repo, issue_number, id)
+);
+"""
+
+
+@dataclass(frozen=True)
+class MirrorSyncResult:
+    repo: str
+    previous_watermark: datetime | None
+    watermark: datetime | None
+    issues_fetched: int
+    comment_threads_fetched: int
+    issues_total: int
+
+
+class IssueMirror:
+    """Local SQLite mirror of a repository's issues and comments, refreshed incrementally.
+
+    Each sync lists only issues updated since the stored watermark (``since=`` + ``sort=updated``),
+    upserts them, and refetches comment threads whose issue changed since they were last stored.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "IssueMirror":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def watermark(self, repo: GitHubRepoRef) -> datetime | None:
+        row = self._conn.execute("SELECT watermark FROM sync_state WHERE repo = ?", (_repo_key(repo),)).fetchone()
+        return _parse_dt(row[0]) if row else None
+
+    def sync(
+        self,
+        gh: GitHubClient,
+        repo: GitHubRepoRef,
+        *,
+        include_pull_requests: bool = False,
+        include_comments: bool = True,
+    ) -> MirrorSyncResult:
+        key = _repo_key(repo)
+        previous = self.watermark(repo)
+
+        # state=all so that closes/reopens since the last sync update existing rows.
+        changed = gh.list_issues(
+            repo,
+            state="all",
+            limit=_SYNC_LIMIT,
+            include_pull_requests=include_pull_requests,
+            include_comments=False,
+            since=previous,
+            sort="updated",
+            direction="asc",
+        )
+
+        watermark = previous
+        with self._conn:
+            for issue in changed:
+                self._upsert_issue(key, issue)
+                if issue.updated_at is not None and (watermark is None or issue.updated_at > watermark):
+                    watermark = issue.updated_at
+
+        threads = 0
+        if include_comments:
+            stale = [
+                int(r[0])
+                for r in self._conn.execute(
+                    "SELECT number FROM issues WHERE repo = ? AND comments_synced_at IS NOT updated_at ORDER BY number",
+                    (key,),
+                )
+            ]
+            # Threads the listing reports as empty are stored without a request.
+            empty = {i.number for i in changed if i.raw.get("comments") == 0}
+            to_fetch = [n for n in stale if n not in empty]
+            fetched = gh.fetch_comments(repo, to_fetch) if to_fetch else {}
+            with self._conn:
+                for number in stale:
+                    self._replace_comments(key, number, fetched.get(number, []))
+            threads = len(fetched)
+
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO sync_state (repo, watermark, synced_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(repo) DO UPDATE SET watermark = excluded.watermark, synced_at = excluded.synced_at",
+                (key, _dt(watermark), datetime.now(tz=timezone.utc).isoformat()),
+            )
+
+        total = int(self._conn.execute("SELECT COUNT(*) FROM issues WHERE repo = ?", (key,)).fetchone()[0])
+        return MirrorSyncResult(
+            repo=key,
+            previous_watermark=previous,
+            watermark=watermark,
+            issues_fetched=len(changed),
+            comment_threads_fetched=threads,
+            issues_total=total,
+        )
+
+    def load_issues(self, repo: GitHubRepoRef, *, state: str = "all") -> list[Issue]:
+        key = _repo_key(repo)
+        where = "repo = ?"
+        params: list[object] = [key]
+        if state in ("open", "closed"):
+            where += " AND state = ?"
+            params.append(state)
+
+        interner = InternTable()
+        comments: dict[int, list[IssueComment]] = {}
+        for row in self._conn.execute(
+            "SELECT issue_number, id, author_login, author_id, body, created_at, updated_at "
+            "FROM comments WHERE repo = ? ORDER BY issue_number, created_at, id",
+            (key,),
+        ):
+            comments.setdefault(int(row[0]), []).append(
+                IssueComment(
+                    id=int(row[1]),
+                    author=_author(interner, row[2], row[3]),
+                    body=row[4],
+                    created_at=_parse_dt(row[5]),
+                    updated_at=_parse_dt(row[6]),
+                )
+            )
+
+        issues: list[Issue] = []
+        for row in self._conn.execute(
+            "SELECT number, title, body, author_login, author_id, labels, state, created_at, updated_at, closed_at "
+            f"FROM issues WHERE {where} ORDER BY number DESC",
+            params,
+        ):
+            number = int(row[0])
+            issues.append(
+                Issue(
+                    number=number,
+                    title=row[1],
+                    body=row[2],
+                    author=_author(interner, row[3], row[4]),
+                    labels=tuple(interner.label(str(n)) for n in json.loads(row[5])),
+                    state=row[6],
+                    created_at=_parse_dt(row[7]),
+                    updated_at=_parse_dt(row[8]),
+                    closed_at=_parse_dt(row[9]),
+                    comments=tuple(comments.get(number, ())),
+                )
+            )
+        return issues
+
+    def _upsert_issue(self, key: str, issue: Issue) -> None:
+        self._conn.execute(
+            "INSERT INTO issues (repo, number, title, body, author_login, author_id, labels, state, created_at, updated_at, closed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(repo, number) DO UPDATE SET title = excluded.title, body = excluded.body, "
+            "author_login = excluded.author_login, author_id = excluded.author_id, labels = excluded.labels, "
+            "state = excluded.state, created_at = excluded.created_at, updated_at = excluded.updated_at, "
+            "closed_at = excluded.closed_at",
+            (
+                key,
+                issue.number,
+                issue.title,
+                issue.body,
+                issue.author.login if issue.author else None,
+                issue.author.id if issue.author else None,
+                json.dumps([l.name for l in issue.labels]),
+                issue.state,
+                _dt(issue.created_at),
+                _dt(issue.updated_at),
+                _dt(issue.closed_at),
+            ),
+        )
+
+    def _replace_comments(self, key: str, number: int, comments: list[IssueComment]) -> None:
+        self._conn.execute("DELETE FROM comments WHERE repo = ? AND issue_number = ?", (key, number))
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO comments (repo, issue_number, id, author_login, author_id, body, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    key,
+                    number,
+                    c.id,
+                    c.author.login if c.author else None,
+                    c.author.id if c.author else None,
+                    c.body,
+                    _dt(c.created_at),
+                    _dt(c.updated_at),
+                )
+                for c in comments
+            ],
+        )
+        self._conn.execute(
+            "UPDATE issues SET comments_synced_at = updated_at WHERE repo = ? AND number = ?",
+            (key, number),
+        )
+
+
+def _repo_key(repo: GitHubRepoRef) -> str:
+    return f"{repo.owner}/{repo.name}"
+
+
+def _author(interner: InternTable, login: str | None, author_id: int | None) -> IssueAuthor | None:
+    if login is None:
+        return None
+    return interner.author(login, author_id)
+
+
+def _dt(dt: datetime | None) -> str | None:
+    return dt.isoformat() if dt else None
+
+
+def _parse_dt(v: str | None) -> datetime | None:
+    if not v:
+        return None
+    try:
+        return datetime.fromisoformat(v)
+    except ValueError:
+        return None
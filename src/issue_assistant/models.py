@@ -2,21 +2,24 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    from .issue_table import IssueTable
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class IssueAuthor:
     login: str
     id: int | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IssueLabel:
     name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IssueComment:
     id: int
     author: IssueAuthor | None
@@ -25,7 +28,7 @@ class IssueComment:
     updated_at: datetime | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Issue:
     number: int
     title: str
@@ -40,7 +43,7 @@ class Issue:
     raw: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PullRequest:
     number: int
     title: str
@@ -55,7 +58,7 @@ class PullRequest:
     raw: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Commit:
     sha: str
     message: str
@@ -64,14 +67,14 @@ class Commit:
     raw: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DependencyEndpoint:
     kind: str  # issue | pull_request | commit
     repo: str | None
     identifier: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DependencyLink:
     source: DependencyEndpoint
     target: DependencyEndpoint
@@ -80,7 +83,7 @@ class DependencyLink:
     reasons: tuple[str, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NormalizedIssue:
     issue: Issue
     normalized_title: str
@@ -89,7 +92,7 @@ class NormalizedIssue:
     low_signal_reasons: tuple[str, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QualityBreakdown:
     completeness: int
     clarity: int
@@ -98,35 +101,35 @@ class QualityBreakdown:
     reasons: tuple[str, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TriageClassification:
     category: str
     confidence: float
     reasons: tuple[str, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LifecycleClassification:
     state: str
     confidence: str
     reasons: tuple[str, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MaintainerCostEstimate:
     level: str
     reasons: tuple[str, ...] = ()
     signals: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DuplicateLink:
     issue_number: int
     likely_duplicates_of: tuple[int, ...]
     similarity_reasons: tuple[str, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MaintainerAction:
     recommended_actions: tuple[str, ...]
     recommended_labels: tuple[str, ...] = ()
@@ -134,7 +137,7 @@ class MaintainerAction:
     notes: tuple[str, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IssueAnalysis:
     issue_number: int
     normalized: NormalizedIssue
@@ -146,13 +149,25 @@ class IssueAnalysis:
     maintainer_action: MaintainerAction
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnalysisRun:
     generated_at: datetime
     repo: str | None
     issues: tuple[IssueAnalysis, ...]
     dependencies: tuple[DependencyLink, ...] = ()
     governance_mode: str = "dry-run"
+    _table: Any = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def table(self) -> "IssueTable":
+        """Columnar view of ``issues`` for aggregate phases, built on first use."""
+        table = self._table
+        if table is None:
+            from .issue_table import IssueTable
+
+            table = IssueTable.from_analyses(self.issues)
+            object.__setattr__(self, "_table", table)
+        return table
 
     def as_json_dict(self) -> dict[str, Any]:
         return {
@@ -30,16 +30,15 @@ def compute_issue_health(*, run: AnalysisRun, limits: HealthLimits = DEFAULT_LIM
             },
         }
 
-    needs_info = [a.issue_number for a in run.issues if a.lifecycle.state == "needs-info"]
-    stale = [a.issue_number for a in run.issues if a.lifecycle.state == "stale"]
-    blocked = [a.issue_number for a in run.issues if a.lifecycle.state == "blocked"]
-    duplicates = [a.issue_number for a in run.issues if a.duplicates is not None and a.duplicates.likely_duplicates_of]
-
-    avg_repro = sum(a.quality.reproducibility for a in run.issues) / total
-    avg_complete = sum(a.quality.completeness for a in run.issues) / total
-
-    cost_map = {"low": 1, "medium": 2, "high": 3}
-    avg_cost = sum(cost_map.get(a.maintainer_cost.level, 2) for a in run.issues) / total
+    t = run.table
+    needs_info = t.select(t.lifecycle_mask("needs-info"))
+    stale = t.select(t.lifecycle_mask("stale"))
+    blocked = t.select(t.lifecycle_mask("blocked"))
+    duplicates = t.select(t.duplicate)
+
+    avg_repro = sum(t.reproducibility) / total
+    avg_complete = sum(t.completeness) / total
+    avg_cost = sum(t.cost_score) / total
 
     def pct(x: int) -> float:
         return round((100.0 * x) / total, 2)
@@ -4,6 +4,7 @@ import re
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 
+from ..interning import folded
 from ..models import LifecycleClassification, NormalizedIssue, QualityBreakdown, TriageClassification
 
 
@@ -25,7 +26,7 @@ def classify_lifecycle(
 ) -> LifecycleClassification:
     now_dt = now or datetime.now(tz=timezone.utc)
 
-    labels = {l.name.lower() for l in normalized.issue.labels}
+    labels = {folded(l.name) for l in normalized.issue.labels}
     text = (normalized.issue.title or "") + "\n" + (normalized.issue.body or "")
     text_lower = text.lower()
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from ..models import AnalysisRun, IssueAnalysis
+from ..models import AnalysisRun
 
 
 @dataclass(frozen=True)
@@ -16,26 +16,13 @@ DEFAULT_LIMITS = MaintainerLoadLimits()
 def compute_maintainer_load(*, run: AnalysisRun, limits: MaintainerLoadLimits = DEFAULT_LIMITS) -> dict[str, object]:
     total = len(run.issues)
 
-    high_cost: list[int] = []
-    needs_info: list[int] = []
-    stale: list[int] = []
-    blocked: list[int] = []
-    duplicates: list[int] = []
-    low_signal: list[int] = []
-
-    for a in run.issues:
-        if a.maintainer_cost.level == "high":
-            high_cost.append(a.issue_number)
-        if a.lifecycle.state == "needs-info":
-            needs_info.append(a.issue_number)
-        if a.lifecycle.state == "stale":
-            stale.append(a.issue_number)
-        if a.lifecycle.state == "blocked":
-            blocked.append(a.issue_number)
-        if a.duplicates is not None and a.duplicates.likely_duplicates_of:
-            duplicates.append(a.issue_number)
-        if _is_low_signal(a):
-            low_signal.append(a.issue_number)
+    t = run.table
+    high_cost = t.select(t.high_cost_mask())
+    needs_info = t.select(t.lifecycle_mask("needs-info"))
+    stale = t.select(t.lifecycle_mask("stale"))
+    blocked = t.select(t.lifecycle_mask("blocked"))
+    duplicates = t.select(t.duplicate)
+    low_signal = t.select(t.low_signal_mask())
 
     dep_links_total = len(run.dependencies)
 
@@ -196,11 +183,3 @@ def render_maintainer_load_md(*, report: dict[str, object]) -> str:
         lines.append("")
 
     return "\n".join(lines).rstrip() + "\n"
-
-
-def _is_low_signal(a: IssueAnalysis) -> bool:
-    if a.normalized.is_low_signal:
-        return True
-    if a.quality.noise >= 70:
-        return True
-    return False
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..issue_table import is_low_quality
 from ..models import AnalysisRun, DependencyLink, IssueAnalysis
 from .labels import recommend_labels
 
@@ -148,12 +149,14 @@ def render_issue_playbook_md(
 def _render_global_playbooks(run: AnalysisRun) -> list[str]:
     lines: list[str] = []
 
-    low_quality = [a for a in run.issues if _is_low_quality(a)]
-    duplicates = [a for a in run.issues if a.duplicates is not None and a.duplicates.likely_duplicates_of]
-    stale = [a for a in run.issues if a.lifecycle.state == "stale"]
-    bugs = [a for a in run.issues if a.triage.category == "bug"]
-    features = [a for a in run.issues if a.triage.category == "feature request"]
-    support = [a for a in run.issues if a.triage.category in ("support request", "question")]
+    t = run.table
+    low_quality = sum(t.low_quality_mask())
+    duplicates = sum(t.duplicate)
+    stale = t.lifecycle_counts().get("stale", 0)
+    triage = t.triage_counts()
+    bugs = triage.get("bug", 0)
+    features = triage.get("feature request", 0)
+    support = sum(t.triage_mask("support request", "question"))
 
     lines.extend(
         _global_section(
@@ -163,7 +166,7 @@ def _render_global_playbooks(run: AnalysisRun) -> list[str]:
                 "quality.completeness < 50 OR quality.reproducibility < 50",
                 "quality.noise >= 70 OR normalized.is_low_signal == True",
             ],
-            why=f"Selected because {len(low_quality)} issue(s) meet low-quality conditions.",
+            why=f"Selected because {low_quality} issue(s) meet low-quality conditions.",
             actions=[
                 "Request missing reproduction steps / environment / logs (as applicable)",
                 "Ask for expected vs actual behavior to be stated clearly",
@@ -183,7 +186,7 @@ def _render_global_playbooks(run: AnalysisRun) -> list[str]:
             when=[
                 "duplicates.likely_duplicates_of is non-empty",
             ],
-            why=f"Selected because {len(duplicates)} issue(s) have likely duplicates.",
+            why=f"Selected because {duplicates} issue(s) have likely duplicates.",
             actions=[
                 "Confirm the duplicate relationship by checking the referenced issue(s)",
                 "Link the issues together and consolidate discussion",
@@ -203,7 +206,7 @@ def _render_global_playbooks(run: AnalysisRun) -> list[str]:
             when=[
                 "lifecycle.state == stale",
             ],
-            why=f"Selected because {len(stale)} issue(s) are classified as stale.",
+            why=f"Selected because {stale} issue(s) are classified as stale.",
             actions=[
                 "Ask for confirmation the issue still reproduces on the latest version",
                 "Request updated reproduction steps / logs if the environment changed",
@@ -223,7 +226,7 @@ def _render_global_playbooks(run: AnalysisRun) -> list[str]:
             when=[
                 "triage.category in {bug, feature request}",
             ],
-            why=f"Selected because repo contains {len(bugs)} bug(s) and {len(features)} feature request(s).",
+            why=f"Selected because repo contains {bugs} bug(s) and {features} feature request(s).",
             actions=[
                 "For bugs: request minimal reproduction + expected/actual + logs",
                 "For feature requests: request motivation, scope, and acceptance criteria",
@@ -243,7 +246,7 @@ def _render_global_playbooks(run: AnalysisRun) -> list[str]:
             when=[
                 "triage.category in {support request, question}",
             ],
-            why=f"Selected because {len(support)} issue(s) are support/question.",
+            why=f"Selected because {support} issue(s) are support/question.",
             actions=[
                 "Ask for expected outcome, current behavior, and configuration",
                 "Point to relevant documentation if available (manual maintainer decision)",
@@ -308,17 +311,10 @@ def _global_section(
 
 
 def _is_low_quality(a: IssueAnalysis) -> bool:
-    if a.lifecycle.state == "needs-info":
-        return True
-    if a.quality.completeness < 50:
-        return True
-    if a.quality.reproducibility < 50:
-        return True
-    if a.quality.noise >= 70:
-        return True
-    if a.normalized.is_low_signal:
-        return True
-    return False
+    q = a.quality
+    return is_low_quality(
+        a.lifecycle.state == "needs-info", q.completeness, q.reproducibility, q.noise, a.normalized.is_low_signal
+    )
 
 
 def _missing_info(a: IssueAnalysis) -> list[str]:
@@ -2,13 +2,14 @@ from __future__ import annotations
 
 import re
 
+from ..interning import folded
 from ..models import NormalizedIssue, TriageClassification
 
 
 def classify_issue(n: NormalizedIssue) -> TriageClassification:
     title = (n.issue.title or "").lower()
     body = (n.issue.body or "").lower()
-    labels = {l.name.lower() for l in n.issue.labels}
+    labels = {folded(l.name) for l in n.issue.labels}
 
     reasons: list[str] = []
 
@@ -22,33 +22,19 @@ def build_weekly_digest(*, run: AnalysisRun, now: datetime | None = None, limits
 
     since = now2 - timedelta(days=int(limits.lookback_days))
 
-    recent = []
-    for a in run.issues:
-        i = a.normalized.issue
-        ts = i.updated_at or i.created_at
-        if ts is None:
-            continue
-        ts2 = ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
-        if ts2 >= since:
-            recent.append(a)
-
-    recent.sort(key=lambda a: ((a.normalized.issue.updated_at or a.normalized.issue.created_at or now2).isoformat(), a.issue_number))
-
-    counts_by_triage: dict[str, int] = {}
-    counts_by_lifecycle: dict[str, int] = {}
-    high_cost: list[int] = []
-    needs_info: list[int] = []
-
-    for a in recent:
-        counts_by_triage[a.triage.category] = counts_by_triage.get(a.triage.category, 0) + 1
-        counts_by_lifecycle[a.lifecycle.state] = counts_by_lifecycle.get(a.lifecycle.state, 0) + 1
-        if a.maintainer_cost.level == "high":
-            high_cost.append(a.issue_number)
-        if a.lifecycle.state == "needs-info":
-            needs_info.append(a.issue_number)
-
-    high_cost = high_cost[: limits.max_items_per_section]
-    needs_info = needs_info[: limits.max_items_per_section]
+    t = run.table
+    # NaN (no timestamp) compares false, so undated issues are never recent.
+    since_epoch = since.timestamp()
+    rows = [r for r, ts in enumerate(t.activity_at) if ts >= since_epoch]
+
+    rows.sort(key=lambda r: (t.activity_at[r], t.numbers[r]))
+
+    counts_by_triage = t.triage_counts(rows)
+    counts_by_lifecycle = t.lifecycle_counts(rows)
+    high_cost_mask = t.high_cost_mask()
+    needs_info_mask = t.lifecycle_mask("needs-info")
+    high_cost = [t.numbers[r] for r in rows if high_cost_mask[r]][: limits.max_items_per_section]
+    needs_info = [t.numbers[r] for r in rows if needs_info_mask[r]][: limits.max_items_per_section]
 
     return {
         "generated_at": now2.isoformat(),
@@ -58,7 +44,7 @@ def build_weekly_digest(*, run: AnalysisRun, now: datetime | None = None, limits
             "until": now2.isoformat(),
             "lookback_days": int(limits.lookback_days),
         },
-        "recent_issue_count": len(recent),
+        "recent_issue_count": len(rows),
         "counts_by_triage": dict(sorted(counts_by_triage.items())),
         "counts_by_lifecycle": dict(sorted(counts_by_lifecycle.items())),
         "high_cost_issues": high_cost,
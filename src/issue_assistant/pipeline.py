@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 
 from .models import (
     AnalysisRun,
@@ -22,6 +23,10 @@ from .phases.normalization import normalize_issue
 from .phases.quality_breakdown import score_quality_breakdown
 from .phases.triage import classify_issue
 
+if TYPE_CHECKING:
+    from .github import GitHubRepoRef
+    from .github_async import AsyncGitHubClient
+
 
 def analyze_issues(
     *,
@@ -30,8 +35,11 @@ def analyze_issues(
     pull_requests: list["PullRequest"] | None = None,
     commits: list["Commit"] | None = None,
     governance_mode: str = "dry-run",
+    normalized: list[NormalizedIssue] | None = None,
 ) -> AnalysisRun:
-    normalized = [normalize_issue(i) for i in issues]
+    # Callers that ingest incrementally may hand over issues they already normalized.
+    if normalized is None:
+        normalized = [normalize_issue(i) for i in issues]
     quality = {n.issue.number: score_quality_breakdown(n) for n in normalized}
     triage = {n.issue.number: classify_issue(n) for n in normalized}
     lifecycle = {n.issue.number: classify_lifecycle(normalized=n, quality=quality[n.issue.number], triage=triage[n.issue.number]) for n in normalized}
@@ -74,5 +82,44 @@ def analyze_issues(
     )
 
 
+async def analyze_issues_async(
+    *,
+    client: "AsyncGitHubClient",
+    repo: "GitHubRepoRef",
+    state: str = "open",
+    limit: int = 200,
+    include_pull_requests: bool = False,
+    include_comments: bool = True,
+    pull_requests: list["PullRequest"] | None = None,
+    commits: list["Commit"] | None = None,
+    governance_mode: str = "dry-run",
+) -> AnalysisRun:
+    """Fetch issues with an async client and normalize each one as soon as it arrives.
+
+    Normalization of early pages overlaps with downloads of later pages and comment threads;
+    the cross-issue phases (duplicates, dependencies) run once the listing is complete.
+    """
+    issues: list[Issue] = []
+    normalized: list[NormalizedIssue] = []
+    async for issue in client.iter_issues(
+        repo,
+        state=state,
+        limit=limit,
+        include_pull_requests=include_pull_requests,
+        include_comments=include_comments,
+    ):
+        issues.append(issue)
+        normalized.append(normalize_issue(issue))
+
+    return analyze_issues(
+        issues=issues,
+        repo=f"{repo.owner}/{repo.name}",
+        pull_requests=pull_requests,
+        commits=commits,
+        governance_mode=governance_mode,
+        normalized=normalized,
+    )
+
+
 def _actions(n: NormalizedIssue, q: QualityBreakdown, t: TriageClassification) -> MaintainerAction:
     return recommend_actions(normalized=n, quality=q, triage=t)
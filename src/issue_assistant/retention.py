@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from typing import Any
+
+RAW_RETENTION_POLICIES = ("none", "minimal", "full")
+# Large runs are dominated by payloads no phase reads; keep only what ingestion itself uses.
+DEFAULT_RAW_RETENTION = "minimal"
+
+# Payload keys kept under every policy: the comment count drives comment-fetch planning in the
+# client and the mirror, so "none" must not lose it.
+PLANNING_RAW_KEYS = ("comments",)
+
+# Payload keys kept under "minimal": identifiers and links, plus the fields ingestion reads back
+# (the comment count drives comment-fetch planning; "pull_request" marks /issues items as PRs).
+MINIMAL_RAW_KEYS = (
+    "number",
+    "sha",
+    "html_url",
+    "comments",
+    "pull_request",
+    "draft",
+    "state_reason",
+    "author_association",
+)
+
+
+def validate_raw_retention(policy: str) -> str:
+    if policy not in RAW_RETENTION_POLICIES:
+        raise ValueError(f"raw_retention must be one of: {', '.join(RAW_RETENTION_POLICIES)}")
+    return policy
+
+
+def retain_raw(raw: dict[str, Any], policy: str) -> dict[str, Any]:
+    """The part of an API payload a parsed model keeps as ``raw`` under ``policy``."""
+    if policy == "full":
+        return raw
+    if policy == "none":
+        return {k: raw[k] for k in PLANNING_RAW_KEYS if k in raw}
+    return {k: raw[k] for k in MINIMAL_RAW_KEYS if k in raw}
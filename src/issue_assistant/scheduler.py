@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import random
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Mapping
+
+_REPO_PATH_RE = re.compile(r"/repos/([^/]+/[^/?#]+)")
+_REPO_QUALIFIER_RE = re.compile(r"(?:^|\s)repo:(\S+)")
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 6
+    base_delay_seconds: float = 1.0
+    max_delay_seconds: float = 60.0
+    # Primary-limit resets can be up to an hour away; waiting longer than this fails the request instead.
+    max_rate_limit_wait_seconds: float = 3600.0
+    retry_statuses: tuple[int, ...] = (500, 502, 503, 504)
+    # Start spreading requests over the reset window once the remaining budget drops below this.
+    pacing_threshold: int = 100
+    # Consecutive successes needed before concurrency is raised again after an abuse limit.
+    recovery_successes: int = 50
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+@dataclass
+class RateBudget:
+    limit: int | None = None
+    remaining: int | None = None
+    used: int | None = None
+    reset_at: float | None = None
+
+
+def rate_limit_resource(url: str) -> str:
+    """Best-effort guess of the GitHub rate-limit bucket a request will be charged to."""
+    if "/search/" in url:
+        return "search"
+    if url.rstrip("/").endswith("/graphql"):
+        return "graphql"
+    return "core"
+
+
+def fairness_key(url: str, params: Mapping[str, Any] | None = None) -> str:
+    """Repository a request works for (``owner/name``), used to share slots fairly across repos.
+
+    REST routes carry it in the path and search queries in a ``repo:`` qualifier; anything else
+    (GraphQL, unscoped endpoints) shares the empty key.
+    """
+    m = _REPO_PATH_RE.search(url)
+    if m:
+        return m.group(1).lower()
+    q = (params or {}).get("q")
+    m = _REPO_QUALIFIER_RE.search(str(q)) if q else None
+    return m.group(1).lower() if m else ""
+
+
+class RequestScheduler:
+    """Rate-limit-aware pacing, retry and adaptive concurrency for GitHub API requests.
+
+    The scheduler never performs I/O itself: callers ask it how long to wait before a request
+    (``pacing_delay``), report every response (``observe``) and ask whether/when to retry
+    (``retry_delay``). That keeps the policy shared between sync and async clients.
+
+    When slots are contended they are handed out round-robin across fairness keys (one per
+    repository), so a client shared by many repos does not let one large repo starve the rest.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 1,
+        policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+        clock: Callable[[], float] = time.time,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self.policy = policy
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.concurrency = self.max_concurrency
+        self._clock = clock
+        self._rng = rng
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        # Waiters per fairness key, and the order keys take turns in.
+        self._waiting: dict[str, deque[object]] = {}
+        self._turns: deque[str] = deque()
+        self._successes = 0
+        self._budgets: dict[str, RateBudget] = {}
+        self._next_slot: dict[str, float] = {}
+
+    @contextmanager
+    def slot(self, key: str = "") -> Iterator[None]:
+        self.acquire(key)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def acquire(self, key: str = "") -> None:
+        with self._cond:
+            if self._in_flight < self.concurrency and not self._turns:
+                self._in_flight += 1
+                return
+            ticket = object()
+            queue = self._waiting.get(key)
+            if queue is None:
+                queue = self._waiting[key] = deque()
+                self._turns.append(key)
+            queue.append(ticket)
+            while not (self._in_flight < self.concurrency and self._turns[0] == key and queue[0] is ticket):
+                self._cond.wait()
+            queue.popleft()
+            self._turns.popleft()
+            if queue:
+                self._turns.append(key)
+            else:
+                del self._waiting[key]
+            self._in_flight += 1
+            self._cond.notify_all()
+
+    def release(self) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def budget(self, resource: str = "core") -> RateBudget:
+        with self._cond:
+            b = self._budgets.get(resource) or RateBudget()
+            return RateBudget(limit=b.limit, remaining=b.remaining, used=b.used, reset_at=b.reset_at)
+
+    def pacing_delay(self, resource: str = "core") -> float:
+        now = self._clock()
+        with self._cond:
+            b = self._budgets.get(resource)
+            if b is None or b.remaining is None or b.reset_at is None or b.reset_at <= now:
+                return 0.0
+            window = b.reset_at - now
+            if b.remaining <= 0:
+                return window + 1.0
+            if b.remaining > self.policy.pacing_threshold:
+                return 0.0
+            # Spread what is left of the budget evenly over the rest of the window.
+            spacing = window / b.remaining
+            slot = max(now, self._next_slot.get(resource, now))
+            self._next_slot[resource] = slot + spacing
+            b.remaining -= 1
+            return slot - now
+
+    def observe(self, status: int, headers: Mapping[str, str], body: str = "") -> None:
+        resource = str(headers.get("X-RateLimit-Resource") or "core")
+        with self._cond:
+            b = self._budgets.setdefault(resource, RateBudget())
+            b.limit = _opt_int(headers.get("X-RateLimit-Limit"), b.limit)
+            b.remaining = _opt_int(headers.get("X-RateLimit-Remaining"), b.remaining)
+            b.used = _opt_int(headers.get("X-RateLimit-Used"), b.used)
+            reset = _opt_int(headers.get("X-RateLimit-Reset"), None)
+            if reset is not None:
+                b.reset_at = float(reset)
+
+            if _is_secondary_limit(status, headers, body):
+                # Multiplicative decrease on secondary limits, additive increase once things calm down.
+                self.concurrency = max(1, self.concurrency // 2)
+                self._successes = 0
+            elif status < 400:
+                self._successes += 1
+                if self.concurrency < self.max_concurrency and self._successes >= self.policy.recovery_successes:
+                    self.concurrency += 1
+                    self._successes = 0
+                    self._cond.notify_all()
+
+    def retry_delay(
+        self,
+        *,
+        attempt: int,
+        status: int | None = None,
+        headers: Mapping[str, str] | None = None,
+        body: str = "",
+    ) -> float | None:
+        """Seconds to wait before retrying, or None when the outcome is final.
+
+        ``status=None`` means the request failed at the transport level (connection reset, timeout).
+        """
+        if attempt + 1 >= self.policy.max_attempts:
+            return None
+
+        hdrs = headers or {}
+        if status is not None and status in (403, 429):
+            retry_after = _opt_int(hdrs.get("Retry-After"), None)
+            if retry_after is not None:
+                return self._capped(float(retry_after) + self._rng())
+            if str(hdrs.get("X-RateLimit-Remaining") or "") == "0":
+                reset = _opt_int(hdrs.get("X-RateLimit-Reset"), None)
+                wait = (float(reset) - self._clock() + 1.0) if reset is not None else 60.0
+                return self._capped(max(1.0, wait))
+            if "secondary rate limit" in (body or "").lower():
+                # GitHub asks for at least a minute when no Retry-After is sent.
+                return self._capped(60.0 + self._backoff(attempt))
+            return None
+
+        if status is None or status in self.policy.retry_statuses:
+            return self._backoff(attempt)
+
+        return None
+
+    def _backoff(self, attempt: int) -> float:
+        # Full jitter keeps concurrent workers from retrying in lockstep.
+        ceiling = min(self.policy.max_delay_seconds, self.policy.base_delay_seconds * (2**attempt))
+        return self._rng() * ceiling
+
+    def _capped(self, wait: float) -> float | None:
+        if wait > self.policy.max_rate_limit_wait_seconds:
+            return None
+        return wait
+
+
+def _is_secondary_limit(status: int, headers: Mapping[str, str], body: str) -> bool:
+    if status not in (403, 429):
+        return False
+    return headers.get("Retry-After") is not None or "secondary rate limit" in (body or "").lower()
+
+
+def _opt_int(v: object, default: int | None) -> int | None:
+    if v is None:
+        return default
+    try:
+        return int(str(v).strip())
+    except ValueError:
+        return default
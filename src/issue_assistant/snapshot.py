@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import dataclasses
+import marshal
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator, Sequence, overload
+
+from .interning import InternTable
+from .issue_table import IssueTable
+from .models import (
+    AnalysisRun,
+    DependencyEndpoint,
+    DependencyLink,
+    DuplicateLink,
+    Issue,
+    IssueAnalysis,
+    IssueAuthor,
+    IssueComment,
+    IssueLabel,
+    LifecycleClassification,
+    MaintainerAction,
+    MaintainerCostEstimate,
+    NormalizedIssue,
+    QualityBreakdown,
+    TriageClassification,
+)
+
+# Snapshots are decoded with ``marshal``, which is not safe against maliciously crafted input:
+# only load snapshots this tool wrote locally, never ones from an untrusted source.
+SNAPSHOT_FILENAME = "run.snapshot"
+SNAPSHOT_VERSION = 1
+
+_MAGIC = b"IASNAP\r\n"
+# magic, format version, marshal version, issue count, meta length, table length
+_HEADER = struct.Struct("<8sHHIQQ")
+
+
+def write_snapshot(run: AnalysisRun, path: Path) -> None:
+    """Write ``run`` as a binary snapshot that :class:`RunSnapshot` reads back without JSON parsing.
+
+    Layout: a fixed header, a marshalled block with the run metadata, dependency links and the
+    author and label tables every record indexes into, the
+    run's :class:`IssueTable` columns as little-endian array bytes, an offset index, then one
+    marshalled record per issue analysis. The index lets a reader decode single analyses straight
+    from a memory map.
+    """
+    refs = _Refs()
+    records = [marshal.dumps(_encode_analysis(a, refs), marshal.version) for a in run.issues]
+    offsets = array("Q", [0])
+    for r in records:
+        offsets.append(offsets[-1] + len(r))
+    meta = marshal.dumps(
+        (
+            run.generated_at.isoformat(),
+            run.repo,
+            run.governance_mode,
+            tuple(_encode_dependency(d) for d in run.dependencies),
+            tuple(refs.authors),
+            tuple(refs.labels),
+        ),
+        marshal.version,
+    )
+    table = marshal.dumps(_encode_table(run.table), marshal.version)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=".tmp-", suffix=path.suffix)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, SNAPSHOT_VERSION, marshal.version, len(records), len(meta), len(table)))
+            f.write(meta)
+            f.write(table)
+            f.write(_le_bytes(offsets))
+            f.writelines(records)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def load_snapshot(path: Path) -> AnalysisRun:
+    """Decode a whole snapshot into an :class:`AnalysisRun` (its ``table`` comes prebuilt).
+
+    This costs about as much as parsing ``issues.json``; readers that need the table or a few
+    analyses should use :class:`RunSnapshot` instead. ``path`` must be trusted local output.
+    """
+    with RunSnapshot(path) as snapshot:
+        return snapshot.run()
+
+
+class RunSnapshot:
+    """Memory-mapped, lazily decoded view of a snapshot written by :func:`write_snapshot`.
+
+    Opening reads only the header, the run metadata and the table columns, so aggregate questions
+    (``table``, ``numbers``) need no per-issue decoding. Individual analyses are decoded on access
+    and share one author and label instance per distinct value, as after ingest. Snapshots
+    from another format or marshal version raise ``ValueError``: re-run the analysis to refresh.
+    Like :func:`load_snapshot`, only open snapshots written locally by a trusted run.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            try:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file
+                raise ValueError(f"{self.path}: not an issue-assistant snapshot") from None
+        try:
+            self._open()
+        except BaseException:
+            self._map.close()
+            raise
+
+    def _open(self) -> None:
+        # Released on exit, so the map can be closed even when opening fails.
+        with memoryview(self._map) as buf:
+            self._read_index(buf)
+
+    def _read_index(self, buf: memoryview) -> None:
+        if len(buf) < _HEADER.size:
+            raise ValueError(f"{self.path}: not an issue-assistant snapshot")
+        magic, version, marshal_version, count, meta_len, table_len = _HEADER.unpack_from(buf)
+        if magic != _MAGIC:
+            raise ValueError(f"{self.path}: not an issue-assistant snapshot")
+        if version != SNAPSHOT_VERSION or marshal_version != marshal.version:
+            raise ValueError(
+                f"{self.path}: snapshot format {version}/{marshal_version} is not readable by this version "
+                f"(expects {SNAPSHOT_VERSION}/{marshal.version}); re-run the analysis to refresh it"
+            )
+
+        pos = _HEADER.size
+        index_end = pos + meta_len + table_len + (count + 1) * 8
+        if len(buf) < index_end:
+            raise ValueError(f"{self.path}: snapshot is truncated")
+        generated_at, repo, governance_mode, dependencies, authors, labels = marshal.loads(buf[pos : pos + meta_len])
+        pos += meta_len
+        self.table: IssueTable = _decode_table(marshal.loads(buf[pos : pos + table_len]))
+        pos += table_len
+        self._offsets = _from_le_bytes("Q", buf[pos:index_end])
+        self._base = index_end
+        if len(buf) < self._base + self._offsets[-1]:
+            raise ValueError(f"{self.path}: snapshot is truncated")
+
+        self.generated_at = datetime.fromisoformat(generated_at)
+        self.repo: str | None = repo
+        self.governance_mode: str = governance_mode
+        self.dependencies = tuple(_decode_dependency(d) for d in dependencies)
+        self._interner = InternTable()
+        self._authors: list[IssueAuthor | None] = [self._interner.author(login, id) for login, id in authors]
+        self._authors.append(None)
+        self._labels = [self._interner.label(name) for name in labels]
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __enter__(self) -> "RunSnapshot":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[IssueAnalysis]:
+        return (self.analysis(i) for i in range(len(self)))
+
+    @property
+    def numbers(self) -> array:
+        return self.table.numbers
+
+    def analysis(self, row: int) -> IssueAnalysis:
+        """Decode the analysis at ``row`` (run order)."""
+        start = self._base + self._offsets[row]
+        end = self._base + self._offsets[row + 1]
+        return _decode_analysis(marshal.loads(self._map[start:end]), self._authors, self._labels, self._interner)
+
+    def run(self, *, lazy: bool = False) -> AnalysisRun:
+        """The snapshot as an :class:`AnalysisRun`.
+
+        With ``lazy=True`` its ``issues`` decode each analysis on first access (and keep it), so
+        consumers that only read ``table`` decode nothing; such a run is only usable while the
+        snapshot is open.
+        """
+        run = AnalysisRun(
+            generated_at=self.generated_at,
+            repo=self.repo,
+            issues=_LazyAnalyses(self) if lazy else tuple(self),  # type: ignore[arg-type]
+            dependencies=self.dependencies,
+            governance_mode=self.governance_mode,
+        )
+        object.__setattr__(run, "_table", self.table)
+        return run
+
+    def close(self) -> None:
+        self._map.close()
+
+
+class _LazyAnalyses(Sequence[IssueAnalysis]):
+    def __init__(self, snapshot: RunSnapshot) -> None:
+        self._snapshot = snapshot
+        self._decoded: list[IssueAnalysis | None] = [None] * len(snapshot)
+
+    def __len__(self) -> int:
+        return len(self._decoded)
+
+    @overload
+    def __getitem__(self, row: int) -> IssueAnalysis: ...
+
+    @overload
+    def __getitem__(self, row: slice) -> list[IssueAnalysis]: ...
+
+    def __getitem__(self, row: int | slice) -> IssueAnalysis | list[IssueAnalysis]:
+        if isinstance(row, slice):
+            return [self[r] for r in range(*row.indices(len(self)))]
+        found = self._decoded[row]
+        if found is None:
+            found = self._decoded[row] = self._snapshot.analysis(row % len(self))
+        return found
+
+
+def _le_bytes(a: array) -> bytes:
+    if sys.byteorder == "big":
+        a = array(a.typecode, a)
+        a.byteswap()
+    return a.tobytes()
+
+
+def _from_le_bytes(typecode: str, data: Any) -> array:
+    a = array(typecode)
+    a.frombytes(data)
+    if sys.byteorder == "big":
+        a.byteswap()
+    return a
+
+
+def _encode_table(table: IssueTable) -> tuple[dict[str, Any], dict[str, Any]]:
+    columns: dict[str, Any] = {}
+    values: dict[str, Any] = {}
+    for f in dataclasses.fields(table):
+        v = getattr(table, f.name)
+        if isinstance(v, array):
+            columns[f.name] = (v.typecode, _le_bytes(v))
+        else:
+            values[f.name] = v
+    return columns, values
+
+
+def _decode_table(encoded: tuple[dict[str, Any], dict[str, Any]]) -> IssueTable:
+    columns, values = encoded
+    return IssueTable(**{k: _from_le_bytes(typecode, data) for k, (typecode, data) in columns.items()}, **values)
+
+
+def _dt(dt: datetime | None) -> str | None:
+    return dt.isoformat() if dt is not None else None
+
+
+class _Refs:
+    """Author and label tables shared by all records; records store indexes into them."""
+
+    def __init__(self) -> None:
+        self.authors: dict[tuple[str, int | None], int] = {}
+        self.labels: dict[str, int] = {}
+
+    def author(self, a: IssueAuthor | None) -> int:
+        # -1 is None; decoding appends None to the author list so the index works as is.
+        if a is None:
+            return -1
+        return self.authors.setdefault((a.login, a.id), len(self.authors))
+
+    def label(self, name: str) -> int:
+        return self.labels.setdefault(name, len(self.labels))
+
+
+def _encode_analysis(a: IssueAnalysis, refs: _Refs) -> tuple[Any, ...]:
+    n = a.normalized
+    i = n.issue
+    q = a.quality
+    d = a.duplicates
+    m = a.maintainer_action
+    return (
+        a.issue_number,
+        (
+            i.number,
+            i.title,
+            i.body,
+            refs.author(i.author),
+            tuple(refs.label(l.name) for l in i.labels),
+            i.state,
+            _dt(i.created_at),
+            _dt(i.updated_at),
+            _dt(i.closed_at),
+            tuple((c.id, refs.author(c.author), c.body, _dt(c.created_at), _dt(c.updated_at)) for c in i.comments),
+            i.raw,
+        ),
+        (n.normalized_title, n.sections, n.is_low_signal, n.low_signal_reasons),
+        (q.completeness, q.clarity, q.reproducibility, q.noise, q.reasons),
+        (a.triage.category, a.triage.confidence, a.triage.reasons),
+        (a.lifecycle.state, a.lifecycle.confidence, a.lifecycle.reasons),
+        (a.maintainer_cost.level, a.maintainer_cost.reasons, a.maintainer_cost.signals),
+        None if d is None else (d.issue_number, d.likely_duplicates_of, d.similarity_reasons),
+        (m.recommended_actions, m.recommended_labels, m.recommended_assignees, m.notes),
+    )
+
+
+def _decode_analysis(
+    rec: tuple[Any, ...], authors: list[IssueAuthor | None], labels: list[IssueLabel], interner: InternTable
+) -> IssueAnalysis:
+    number, issue, normalized, quality, triage, lifecycle, cost, duplicates, action = rec
+    inum, title, body, author, label_refs, state, created_at, updated_at, closed_at, comments, raw = issue
+    parse_dt = datetime.fromisoformat
+
+    return IssueAnalysis(
+        issue_number=number,
+        normalized=NormalizedIssue(
+            issue=Issue(
+                number=inum,
+                title=title,
+                body=body,
+                author=authors[author],
+                labels=tuple(labels[l] for l in label_refs),
+                state=interner.string(state),
+                created_at=created_at and parse_dt(created_at),
+                updated_at=updated_at and parse_dt(updated_at),
+                closed_at=closed_at and parse_dt(closed_at),
+                comments=tuple(
+                    IssueComment(
+                        id=cid,
+                        author=authors[ca],
+                        body=cb,
+                        created_at=cc and parse_dt(cc),
+                        updated_at=cu and parse_dt(cu),
+                    )
+                    for cid, ca, cb, cc, cu in comments
+                ),
+                raw=raw,
+            ),
+            normalized_title=normalized[0],
+            sections=normalized[1],
+            is_low_signal=normalized[2],
+            low_signal_reasons=normalized[3],
+        ),
+        quality=QualityBreakdown(*quality),
+        triage=TriageClassification(*triage),
+        lifecycle=LifecycleClassification(*lifecycle),
+        maintainer_cost=MaintainerCostEstimate(*cost),
+        duplicates=None if duplicates is None else DuplicateLink(*duplicates),
+        maintainer_action=MaintainerAction(*action),
+    )
+
+
+def _encode_dependency(d: DependencyLink) -> tuple[Any, ...]:
+    return (
+        (d.source.kind, d.source.repo, d.source.identifier),
+        (d.target.kind, d.target.repo, d.target.identifier),
+        d.reference_type,
+        d.evidence,
+        d.reasons,
+    )
+
+
+def _decode_dependency(rec: tuple[Any, ...]) -> DependencyLink:
+    source, target, reference_type, evidence, reasons = rec
+    return DependencyLink(
+        source=DependencyEndpoint(*source),
+        target=DependencyEndpoint(*target),
+        reference_type=reference_type,
+        evidence=evidence,
+        reasons=reasons,
+    )
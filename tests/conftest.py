@@ -1,9 +1,83 @@
 from __future__ import annotations
 
+import json
 import sys
 from pathlib import Path
+from typing import Any, Iterator
+
+import requests
+from requests.structures import CaseInsensitiveDict
 
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+from issue_assistant.github import GitHubClient
+
+
+class FakeResponse:
+    """``requests.Response`` stand-in shared by the GitHub client tests.
+
+    The body is ``payload`` serialized as JSON unless raw ``body`` bytes or ``text`` are given;
+    ``iter_content`` streams it in chunks like a response opened with ``stream=True``.
+    """
+
+    def __init__(
+        self,
+        payload: Any = None,
+        headers: dict[str, str] | None = None,
+        *,
+        status_code: int = 200,
+        body: bytes | None = None,
+        text: str | None = None,
+    ) -> None:
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+        if body is None:
+            body = text.encode("utf-8") if text is not None else json.dumps(payload).encode("utf-8")
+        self.content = body
+        self.closed = False
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}")
+
+    def iter_content(self, chunk_size: int = 1) -> Iterator[bytes]:
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i : i + chunk_size]
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeSession:
+    """``requests.Session`` stand-in; subclasses answer requests by overriding ``get``/``post``."""
+
+    def __init__(self) -> None:
+        self.headers: dict[str, str] = {}
+
+    def get(self, url: str, params: dict[str, Any] | None = None, **kwargs: Any) -> FakeResponse:
+        raise AssertionError(f"unexpected GET {url}")
+
+    def post(self, url: str, **kwargs: Any) -> FakeResponse:
+        raise AssertionError(f"unexpected POST {url}")
+
+    def mount(self, prefix: str, adapter: Any) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def make_client(session: FakeSession, **kwargs: Any) -> GitHubClient:
+    """A ``GitHubClient`` for ``https://api.test`` that sends every request through ``session``."""
+    kwargs.setdefault("base_url", "https://api.test")
+    return GitHubClient(token="t", session=session, **kwargs)  # type: ignore[arg-type]
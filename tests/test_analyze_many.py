@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+import issue_assistant.cli as cli
+from issue_assistant.github import GitHubRepoRef
+from issue_assistant.http_metrics import HttpMetrics
+from issue_assistant.models import Issue, IssueAuthor
+from issue_assistant.scheduler import RequestScheduler, fairness_key
+
+
+class FakeGitHubClient:
+    def __init__(self) -> None:
+        self.api_call_counts: dict[str, int] = {"issues_list": 0}
+        self.metrics = HttpMetrics()
+        self.checkpoint = None
+        self.listed: list[str] = []
+        self.forgotten: list[str] = []
+        self._lock = threading.Lock()
+
+    def list_issues(self, repo: GitHubRepoRef, **kwargs: object) -> list[Issue]:
+        with self._lock:
+            self.api_call_counts["issues_list"] += 1
+            self.listed.append(f"{repo.owner}/{repo.name}")
+        if repo.name == "missing":
+            raise RuntimeError("404 Not Found")
+        now = datetime(2026, 1, 15, tzinfo=timezone.utc)
+        return [Issue(number=1, title=f"Bug in {repo.name}", body="", author=IssueAuthor(login="u"), created_at=now)]
+
+    def forget_repo(self, repo: GitHubRepoRef) -> None:
+        with self._lock:
+            self.forgotten.append(f"{repo.owner}/{repo.name}")
+
+
+def test_fairness_key_identifies_the_repository() -> None:
+    assert fairness_key("https://api.github.com/repos/Octo/Cat/issues/3/comments") == "octo/cat"
+    assert fairness_key("https://ghe.test/api/v3/repos/o/r/issues") == "o/r"
+    assert fairness_key("https://api.github.com/search/issues", {"q": "repo:o/r is:issue"}) == "o/r"
+    assert fairness_key("https://api.github.com/graphql") == ""
+
+
+def test_contended_slots_rotate_across_keys() -> None:
+    scheduler = RequestScheduler(max_concurrency=1)
+    scheduler.acquire("a")
+    order: list[str] = []
+
+    def worker(name: str, key: str) -> None:
+        with scheduler.slot(key):
+            order.append(name)
+
+    threads = []
+    for name, key in (("a1", "a"), ("a2", "a"), ("a3", "a"), ("b1", "b")):
+        t = threading.Thread(target=worker, args=(name, key))
+        t.start()
+        threads.append(t)
+        # Queue the workers in a known order.
+        while sum(len(q) for q in scheduler._waiting.values()) < len(threads):
+            time.sleep(0.001)
+
+    scheduler.release()
+    for t in threads:
+        t.join(timeout=5)
+
+    assert order == ["a1", "b1", "a2", "a3"]
+
+
+def test_analyze_many_writes_one_tree_per_repo_with_a_shared_client(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    fake = FakeGitHubClient()
+    created: list[object] = []
+
+    def factory(token: str, **kwargs: object) -> FakeGitHubClient:
+        created.append(fake)
+        return fake
+
+    monkeypatch.setattr(cli, "GitHubClient", factory)
+    repos_file = tmp_path / "repos.txt"
+    repos_file.write_text("# fleet\no/alpha\n\no/beta  # second\nO/Alpha\no/missing\n", encoding="utf-8")
+    out = tmp_path / "out"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "issue-assistant",
+            "analyze-many",
+            "--github-token",
+            "t",
+            "--repos-file",
+            str(repos_file),
+            "--output-root",
+            str(out),
+            "--comments-mode",
+            "none",
+            "--http-metrics",
+            str(tmp_path / "metrics" / "http_metrics.json"),
+        ],
+    )
+
+    with pytest.raises(SystemExit) as exc:
+        cli.main()
+
+    assert "1 of 3 repositories failed: o/missing" in str(exc.value)
+    assert "o/missing: failed: 404 Not Found" in capsys.readouterr().err
+    assert len(created) == 1
+    assert sorted(fake.listed) == ["o/alpha", "o/beta", "o/missing"]
+    # Every repo's cached state is released, including the one that failed.
+    assert sorted(fake.forgotten) == ["o/alpha", "o/beta", "o/missing"]
+    for name in ("alpha", "beta"):
+        payload = json.loads((out / "o" / name / ".issue-assistant" / "issues.json").read_text(encoding="utf-8"))
+        assert [x["issue"]["title"] for x in payload["issues"]] == [f"Bug in {name}"]
+    assert not (out / "o" / "missing" / ".issue-assistant").exists()
+    assert not (out / "http_metrics.json").exists()
+    metrics = json.loads((tmp_path / "metrics" / "http_metrics.json").read_text(encoding="utf-8"))
+    assert metrics["api_call_counts"] == {"issues_list": 3}
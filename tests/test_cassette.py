@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from issue_assistant.cassette import CassetteMissError, RecordingSession, ReplaySession, parse_latency
+from issue_assistant.github import GitHubClient, GitHubRepoRef
+from tests.conftest import FakeResponse, FakeSession
+
+
+class LiveSession(FakeSession):
+    """Stands in for the network behind the recorder: two listing pages plus comment threads."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.requests = 0
+
+    def request(self, method: str, url: str, params: dict[str, Any] | None = None, **kwargs: Any) -> FakeResponse:
+        self.requests += 1
+        p = dict(params or {})
+        if url.endswith("/issues"):
+            page = int(p["page"])
+            numbers = range(150, 50, -1) if page == 1 else range(50, 0, -1)
+            link = {"Link": '<https://api.test/repos/o/r/issues?page=2>; rel="last"'} if page == 1 else {}
+            items = [{"number": n, "title": f"I{n}", "body": "", "state": "open", "comments": 1 if n % 50 == 0 else 0} for n in numbers]
+            return FakeResponse(items, {"X-RateLimit-Remaining": "4000", **link})
+        n = int(url.rsplit("/", 2)[-2])
+        return FakeResponse([{"id": n, "body": "c", "user": {"login": "u", "id": 1}}], {})
+
+
+def _list(session: Any) -> list[tuple[int, int]]:
+    gh = GitHubClient(token="secret-token", base_url="https://api.test", http_concurrency=4, session=session)
+    issues = gh.list_issues(GitHubRepoRef(owner="o", name="r"), limit=500)
+    return [(i.number, len(i.comments)) for i in issues]
+
+
+def test_replay_reproduces_a_recorded_run_offline(tmp_path: Path) -> None:
+    cassette = tmp_path / "run.jsonl"
+    live = LiveSession()
+    recorder = RecordingSession(cassette, session=live)
+    recorded = _list(recorder)
+    recorder.close()
+
+    text = cassette.read_text(encoding="utf-8")
+    assert "secret-token" not in text
+    assert len(text.splitlines()) == live.requests == 2 + 3
+
+    sleeps: list[float] = []
+    replayed = _list(ReplaySession(cassette, latency=0.25, sleep=sleeps.append))
+
+    assert replayed == recorded
+    assert len(recorded) == 150
+    assert sleeps == [0.25] * 5
+
+
+def test_unrecorded_request_is_a_miss(tmp_path: Path) -> None:
+    cassette = tmp_path / "empty.jsonl"
+    cassette.write_text("", encoding="utf-8")
+    gh = GitHubClient(token="t", base_url="https://api.test", session=ReplaySession(cassette))
+
+    with pytest.raises(CassetteMissError):
+        gh.get_issue(GitHubRepoRef(owner="o", name="r"), 1)
+
+
+def test_parse_latency() -> None:
+    assert parse_latency("recorded") == "recorded"
+    assert parse_latency("0.5") == 0.5
+    with pytest.raises(ValueError):
+        parse_latency("-1")
@@ -9,6 +9,7 @@ import pytest
 
 import issue_assistant.cli as cli
 from issue_assistant.github import GitHubRepoRef
+from issue_assistant.http_metrics import HttpMetrics
 from issue_assistant.models import Issue, IssueAuthor
 
 
@@ -24,6 +25,8 @@ class FakeGitHubClient:
             "issue_comments_list": 0,
             "issue_comment_create": 0,
         }
+        self.metrics = HttpMetrics()
+        self.checkpoint = None
 
     def list_issues(
         self,
@@ -33,6 +36,9 @@ class FakeGitHubClient:
         limit: int = 200,
         include_pull_requests: bool = False,
         include_comments: bool = True,
+        comments_strategy: str = "per-issue",
+        pull_request_filter: str = "client",
+        partition_by: str | None = None,
     ) -> list[Issue]:
         self.calls["issues_list"] += 1
         self.api_call_counts["issues_list"] += 1
@@ -72,7 +78,7 @@ class FakeGitHubClient:
 
 def test_comments_mode_none_skips_comment_fetching(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     fake = FakeGitHubClient(token="t")
-    monkeypatch.setattr(cli, "GitHubClient", lambda token: fake)
+    monkeypatch.setattr(cli, "GitHubClient", lambda token, **kwargs: fake)
 
     out_dir = tmp_path / "out"
 
@@ -104,7 +110,7 @@ def test_comments_mode_none_skips_comment_fetching(tmp_path: Path, monkeypatch:
 
 def test_dry_run_never_posts_comment(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     fake = FakeGitHubClient(token="t")
-    monkeypatch.setattr(cli, "GitHubClient", lambda token: fake)
+    monkeypatch.setattr(cli, "GitHubClient", lambda token, **kwargs: fake)
 
     out_dir = tmp_path / "out"
 
@@ -137,7 +143,7 @@ def test_dry_run_never_posts_comment(tmp_path: Path, monkeypatch: pytest.MonkeyP
 
 def test_comments_mode_needed_fetches_when_comment_dependent_phase_enabled(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     fake = FakeGitHubClient(token="t")
-    monkeypatch.setattr(cli, "GitHubClient", lambda token: fake)
+    monkeypatch.setattr(cli, "GitHubClient", lambda token, **kwargs: fake)
 
     out_dir = tmp_path / "out"
 
@@ -169,7 +175,7 @@ def test_comments_mode_needed_skips_when_only_comment_independent_phases_enabled
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     fake = FakeGitHubClient(token="t")
-    monkeypatch.setattr(cli, "GitHubClient", lambda token: fake)
+    monkeypatch.setattr(cli, "GitHubClient", lambda token, **kwargs: fake)
 
     out_dir = tmp_path / "out"
 
@@ -201,7 +207,7 @@ def test_verbose_warns_when_comments_mode_none_but_comment_dependent_phase_enabl
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
 ) -> None:
     fake = FakeGitHubClient(token="t")
-    monkeypatch.setattr(cli, "GitHubClient", lambda token: fake)
+    monkeypatch.setattr(cli, "GitHubClient", lambda token, **kwargs: fake)
 
     out_dir = tmp_path / "out"
 
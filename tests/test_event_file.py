@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import issue_assistant.cli as cli
+from issue_assistant.github import GitHubClient
+from tests.conftest import FakeSession
+
+
+def _event(tmp_path: Path, *, comments: int) -> Path:
+    payload = {
+        "action": "opened",
+        "issue": {
+            "number": 42,
+            "title": "Crash on startup",
+            "body": "Traceback (most recent call last): ...",
+            "state": "open",
+            "user": {"login": "reporter", "id": 7},
+            "labels": [{"name": "bug"}],
+            "created_at": "2026-01-15T00:00:00Z",
+            "updated_at": "2026-01-15T00:00:00Z",
+            "comments": comments,
+        },
+        "repository": {"full_name": "o/r"},
+    }
+    path = tmp_path / "event.json"
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    return path
+
+
+def _run(monkeypatch: pytest.MonkeyPatch, *args: str) -> None:
+    monkeypatch.setattr(sys, "argv", ["issue-assistant", "analyze", *args])
+    cli.main()
+
+
+def test_event_issue_without_comments_needs_no_api_calls(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    clients: list[GitHubClient] = []
+
+    def make_client(token: str, **kwargs: Any) -> GitHubClient:
+        gh = GitHubClient(token=token, session=FakeSession(), **kwargs)  # type: ignore[arg-type]
+        clients.append(gh)
+        return gh
+
+    monkeypatch.setattr(cli, "GitHubClient", make_client)
+    out_dir = tmp_path / "out"
+
+    _run(
+        monkeypatch,
+        "--github-token",
+        "t",
+        "--event-file",
+        str(_event(tmp_path, comments=0)),
+        "--output-dir",
+        str(out_dir),
+        "--auto-comment",
+        "--governance-mode",
+        "dry-run",
+        "--http-metrics",
+        str(tmp_path / "http_metrics.json"),
+    )
+
+    assert clients[0].api_call_counts["http_get"] == 0
+    assert clients[0].api_call_counts["comment_fetch_skipped_empty"] == 1
+    # Per-run telemetry stays out of the artifact directory.
+    assert not (out_dir / "http_metrics.json").exists()
+    metrics = json.loads((tmp_path / "http_metrics.json").read_text(encoding="utf-8"))
+    assert metrics["totals"]["requests"] == 0
+    assert set(metrics["run"]) == {"fetch_seconds", "analyze_seconds", "write_seconds", "total_seconds"}
+    payload = json.loads((out_dir / "issues.json").read_text(encoding="utf-8"))
+    assert [int(x["issue"]["number"]) for x in payload["issues"]] == [42]
+
+
+def test_event_file_works_without_a_token(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    out_dir = tmp_path / "out"
+
+    _run(monkeypatch, "--event-file", str(_event(tmp_path, comments=3)), "--output-dir", str(out_dir))
+
+    payload = json.loads((out_dir / "issues.json").read_text(encoding="utf-8"))
+    assert [x["issue"]["title"] for x in payload["issues"]] == ["Crash on startup"]
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+import requests
+
+from issue_assistant.checkpoint import FetchCheckpoint
+from issue_assistant.github import GitHubRepoRef
+from issue_assistant.scheduler import RetryPolicy
+from tests.conftest import FakeResponse, FakeSession, make_client
+
+
+class PagedSession(FakeSession):
+    """250 issues in pages of 100; every 50th issue has one comment. ``fail_page`` drops the connection once."""
+
+    def __init__(self, *, fail_page: int | None = None) -> None:
+        super().__init__()
+        self.issues = [
+            {"number": n, "title": f"I{n}", "body": "", "state": "open", "comments": 1 if n % 50 == 0 else 0}
+            for n in range(250, 0, -1)
+        ]
+        self.fail_page = fail_page
+        self.requests: list[tuple[str, int]] = []
+
+    def get(self, url: str, params: dict[str, Any] | None = None, **kwargs: Any) -> FakeResponse:
+        page = int((params or {}).get("page") or 1)
+        path = url.split("/repos/o/r", 1)[1]
+        self.requests.append((path, page))
+        if page == self.fail_page:
+            self.fail_page = None
+            raise requests.ConnectionError("connection reset")
+        if path == "/issues":
+            per_page = int((params or {})["per_page"])
+            return FakeResponse(self.issues[(page - 1) * per_page : page * per_page])
+        number = int(path.split("/")[2])
+        return FakeResponse([{"id": number, "body": "thanks", "user": {"login": "u", "id": 1}}])
+
+
+
+def test_resume_continues_after_the_last_completed_page(tmp_path: Path) -> None:
+    path = tmp_path / "fetch.checkpoint"
+    repo = GitHubRepoRef(owner="o", name="r")
+
+    session = PagedSession(fail_page=3)
+    with pytest.raises(requests.ConnectionError):
+        make_client(session, retry_policy=RetryPolicy(max_attempts=1), checkpoint=FetchCheckpoint(path)).list_issues(repo, limit=1000)
+    assert session.requests == [("/issues", 1), ("/issues", 2), ("/issues", 3)]
+
+    session = PagedSession()
+    gh = make_client(session, retry_policy=RetryPolicy(max_attempts=1), checkpoint=FetchCheckpoint(path, resume=True))
+    issues = gh.list_issues(repo, limit=1000)
+
+    assert [i.number for i in issues] == list(range(250, 0, -1))
+    assert session.requests[0] == ("/issues", 3)
+    assert sorted(p for p, _ in session.requests[1:]) == [f"/issues/{n}/comments" for n in (100, 150, 200, 250, 50)]
+    assert gh.api_call_counts["checkpoint_page_reused"] == 2
+
+    # Comment threads were recorded too: a second resume needs no requests at all.
+    session = PagedSession()
+    checkpoint = FetchCheckpoint(path, resume=True)
+    issues = make_client(session, retry_policy=RetryPolicy(max_attempts=1), checkpoint=checkpoint).list_issues(repo, limit=1000)
+    assert session.requests == []
+    assert sum(len(i.comments) for i in issues) == 5
+
+    checkpoint.discard()
+    assert not path.exists()
+
+
+def test_torn_trailing_line_is_ignored_and_fresh_runs_start_over(tmp_path: Path) -> None:
+    path = tmp_path / "fetch.checkpoint"
+    cp = FetchCheckpoint(path)
+    cp.record("https://api.test/repos/o/r/issues", {"state": "open", "per_page": 2}, 1, None, items=[{"number": 2}, {"number": 1}], last_page=None)
+    # Recorded pages go to disk only; they are served back after a resume, not within the run.
+    assert len(cp) == 1
+    assert cp.page("https://api.test/repos/o/r/issues", {"state": "open", "per_page": 2}, 1) is None
+    cp.close()
+    with path.open("a", encoding="utf-8") as f:
+        f.write('{"stream": "trunc')
+
+    resumed = FetchCheckpoint(path, resume=True)
+    saved = resumed.page("https://api.test/repos/o/r/issues", {"per_page": 2, "state": "open", "page": 1}, 1)
+    assert saved is not None and saved.items == [{"number": 2}, {"number": 1}]
+    assert resumed.page("https://api.test/repos/o/r/issues", {"state": "closed", "per_page": 2}, 1) is None
+    resumed.record("https://api.test/repos/o/r/issues", {"state": "open", "per_page": 2}, 2, None, items=[], last_page=None)
+    resumed.close()
+    assert len(FetchCheckpoint(path, resume=True)) == 2
+
+    fresh = FetchCheckpoint(path)
+    assert len(fresh) == 0
+    fresh.close()
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from issue_assistant.github import GitHubRepoRef
+from issue_assistant.github_async import AsyncGitHubClient
+from issue_assistant.pipeline import analyze_issues_async
+
+
+def _handler_factory(*, total: int, log: list[str]):
+    # Newest first, with one pull request mixed in like the real /issues endpoint.
+    listing: list[dict[str, Any]] = [{"number": 10_000, "title": "A PR", "body": "", "state": "open", "pull_request": {}}]
+    listing += [{"number": n, "title": f"Crash {n}", "body": "", "state": "open", "user": {"login": "u", "id": 1}} for n in range(total, 0, -1)]
+
+    async def handler(request: "httpx.Request") -> "httpx.Response":
+        path = request.url.path
+        log.append(f"{request.method} {path}")
+        page = int(request.url.params.get("page", "1"))
+        # Let the event loop interleave requests like a real network would.
+        await asyncio.sleep(0.001)
+        if path == "/repos/o/r/issues":
+            return httpx.Response(200, json=listing[(page - 1) * 100 : page * 100])
+        if path.endswith("/comments") and request.method == "GET":
+            number = int(path.split("/")[-2])
+            return httpx.Response(200, json=[{"id": number, "body": f"on {number}", "user": {"login": "m", "id": 2}}])
+        if path.endswith("/comments") and request.method == "POST":
+            assert json.loads(request.content) == {"body": "hello"}
+            return httpx.Response(201, json={})
+        if path == "/repos/o/r/issues/5":
+            return httpx.Response(200, json={"number": 5, "title": "Five", "body": "", "state": "open"})
+        return httpx.Response(404, json={"message": "Not Found"})
+
+    return handler
+
+
+def _client(total: int, log: list[str], **kwargs: Any) -> AsyncGitHubClient:
+    transport = httpx.MockTransport(_handler_factory(total=total, log=log))
+    return AsyncGitHubClient(token="t", base_url="https://api.test", http_client=httpx.AsyncClient(transport=transport), **kwargs)
+
+
+def test_async_list_issues_matches_sync_surface() -> None:
+    log: list[str] = []
+
+    async def run() -> list[Any]:
+        async with _client(150, log) as gh:
+            return await gh.list_issues(GitHubRepoRef(owner="o", name="r"), limit=500)
+
+    issues = asyncio.run(run())
+
+    # The PR is filtered out client-side, exactly like GitHubClient.
+    assert [i.number for i in issues] == list(range(150, 0, -1))
+    assert all([c.body for c in i.comments] == [f"on {i.number}"] for i in issues)
+    assert log.count("GET /repos/o/r/issues") == 2
+
+
+def test_async_get_issue_and_create_comment() -> None:
+    log: list[str] = []
+
+    async def run() -> Any:
+        async with _client(0, log) as gh:
+            issue = await gh.get_issue(GitHubRepoRef(owner="o", name="r"), 5)
+            await gh.create_issue_comment(GitHubRepoRef(owner="o", name="r"), 5, body="hello")
+            return issue, gh.api_call_counts
+
+    issue, counts = asyncio.run(run())
+
+    assert issue.title == "Five"
+    assert [c.id for c in issue.comments] == [5]
+    assert counts["issue_comment_create"] == 1
+    assert "POST /repos/o/r/issues/5/comments" in log
+
+
+def test_analyze_issues_async_produces_sorted_run() -> None:
+    log: list[str] = []
+
+    async def run() -> Any:
+        async with _client(30, log) as gh:
+            return await analyze_issues_async(client=gh, repo=GitHubRepoRef(owner="o", name="r"), limit=50)
+
+    result = asyncio.run(run())
+
+    assert result.repo == "o/r"
+    assert [a.issue_number for a in result.issues] == list(range(1, 31))
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import Any
+
+from issue_assistant.github import GitHubRepoRef
+from tests.conftest import FakeResponse, FakeSession, make_client
+
+
+def _comment(cid: int, issue: int, created: str) -> dict[str, Any]:
+    return {
+        "id": cid,
+        "issue_url": f"https://api.test/repos/o/r/issues/{issue}",
+        "body": f"c{cid}",
+        "created_at": created,
+        "updated_at": created,
+        "user": {"login": "u", "id": 1},
+    }
+
+
+class RepoSession(FakeSession):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    def get(self, url: str, params: dict[str, Any] | None = None, **kwargs: Any) -> FakeResponse:
+        self.calls.append((url, dict(params or {})))
+        if url.endswith("/repos/o/r/issues"):
+            return FakeResponse(
+                [
+                    {"number": 3, "title": "Three", "body": "", "state": "open", "created_at": "2026-01-03T00:00:00Z"},
+                    {"number": 2, "title": "Two", "body": "", "state": "open", "created_at": "2026-01-02T00:00:00Z"},
+                ]
+            )
+        if url.endswith("/repos/o/r/issues/comments"):
+            return FakeResponse(
+                [
+                    _comment(5, 2, "2026-01-02T01:00:00Z"),
+                    _comment(6, 1, "2026-01-02T02:00:00Z"),  # issue outside the listing
+                    _comment(7, 2, "2026-01-04T00:00:00Z"),
+                ]
+            )
+        raise AssertionError(f"unexpected per-issue request: {url}")
+
+
+def test_bulk_strategy_buckets_repo_comment_stream_into_issues() -> None:
+    session = RepoSession()
+    gh = make_client(session, http_concurrency=4)
+    repo = GitHubRepoRef(owner="o", name="r")
+
+    issues = gh.list_issues(repo, limit=10, comments_strategy="bulk")
+
+    assert [i.number for i in issues] == [3, 2]
+    assert issues[0].comments == ()
+    assert [c.id for c in issues[1].comments] == [5, 7]
+
+    stream_params = [p for u, p in session.calls if u.endswith("/issues/comments")]
+    assert stream_params == [{"sort": "created", "direction": "asc", "per_page": 100, "since": "2026-01-02T00:00:00Z", "page": 1}]
+    assert gh.api_call_counts["issue_comments_list"] == 0
+    assert gh.api_call_counts["http_get"] == 2
+
+    # Threads are now cached for the rest of the run.
+    assert [c.id for c in gh.list_issue_comments(repo, 2)] == [5, 7]
+    assert gh.api_call_counts["http_get"] == 2
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+from issue_assistant import github
+from issue_assistant.github import GitHubRepoRef
+from tests.conftest import FakeResponse, FakeSession, make_client
+
+
+class SlowSession(FakeSession):
+    def __init__(self, *, delay: float = 0.05) -> None:
+        super().__init__()
+        self.delay = delay
+        self.urls: list[str] = []
+        self._lock = threading.Lock()
+
+    def get(self, url: str, params: dict[str, Any] | None = None, **kwargs: Any) -> FakeResponse:
+        with self._lock:
+            self.urls.append(url)
+        time.sleep(self.delay)
+        if url.endswith("/repos/o/r/issues"):
+            return FakeResponse([{"number": 5, "title": "Five", "body": "", "state": "open", "comments": 1}])
+        if url.endswith("/comments"):
+            return FakeResponse([{"id": 50, "body": "hi", "user": {"login": "u", "id": 1}}])
+        return FakeResponse({"number": int(url.rsplit("/", 1)[-1]), "title": "X", "body": "", "state": "open", "comments": 1})
+
+
+
+def test_concurrent_identical_fetches_share_one_request() -> None:
+    session = SlowSession()
+    gh = make_client(session, http_concurrency=8)
+    repo = GitHubRepoRef(owner="o", name="r")
+
+    results = gh._map_concurrent(lambda _: gh.get_issue(repo, 9), list(range(6)))
+
+    assert all([c.id for c in r.comments] == [50] for r in results)
+    assert session.urls.count("https://api.test/repos/o/r/issues/9") == 1
+    assert session.urls.count("https://api.test/repos/o/r/issues/9/comments") == 1
+    assert gh.api_call_counts["http_coalesced"] >= 5
+
+
+def test_listed_issue_with_loaded_comments_is_not_fetched_again() -> None:
+    session = SlowSession(delay=0.0)
+    gh = make_client(session, http_concurrency=8)
+    repo = GitHubRepoRef(owner="o", name="r")
+
+    listed = gh.list_issues(repo, limit=10)
+    again = gh.get_issue(repo, 5, include_comments=True)
+
+    assert again == listed[0]
+    assert session.urls == ["https://api.test/repos/o/r/issues", "https://api.test/repos/o/r/issues/5/comments"]
+    assert gh.api_call_counts["issue_reused"] == 1
+
+
+def test_only_recent_single_resource_responses_are_kept(monkeypatch) -> None:
+    monkeypatch.setattr(github, "_RESPONSE_MEMO_SIZE", 2)
+    session = SlowSession(delay=0.0)
+    gh = make_client(session, http_concurrency=8)
+    repo = GitHubRepoRef(owner="o", name="r")
+
+    for number in (1, 2, 3):
+        gh.get_issue(repo, number, include_comments=False)
+    page_url = "https://api.test/repos/o/r/issues"
+    gh._get(page_url, params={"page": 1}, timeout=30)
+    gh._get(page_url, params={"page": 1}, timeout=30)
+
+    assert [key[1] for key in gh._responses] == [
+        "https://api.test/repos/o/r/issues/2",
+        "https://api.test/repos/o/r/issues/3",
+    ]
+    assert session.urls.count(page_url) == 2
+
+
+def test_forget_repo_drops_only_that_repos_cached_state() -> None:
+    session = SlowSession(delay=0.0)
+    gh = make_client(session, http_concurrency=8)
+    first = GitHubRepoRef(owner="o", name="r")
+    second = GitHubRepoRef(owner="p", name="q")
+
+    gh.list_issues(first, limit=10)
+    gh.get_issue(second, 7)
+    gh.forget_repo(first)
+
+    for cache in (gh._issue_cache, gh._comment_cache, gh._comment_signatures):
+        assert {key[:2] for key in cache} == {("p", "q")}
+    assert [key[1] for key in gh._responses] == ["https://api.test/repos/p/q/issues/7"]
+
+    gh.get_issue(first, 5, include_comments=False)
+    assert session.urls.count("https://api.test/repos/o/r/issues/5") == 1
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import Any
+
+from issue_assistant.github import GitHubRepoRef
+from tests.conftest import FakeResponse, FakeSession, make_client
+
+
+def _issue(number: int, *, comments: int, updated: str = "2026-01-01T00:00:00Z") -> dict[str, Any]:
+    return {"number": number, "title": f"I{number}", "body": "", "state": "open", "updated_at": updated, "comments": comments}
+
+
+class PlannerSession(FakeSession):
+    def __init__(self, issues: list[dict[str, Any]]) -> None:
+        super().__init__()
+        self.issues = {int(i["number"]): i for i in issues}
+        self.comment_requests: list[int] = []
+
+    def get(self, url: str, params: dict[str, Any] | None = None, **kwargs: Any) -> FakeResponse:
+        if url.endswith("/repos/o/r/issues"):
+            return FakeResponse(list(self.issues.values()))
+        if url.endswith("/comments"):
+            number = int(url.rsplit("/", 2)[-2])
+            self.comment_requests.append(number)
+            count = int(self.issues[number]["comments"])
+            return FakeResponse([{"id": number * 100 + k, "body": f"c{k}", "user": {"login": "u", "id": 1}} for k in range(count)])
+        number = int(url.rsplit("/", 1)[-1])
+        return FakeResponse(self.issues[number])
+
+
+
+def test_issues_reporting_zero_comments_are_not_fetched() -> None:
+    session = PlannerSession([_issue(3, comments=2), _issue(2, comments=0), _issue(1, comments=0)])
+    gh = make_client(session, http_concurrency=2)
+
+    issues = gh.list_issues(GitHubRepoRef(owner="o", name="r"), limit=10)
+
+    assert [len(i.comments) for i in issues] == [2, 0, 0]
+    assert session.comment_requests == [3]
+    assert gh.api_call_counts["comment_fetch_skipped_empty"] == 2
+    assert gh.api_call_counts["issue_comments_list"] == 1
+
+
+def test_cached_thread_is_reused_only_while_updated_at_and_count_match() -> None:
+    session = PlannerSession([_issue(7, comments=1)])
+    gh = make_client(session, http_concurrency=2)
+    repo = GitHubRepoRef(owner="o", name="r")
+
+    listed = gh.list_issues(repo, limit=10)
+    again = gh.get_issue(repo, 7)
+    assert [c.id for c in again.comments] == [c.id for c in listed[0].comments] == [700]
+    assert session.comment_requests == [7]
+    assert gh.api_call_counts["comment_fetch_reused"] == 1
+
+    session.issues[7] = _issue(7, comments=2, updated="2026-01-02T00:00:00Z")
+    refreshed = gh.list_issues(repo, limit=10)
+    assert [c.id for c in refreshed[0].comments] == [700, 701]
+    assert session.comment_requests == [7, 7]
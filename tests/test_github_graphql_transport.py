@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from issue_assistant.github import GitHubClient, GitHubRepoRef
+from issue_assistant.github_graphql import graphql_url
+
+
+def _comment_node(cid: int, login: str = "u") -> dict[str, Any]:
+    return {
+        "databaseId": cid,
+        "body": f"comment {cid}",
+        "createdAt": "2026-01-02T00:00:00Z",
+        "updatedAt": "2026-01-02T00:00:00Z",
+        "author": {"login": login, "databaseId": 1},
+    }
+
+
+def _issue_node(number: int, *, comments: list[dict[str, Any]], has_more: bool = False) -> dict[str, Any]:
+    return {
+        "number": number,
+        "title": f"Issue {number}",
+        "body": "Steps to reproduce",
+        "state": "OPEN",
+        "createdAt": "2026-01-01T00:00:00Z",
+        "updatedAt": "2026-01-03T00:00:00Z",
+        "closedAt": None,
+        "author": {"login": "reporter", "databaseId": 42},
+        "labels": {"nodes": [{"name": "bug"}]},
+        "comments": {"totalCount": len(comments) + (150 if has_more else 0), "pageInfo": {"hasNextPage": has_more}, "nodes": comments},
+    }
+
+
+class StandInGitHub(BaseHTTPRequestHandler):
+    """Minimal GitHub stand-in: GraphQL with cursor pagination plus the REST comments endpoint."""
+
+    issues = [
+        _issue_node(3, comments=[_comment_node(31)]),
+        _issue_node(2, comments=[_comment_node(21)], has_more=True),
+        _issue_node(1, comments=[]),
+    ]
+    overflow_comments = [{"id": 21 + i, "body": f"comment {21 + i}", "user": {"login": "u", "id": 1}} for i in range(3)]
+    requests: list[str] = []
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _send_json(self, payload: Any) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length))
+        variables = payload["variables"]
+        type(self).requests.append("POST " + self.path)
+        assert self.path == "/graphql"
+
+        if "number" in variables:
+            node = next((n for n in self.issues if n["number"] == variables["number"]), None)
+            if node is None:
+                self._send_json({"data": {"repository": {"issue": None}}, "errors": [{"message": "Could not resolve to an Issue"}]})
+                return
+            self._send_json({"data": {"repository": {"issue": node}}})
+            return
+
+        start = int(variables["after"] or 0)
+        page = self.issues[start : start + int(variables["first"])]
+        end = start + len(page)
+        self._send_json(
+            {
+                "data": {
+                    "repository": {
+                        "issues": {
+                            "pageInfo": {"hasNextPage": end < len(self.issues), "endCursor": str(end)},
+                            "nodes": page,
+                        }
+                    }
+                }
+            }
+        )
+
+    def do_GET(self) -> None:
+        parsed = urlparse(self.path)
+        type(self).requests.append("GET " + parsed.path)
+        page = int(parse_qs(parsed.query).get("page", ["1"])[0])
+        if parsed.path == "/repos/o/r/issues/2/comments":
+            self._send_json(self.overflow_comments if page == 1 else [])
+            return
+        if parsed.path == "/repos/o/r/issues/9":
+            self._send_json({"number": 9, "title": "A pull request", "body": "", "state": "open", "pull_request": {}})
+            return
+        self.send_response(404)
+        self.end_headers()
+
+
+@pytest.fixture()
+def server() -> Iterator[str]:
+    StandInGitHub.requests = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StandInGitHub)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def _client(base_url: str) -> GitHubClient:
+    gh = GitHubClient(token="t", base_url=base_url, transport="graphql", http_concurrency=2)
+    gh.session.trust_env = False
+    return gh
+
+
+def test_graphql_list_issues_bulk_fetches_and_falls_back_for_overflowing_threads(server: str) -> None:
+    gh = _client(server)
+
+    issues = gh.list_issues(GitHubRepoRef(owner="o", name="r"), limit=10)
+
+    assert [i.number for i in issues] == [3, 2, 1]
+    assert issues[0].state == "open"
+    assert [l.name for l in issues[0].labels] == ["bug"]
+    assert issues[0].author is not None and issues[0].author.login == "reporter" and issues[0].author.id == 42
+    assert [c.id for c in issues[0].comments] == [31]
+    assert [c.id for c in issues[1].comments] == [21, 22, 23]
+    assert issues[2].comments == ()
+
+    assert gh.api_call_counts["graphql_query"] == 1
+    assert [r for r in StandInGitHub.requests if r.startswith("GET")] == ["GET /repos/o/r/issues/2/comments"]
+
+
+def test_graphql_paginates_with_cursor_until_limit(server: str) -> None:
+    gh = _client(server)
+
+    issues = gh.list_issues(GitHubRepoRef(owner="o", name="r"), limit=2, include_comments=False)
+
+    assert [i.number for i in issues] == [3, 2]
+    assert all(i.comments == () for i in issues)
+    assert not any(r.startswith("GET") for r in StandInGitHub.requests)
+
+
+def test_graphql_get_issue_falls_back_to_rest_for_pull_requests(server: str) -> None:
+    gh = _client(server)
+    repo = GitHubRepoRef(owner="o", name="r")
+
+    issue = gh.get_issue(repo, 3, include_comments=True)
+    assert [c.id for c in issue.comments] == [31]
+
+    pr = gh.get_issue(repo, 9, include_comments=False)
+    assert pr.title == "A pull request"
+
+
+def test_graphql_url_for_enterprise_server() -> None:
+    assert graphql_url("https://api.github.com") == "https://api.github.com/graphql"
+    assert graphql_url("https://ghe.example.com/api/v3") == "https://ghe.example.com/api/graphql"
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+from issue_assistant.checkpoint import FetchCheckpoint
+from issue_assistant.github import GitHubRepoRef
+from tests.conftest import FakeResponse, FakeSession, make_client
+
+
+class ConditionalSession(FakeSession):
+    """Serves fixed payloads with ETags and honours If-None-Match like the GitHub API does."""
+
+    def __init__(self, payloads: dict[tuple[str, int], Any]) -> None:
+        super().__init__()
+        self.payloads = payloads
+        self.statuses: list[int] = []
+
+    def get(self, url: str, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None, **kwargs: Any) -> FakeResponse:
+        page = int((params or {}).get("page", 1))
+        body = json.dumps(self.payloads.get((url, page), [])).encode("utf-8")
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if (headers or {}).get("If-None-Match") == etag:
+            self.statuses.append(304)
+            return FakeResponse(status_code=304, body=b"", headers={"ETag": etag, "X-RateLimit-Remaining": "4999"})
+        self.statuses.append(200)
+        return FakeResponse(status_code=200, body=body, headers={"ETag": etag, "Content-Type": "application/json"})
+
+
+def _payloads() -> dict[tuple[str, int], Any]:
+    base = "https://api.test/repos/o/r"
+    return {
+        (f"{base}/issues", 1): [
+            {"number": 2, "title": "Crash on start", "body": "trace", "state": "open", "labels": [{"name": "bug"}]},
+            {"number": 1, "title": "Docs typo", "body": "", "state": "open"},
+        ],
+        (f"{base}/issues/2", 1): {"number": 2, "title": "Crash on start", "body": "trace", "state": "open"},
+        (f"{base}/issues/2/comments", 1): [{"id": 20, "body": "same here", "user": {"login": "u", "id": 1}}],
+    }
+
+
+
+def test_second_run_replays_not_modified_responses_from_disk(tmp_path: Path) -> None:
+    repo = GitHubRepoRef(owner="o", name="r")
+    cache_dir = tmp_path / "http-cache"
+
+    first_session = ConditionalSession(_payloads())
+    first = make_client(first_session, http_cache_dir=cache_dir).list_issues(repo, limit=50)
+    assert set(first_session.statuses) == {200}
+
+    second_session = ConditionalSession(_payloads())
+    gh = make_client(second_session, http_cache_dir=cache_dir)
+    second = gh.list_issues(repo, limit=50)
+
+    assert set(second_session.statuses) == {304}
+    assert gh.api_call_counts["http_not_modified"] == len(second_session.statuses)
+    assert [(i.number, i.title, [l.name for l in i.labels]) for i in second] == [
+        (i.number, i.title, [l.name for l in i.labels]) for i in first
+    ]
+    assert [c.body for c in second[0].comments] == ["same here"]
+
+
+def test_changed_resource_is_refetched_and_cache_updated(tmp_path: Path) -> None:
+    repo = GitHubRepoRef(owner="o", name="r")
+    cache_dir = tmp_path / "http-cache"
+    make_client(ConditionalSession(_payloads()), http_cache_dir=cache_dir).get_issue(repo, 2, include_comments=True)
+
+    payloads = _payloads()
+    payloads[("https://api.test/repos/o/r/issues/2/comments", 1)] = [
+        {"id": 20, "body": "same here", "user": {"login": "u", "id": 1}},
+        {"id": 21, "body": "fixed on main", "user": {"login": "m", "id": 2}},
+    ]
+    session = ConditionalSession(payloads)
+    issue = make_client(session, http_cache_dir=cache_dir).get_issue(repo, 2, include_comments=True)
+
+    assert [c.id for c in issue.comments] == [20, 21]
+    assert 200 in session.statuses
+
+    replay_session = ConditionalSession(payloads)
+    replayed = make_client(replay_session, http_cache_dir=cache_dir).get_issue(repo, 2, include_comments=True)
+    assert [c.id for c in replayed.comments] == [20, 21]
+    assert 200 not in replay_session.statuses
+
+
+class LinkedPagesSession(ConditionalSession):
+    """Two full pages of 100 issues behind a ``Link: rel="last"`` header."""
+
+    def get(self, url: str, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None, **kwargs: Any) -> FakeResponse:
+        resp = super().get(url, params=params, headers=headers, **kwargs)
+        resp.headers["Link"] = f'<{url}?page=2>; rel="next", <{url}?page=2>; rel="last"'
+        return resp
+
+
+def test_limit_on_a_page_boundary_still_caches_and_checkpoints_the_page(tmp_path: Path) -> None:
+    repo = GitHubRepoRef(owner="o", name="r")
+    url = "https://api.test/repos/o/r/issues"
+    payloads: dict[tuple[str, int], Any] = {
+        (url, page): [{"number": n, "title": f"I{n}", "body": "", "state": "open", "comments": 0} for n in range(top, top - 100, -1)]
+        for page, top in ((1, 200), (2, 100))
+    }
+    cache_dir = tmp_path / "http-cache"
+
+    for limit, pages in ((100, 1), (200, 2)):
+        make_client(LinkedPagesSession(payloads), http_cache_dir=cache_dir).list_issues(repo, limit=limit)
+        session = LinkedPagesSession(payloads)
+        gh = make_client(session, http_cache_dir=cache_dir)
+        gh.checkpoint = FetchCheckpoint(tmp_path / f"checkpoint-{limit}.jsonl")
+        assert len(gh.list_issues(repo, limit=limit)) == limit
+        assert session.statuses == [304] * pages
+        assert len(gh.checkpoint) == pages
+        gh.checkpoint.close()
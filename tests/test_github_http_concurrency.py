@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+from issue_assistant.github import GitHubRepoRef
+from tests.conftest import FakeResponse, FakeSession, make_client
+
+
+class FakeSession(FakeSession):
+    def __init__(self, *, issue_count: int, delay: float = 0.0) -> None:
+        super().__init__()
+        self.issue_count = issue_count
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def get(self, url: str, params: dict[str, Any] | None = None, **kwargs: Any) -> FakeResponse:
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            page = int((params or {}).get("page", 1))
+            if url.endswith("/issues"):
+                if page > 1:
+                    return FakeResponse([])
+                return FakeResponse([{"number": n, "title": f"Issue {n}", "body": "", "state": "open"} for n in range(self.issue_count, 0, -1)])
+            if url.endswith("/comments"):
+                if page > 1:
+                    return FakeResponse([])
+                number = int(url.rsplit("/", 2)[-2])
+                return FakeResponse([{"id": number * 10, "body": f"comment on {number}", "user": {"login": "u", "id": 1}}])
+            raise AssertionError(f"unexpected url {url}")
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+
+def test_list_issues_fetches_comments_concurrently_in_issue_order() -> None:
+    session = FakeSession(issue_count=12, delay=0.02)
+    gh = make_client(session, http_concurrency=4)
+
+    issues = gh.list_issues(GitHubRepoRef(owner="o", name="r"), limit=100)
+
+    assert [i.number for i in issues] == list(range(12, 0, -1))
+    for issue in issues:
+        assert [c.body for c in issue.comments] == [f"comment on {issue.number}"]
+    assert session.max_in_flight > 1
+    assert session.max_in_flight <= 4
+
+
+def test_concurrent_comment_fetching_keeps_counts_and_cache_consistent() -> None:
+    session = FakeSession(issue_count=20)
+    gh = make_client(session, http_concurrency=8)
+    repo = GitHubRepoRef(owner="o", name="r")
+
+    gh.list_issues(repo, limit=100)
+
+    assert gh.api_call_counts["issue_comments_list"] == 20
+    # Short pages end pagination: one listing page plus one comment page per issue.
+    assert gh.api_call_counts["http_get"] == 1 + 20
+    assert len(gh._comment_cache) == 20
+
+    gh.list_issue_comments(repo, 7)
+    assert gh.api_call_counts["issue_comments_list"] == 20
+
+
+def test_http_concurrency_one_stays_serial() -> None:
+    session = FakeSession(issue_count=5, delay=0.005)
+    gh = make_client(session, http_concurrency=1)
+
+    gh.list_issues(GitHubRepoRef(owner="o", name="r"), limit=100)
+
+    assert session.max_in_flight == 1
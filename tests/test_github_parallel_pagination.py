@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+from issue_assistant.github import GitHubRepoRef, _last_page
+from tests.conftest import FakeResponse, FakeSession, make_client
+
+
+class PagedSession(FakeSession):
+    def __init__(self, *, total: int, per_page: int = 100, delay: float = 0.01) -> None:
+        super().__init__()
+        self.total = total
+        self.per_page = per_page
+        self.delay = delay
+        self.pages: list[int] = []
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def get(self, url: str, params: dict[str, Any] | None = None, **kwargs: Any) -> FakeResponse:
+        page = int((params or {}).get("page", 1))
+        with self.lock:
+            self.pages.append(page)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # Later pages answer faster, so completion order differs from page order.
+            time.sleep(self.delay / page)
+            last = max(1, -(-self.total // self.per_page))
+            start = self.total - (page - 1) * self.per_page
+            items = [{"number": n, "title": f"#{n}", "body": "", "state": "open"} for n in range(start, max(0, start - self.per_page), -1)]
+            link = f'<{url}?state=open&per_page=100&page={min(page + 1, last)}>; rel="next", <{url}?state=open&per_page=100&page={last}>; rel="last"'
+            return FakeResponse(items, {"Link": link})
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+
+def test_pages_after_the_first_are_fetched_concurrently_in_deterministic_order() -> None:
+    session = PagedSession(total=650)
+    gh = make_client(session, http_concurrency=4)
+
+    issues = gh.list_issues(GitHubRepoRef(owner="o", name="r"), limit=10_000, include_comments=False)
+
+    assert [i.number for i in issues] == list(range(650, 0, -1))
+    assert sorted(session.pages) == [1, 2, 3, 4, 5, 6, 7]
+    assert session.max_in_flight > 1
+
+
+def test_only_pages_needed_for_limit_are_requested() -> None:
+    session = PagedSession(total=650)
+    gh = make_client(session, http_concurrency=4)
+
+    issues = gh.list_issues(GitHubRepoRef(owner="o", name="r"), limit=250, include_comments=False)
+
+    assert len(issues) == 250
+    assert sorted(session.pages) == [1, 2, 3]
+
+
+def test_last_page_parsing() -> None:
+    header = '<https://api.github.com/repositories/1/issues?state=all&page=2>; rel="next", <https://api.github.com/repositories/1/issues?state=all&page=412>; rel="last"'
+    assert _last_page(header) == 412
+    assert _last_page('<https://api.github.com/x?page=1>; rel="prev"') is None
+    assert _last_page(None) is None
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from issue_assistant.github import SEARCH_RESULT_CAP, GitHubRepoRef
+from tests.conftest import FakeResponse, FakeSession, make_client
+
+
+def _parse(ts: str) -> datetime:
+    return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+
+
+class SearchSession(FakeSession):
+    """A repo with 2500 issues, one every 18 hours (each updated when created); search honours
+    created:LO..HI, updated:>=, order and the result cap."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        self.issues = [
+            {
+                "number": n,
+                "title": f"I{n}",
+                "body": "",
+                "state": "open",
+                "comments": 0,
+                "created_at": (start + timedelta(hours=18 * n)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "updated_at": (start + timedelta(hours=18 * n)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            }
+            for n in range(1, 2501)
+        ]
+        self.pages_served: list[tuple[str, int, int]] = []
+        self.queries: list[str] = []
+
+    def get(self, url: str, params: dict[str, Any] | None = None, **kwargs: Any) -> FakeResponse:
+        if url.endswith("/repos/o/r"):
+            return FakeResponse({"created_at": "2020-01-01T00:00:00Z"})
+        assert url.endswith("/search/issues")
+        params = params or {}
+        terms = str(params["q"]).split()
+        self.queries.append(str(params["q"]))
+        window = next(t for t in terms if t.startswith("created:"))
+        lo, hi = (_parse(x) for x in window[len("created:") :].split(".."))
+        matching = [i for i in self.issues if lo <= _parse(i["created_at"]) <= hi]
+        for t in terms:
+            if t.startswith("updated:>="):
+                since = _parse(t[len("updated:>=") :])
+                matching = [i for i in matching if _parse(i["updated_at"]) >= since]
+        if params.get("order") == "desc":
+            matching.reverse()
+        page, per_page = int(params["page"]), int(params["per_page"])
+        reachable = matching[:SEARCH_RESULT_CAP]
+        self.pages_served.append((window, page, len(matching)))
+        return FakeResponse({"total_count": len(matching), "items": reachable[(page - 1) * per_page : page * per_page]})
+
+
+def test_windows_are_split_under_the_cap_and_merged_by_number() -> None:
+    session = SearchSession()
+    gh = make_client(session, http_concurrency=4)
+
+    issues = gh.list_issues(GitHubRepoRef(owner="o", name="r"), limit=10_000, include_comments=False, partition_by="created")
+
+    assert [i.number for i in issues] == list(range(2500, 0, -1))
+    # Every page past the first was requested from a window the search API can fully serve.
+    assert all(total <= SEARCH_RESULT_CAP for _, page, total in session.pages_served if page > 1)
+    assert gh.api_call_counts["search_windows"] >= 3
+    assert "search_window_capped" not in gh.api_call_counts
+
+
+def test_limit_and_direction_pick_the_windows_to_fetch() -> None:
+    repo = GitHubRepoRef(owner="o", name="r")
+
+    newest_session = SearchSession()
+    newest = make_client(newest_session, http_concurrency=4).list_issues(
+        repo, limit=3, include_comments=False, partition_by="created"
+    )
+    oldest_session = SearchSession()
+    oldest = make_client(oldest_session, http_concurrency=4).list_issues(
+        repo, limit=3, include_comments=False, partition_by="created", direction="asc"
+    )
+
+    assert [i.number for i in newest] == [2500, 2499, 2498]
+    assert [i.number for i in oldest] == [1, 2, 3]
+    # At most the whole range, its two halves and the two quarters of the half the limit falls in;
+    # every request is a probe, and nothing behind the window holding the limit is split or paged.
+    for session in (newest_session, oldest_session):
+        assert len(session.pages_served) <= 5
+        assert {page for _, page, _ in session.pages_served} == {1}
+
+
+def test_limit_spanning_windows_fetches_only_the_pages_it_needs() -> None:
+    session = SearchSession()
+    gh = make_client(session, http_concurrency=4)
+
+    issues = gh.list_issues(GitHubRepoRef(owner="o", name="r"), limit=250, include_comments=False, partition_by="created")
+
+    assert [i.number for i in issues] == list(range(2500, 2250, -1))
+    later_pages = [(window, page) for window, page, _ in session.pages_served if page > 1]
+    assert len(later_pages) == 2
+    assert len(session.pages_served) < 10
+
+
+def test_since_filters_updates_when_partitioning_by_created() -> None:
+    session = SearchSession()
+    gh = make_client(session, http_concurrency=4)
+    since = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    issues = gh.list_issues(
+        GitHubRepoRef(owner="o", name="r"), limit=10_000, include_comments=False, since=since, partition_by="created"
+    )
+
+    assert issues
+    assert all(i.updated_at is not None and i.updated_at >= since for i in issues)
+    assert len(issues) == sum(1 for i in session.issues if _parse(i["updated_at"]) >= since)
+    assert all("updated:>=2024-01-01T00:00:00Z" in q for q in session.queries)
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import issue_assistant.cli as cli
+from issue_assistant.github import GitHubClient, GitHubRepoRef
+from tests.conftest import FakeResponse, FakeSession, make_client
+
+
+PULLS = [
+    {"number": 11, "title": "Fix crash", "body": "Fixes #3", "state": "closed", "user": {"login": "dev", "id": 2}, "merged_at": "2026-01-10T00:00:00Z"},
+    {"number": 10, "title": "Docs", "body": "", "state": "open", "user": {"login": "dev", "id": 2}, "merged_at": None},
+]
+COMMITS = [
+    {"sha": "abc123", "commit": {"message": "Fix crash (closes #3)", "author": {"name": "Dev", "date": "2026-01-09T00:00:00Z"}}, "author": {"login": "dev"}},
+    {"sha": "def456", "commit": {"message": "Initial", "author": {"name": "Someone", "date": "2026-01-01T00:00:00Z"}}, "author": None},
+]
+
+
+class RepoSession(FakeSession):
+    def __init__(self, *, delay: float = 0.0) -> None:
+        super().__init__()
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def get(self, url: str, params: dict[str, Any] | None = None, **kwargs: Any) -> FakeResponse:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            if url.endswith("/pulls"):
+                return FakeResponse(PULLS)
+            if url.endswith("/commits"):
+                return FakeResponse(COMMITS)
+            if url.endswith("/issues"):
+                return FakeResponse([{"number": 3, "title": "Crash", "body": "", "state": "open", "comments": 0}])
+            if url.endswith("/comments"):
+                n = int(url.rsplit("/", 2)[-2])
+                return FakeResponse([{"id": n * 10, "body": f"see #{n}", "user": {"login": "u", "id": 1}}])
+            raise AssertionError(url)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def test_pull_requests_and_commits_are_parsed_from_api_payloads() -> None:
+    gh = make_client(RepoSession(), http_concurrency=4)
+    repo = GitHubRepoRef(owner="o", name="r")
+
+    prs = gh.list_pull_requests(repo)
+    commits = gh.list_commits(repo)
+
+    assert [(p.number, p.merged_at is not None, [c.id for c in p.comments]) for p in prs] == [(11, True, [110]), (10, False, [100])]
+    assert [(c.sha, c.message, c.author) for c in commits] == [("abc123", "Fix crash (closes #3)", "dev"), ("def456", "Initial", "Someone")]
+    assert commits[0].authored_at is not None
+
+
+def test_cli_ingests_pull_requests_and_commits_alongside_issues(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    session = RepoSession(delay=0.05)
+
+    def client_factory(token: str, **kwargs: Any) -> GitHubClient:
+        return GitHubClient(token=token, base_url="https://api.test", session=session, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(cli, "GitHubClient", client_factory)
+    out_dir = tmp_path / "out"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "issue-assistant",
+            "analyze",
+            "--github-token",
+            "t",
+            "--repo",
+            "o/r",
+            "--output-dir",
+            str(out_dir),
+            "--github-pull-requests",
+            "--github-commits",
+        ],
+    )
+
+    cli.main()
+
+    deps = json.loads((out_dir / "issue_dependencies.json").read_text(encoding="utf-8"))
+    assert "11" in json.dumps(deps) and "abc123" in json.dumps(deps)
+    # Issues, pulls and commits were in flight at the same time.
+    assert session.peak >= 3
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+import requests
+
+from issue_assistant.github import GitHubClient, GitHubRepoRef
+from issue_assistant.scheduler import RequestScheduler, RetryPolicy
+from tests.conftest import FakeResponse, FakeSession, make_client
+
+
+class ScriptedSession(FakeSession):
+    def __init__(self, script: list[Any]) -> None:
+        super().__init__()
+        self.script = list(script)
+        self.calls = 0
+
+    def _next(self) -> FakeResponse:
+        self.calls += 1
+        step = self.script.pop(0)
+        if isinstance(step, Exception):
+            raise step
+        return step
+
+    def get(self, url: str, **kwargs: Any) -> FakeResponse:
+        return self._next()
+
+    def post(self, url: str, **kwargs: Any) -> FakeResponse:
+        return self._next()
+
+
+ISSUE = {"number": 7, "title": "Crash", "body": "", "state": "open"}
+
+
+def _client(script: list[Any], *, max_attempts: int = 6) -> tuple[GitHubClient, ScriptedSession, list[float]]:
+    session = ScriptedSession(script)
+    gh = make_client(session, retry_policy=RetryPolicy(max_attempts=max_attempts))
+    sleeps: list[float] = []
+    gh._sleep = sleeps.append
+    return gh, session, sleeps
+
+
+def test_transient_5xx_and_connection_errors_are_retried() -> None:
+    gh, session, sleeps = _client([FakeResponse(status_code=502), requests.ConnectionError("reset"), FakeResponse(ISSUE)])
+
+    issue = gh.get_issue(GitHubRepoRef(owner="o", name="r"), 7, include_comments=False)
+
+    assert issue.number == 7
+    assert session.calls == 3
+    assert len(sleeps) == 2
+    assert gh.api_call_counts["http_retry"] == 2
+
+
+def test_secondary_rate_limit_honours_retry_after_and_halves_concurrency() -> None:
+    gh, _, sleeps = _client(
+        [
+            FakeResponse({"message": "You have exceeded a secondary rate limit"}, {"Retry-After": "30"}, status_code=403),
+            FakeResponse(ISSUE),
+        ]
+    )
+    gh.scheduler = RequestScheduler(max_concurrency=8)
+
+    gh.get_issue(GitHubRepoRef(owner="o", name="r"), 7, include_comments=False)
+
+    assert 30.0 <= sleeps[0] <= 31.0
+    assert gh.scheduler.concurrency == 4
+
+
+def test_exhausted_primary_limit_waits_until_reset() -> None:
+    clock = [1_000_000.0]
+    gh, _, sleeps = _client(
+        [
+            FakeResponse(
+                    {"message": "API rate limit exceeded"},
+                    {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(clock[0]) + 120)},
+                    status_code=403,
+                ),
+            FakeResponse(ISSUE),
+        ]
+    )
+    gh.scheduler = RequestScheduler(clock=lambda: clock[0])
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    gh._sleep = sleep
+
+    gh.get_issue(GitHubRepoRef(owner="o", name="r"), 7, include_comments=False)
+
+    assert sleeps == [121.0]
+
+
+def test_non_transient_errors_and_exhausted_attempts_raise() -> None:
+    gh, session, _ = _client([FakeResponse({"message": "Not Found"}, status_code=404)])
+    with pytest.raises(requests.HTTPError):
+        gh.get_issue(GitHubRepoRef(owner="o", name="r"), 7, include_comments=False)
+    assert session.calls == 1
+
+    gh, session, _ = _client([FakeResponse(status_code=503), FakeResponse(status_code=503), FakeResponse(status_code=503)], max_attempts=3)
+    with pytest.raises(requests.HTTPError):
+        gh.get_issue(GitHubRepoRef(owner="o", name="r"), 7, include_comments=False)
+    assert session.calls == 3
+
+
+def test_comment_creation_is_not_retried_on_server_errors() -> None:
+    gh, session, _ = _client([FakeResponse(status_code=502), FakeResponse({}, status_code=201)])
+    with pytest.raises(requests.HTTPError):
+        gh.create_issue_comment(GitHubRepoRef(owner="o", name="r"), 7, body="hi")
+    assert session.calls == 1
+
+
+def test_scheduler_paces_requests_when_budget_runs_low() -> None:
+    now = 0.0
+    scheduler = RequestScheduler(clock=lambda: now)
+    scheduler.observe(200, {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "100", "X-RateLimit-Resource": "core"})
+
+    delays = [scheduler.pacing_delay("core") for _ in range(3)]
+
+    assert delays[0] == 0.0
+    assert delays[1] == 10.0
+    assert delays[2] > delays[1]
+    assert scheduler.pacing_delay("search") == 0.0
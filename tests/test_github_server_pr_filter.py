@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from issue_assistant.github import GitHubRepoRef
+from tests.conftest import FakeResponse, FakeSession, make_client
+
+
+class SearchSession(FakeSession):
+    """Serves /search/issues over 250 issues; /issues itself must not be listed."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+        self.posts = 0
+
+    def get(self, url: str, params: dict[str, Any] | None = None, **kwargs: Any) -> FakeResponse:
+        p = dict(params or {})
+        self.calls.append((url, p))
+        if url.endswith("/search/issues"):
+            page, per_page = int(p["page"]), int(p["per_page"])
+            numbers = range(250 - (page - 1) * per_page, max(0, 250 - page * per_page), -1)
+            items = [{"number": n, "title": f"I{n}", "body": "", "state": "open", "comments": 0} for n in numbers]
+            return FakeResponse({"total_count": 250, "incomplete_results": False, "items": items})
+        raise AssertionError(f"unexpected request: {url}")
+
+    def post(self, url: str, **kwargs: Any) -> FakeResponse:
+        self.posts += 1
+        return FakeResponse({"data": {"repository": {"issues": {"pageInfo": {"hasNextPage": False}, "nodes": []}}}})
+
+
+
+def test_server_filter_lists_issues_through_search() -> None:
+    session = SearchSession()
+    gh = make_client(session, http_concurrency=2)
+
+    issues = gh.list_issues(GitHubRepoRef(owner="o", name="r"), state="open", limit=150, pull_request_filter="server")
+
+    assert [i.number for i in issues] == list(range(250, 100, -1))
+    assert [p["page"] for _, p in session.calls] == [1, 2]
+    assert session.calls[0][1]["q"] == "repo:o/r is:issue state:open"
+    assert (session.calls[0][1]["sort"], session.calls[0][1]["order"]) == ("created", "desc")
+
+
+def test_limits_beyond_the_search_cap_use_the_graphql_issues_connection() -> None:
+    session = SearchSession()
+    gh = make_client(session, http_concurrency=2)
+
+    assert gh.list_issues(GitHubRepoRef(owner="o", name="r"), limit=5000, pull_request_filter="server") == []
+    assert session.calls == []
+    assert session.posts == 1
+
+
+def test_unknown_filter_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        make_client(SearchSession(), http_concurrency=2).list_issues(GitHubRepoRef(owner="o", name="r"), pull_request_filter="both")
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from issue_assistant.http_metrics import MAX_RATE_LIMIT_SAMPLES, HttpMetrics, endpoint_template
+
+
+def test_endpoint_template_groups_requests_by_route() -> None:
+    assert endpoint_template("get", "https://api.github.com/repos/o/r/issues/12/comments?page=2") == (
+        "GET /repos/{owner}/{repo}/issues/{number}/comments"
+    )
+    assert endpoint_template("GET", "https://ghe.example/api/v3/repos/o/r/issues") == "GET /repos/{owner}/{repo}/issues"
+    assert endpoint_template("post", "https://api.github.com/graphql") == "POST /graphql"
+
+
+def test_metrics_aggregate_latency_bytes_retries_and_rate_limit() -> None:
+    ticks = iter([0.0, 1.0, 2.0, 3.0])
+    m = HttpMetrics(clock=lambda: next(ticks))
+    ep = "GET /repos/{owner}/{repo}/issues"
+
+    m.record_response(ep, status=200, seconds=0.02, headers={"X-RateLimit-Remaining": "4999", "X-RateLimit-Used": "1", "X-RateLimit-Limit": "5000"})
+    m.record_conditional()
+    m.record_response(ep, status=304, seconds=0.3, headers={"X-RateLimit-Remaining": "4999", "X-RateLimit-Resource": "core"})
+    m.record_cache_hit()
+    m.record_response(ep, status=None, seconds=20.0)
+    m.record_retry(ep)
+    assert b"".join(m.count_bytes(ep, [b"ab", b"cde"])) == b"abcde"
+
+    out = m.to_json()
+    stats = out["endpoints"][ep]
+    assert stats["requests"] == 3
+    assert stats["errors"] == 1
+    assert stats["retries"] == 1
+    assert stats["response_bytes"] == 5
+    assert stats["statuses"] == {"200": 1, "304": 1, "transport_error": 1}
+    assert stats["latency_histogram"]["le_25ms"] == 1
+    assert stats["latency_histogram"]["le_500ms"] == 1
+    assert stats["latency_histogram"]["gt_10000ms"] == 1
+    assert out["totals"]["not_modified_ratio"] == 1.0
+    assert out["rate_limit"]["core"]["min_remaining"] == 4999
+    assert out["rate_limit"]["core"]["samples"] == [[1.0, 4999, 1], [2.0, 4999, None]]
+
+
+def test_rate_limit_samples_stay_bounded_with_exact_extremes() -> None:
+    ticks = iter(range(10_000))
+    m = HttpMetrics(clock=lambda: float(next(ticks)))
+    ep = "GET /repos/{owner}/{repo}/issues"
+    n = MAX_RATE_LIMIT_SAMPLES * 8
+    for k in range(n):
+        m.record_response(ep, status=200, seconds=0.01, headers={"X-RateLimit-Remaining": str(5000 - k), "X-RateLimit-Used": str(k)})
+
+    core = m.to_json()["rate_limit"]["core"]
+    assert len(core["samples"]) < MAX_RATE_LIMIT_SAMPLES
+    assert core["min_remaining"] == 5000 - (n - 1)
+    assert core["max_used"] == n - 1
+    # Thinning keeps the series spread over the whole run.
+    assert core["samples"][0][0] == 1.0
+    assert core["samples"][-1][0] > n * 0.9
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from issue_assistant.ingest import ingest_concurrently
+from issue_assistant.models import Commit, Issue, IssueAuthor, PullRequest
+
+
+def _issues() -> list[Issue]:
+    return [Issue(number=n, title=f"Crash {n}", body="steps to reproduce", author=IssueAuthor(login="u")) for n in (2, 1)]
+
+
+def test_sources_run_concurrently_and_issues_are_normalized() -> None:
+    started = threading.Barrier(3, timeout=2)
+
+    def slow(value):
+        def load():
+            started.wait()
+            time.sleep(0.1)
+            return value
+
+        return load
+
+    t0 = time.perf_counter()
+    result = ingest_concurrently(
+        issues=slow(_issues()),
+        pull_requests=slow([PullRequest(number=9, title="Fix", body="", author=None)]),
+        commits=slow([Commit(sha="abc", message="fix #2")]),
+    )
+    elapsed = time.perf_counter() - t0
+
+    assert [i.number for i in result.issues] == [2, 1]
+    assert [n.issue.number for n in result.normalized] == [2, 1]
+    assert [p.number for p in result.pull_requests or []] == [9]
+    assert [c.sha for c in result.commits or []] == ["abc"]
+    # All three waited on the same barrier, so they overlapped rather than running back to back.
+    assert elapsed < 0.3
+
+
+def test_missing_sources_stay_none_and_issue_errors_propagate() -> None:
+    result = ingest_concurrently(issues=_issues)
+    assert result.pull_requests is None and result.commits is None
+
+    def boom() -> list[Issue]:
+        raise RuntimeError("listing failed")
+
+    with pytest.raises(RuntimeError):
+        ingest_concurrently(issues=boom, commits=lambda: [])
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import issue_assistant.cli as cli
+from issue_assistant.github import parse_comment_payload, parse_issue_payload
+from issue_assistant.interning import InternTable, folded
+
+
+def _raw(number: int) -> dict[str, object]:
+    return {
+        "number": number,
+        "title": f"Issue {number}",
+        "body": "",
+        "state": "open",
+        "user": {"login": "octo", "id": 1},
+        "labels": [{"name": "Bug"}, "area/" + "cli"],
+    }
+
+
+def test_parsed_issues_share_labels_authors_and_strings() -> None:
+    interner = InternTable()
+    a = parse_issue_payload(_raw(1), interner=interner)
+    b = parse_issue_payload(json.loads(json.dumps(_raw(2))), interner=interner)
+    c = parse_comment_payload({"id": 9, "body": "hi", "user": {"login": "octo", "id": 1}}, interner=interner)
+
+    assert a.labels[0] is b.labels[0] and a.labels[1] is b.labels[1]
+    assert a.author is b.author is c.author
+    assert a.state is b.state
+    assert len(interner) == 3
+
+
+def test_interned_values_equal_freshly_built_ones() -> None:
+    shared = parse_issue_payload(_raw(1), interner=InternTable())
+    assert shared == parse_issue_payload(_raw(1))
+    assert parse_issue_payload({"number": 3, "user": {}, "labels": None}).author is None
+
+
+def test_folded_label_names_are_interned() -> None:
+    assert folded("Bug") == "bug"
+    assert folded("Bug") is folded("".join(["B", "ug"]))
+
+
+def test_issues_file_loader_interns_across_the_file(tmp_path: Path) -> None:
+    path = tmp_path / "issues.json"
+    path.write_text(json.dumps([_raw(1), _raw(2)]), encoding="utf-8")
+
+    first, second = cli._load_issues_from_file(path)
+
+    assert first.labels[0] is second.labels[0]
+    assert first.author is second.author
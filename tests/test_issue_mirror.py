@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from issue_assistant.github import GitHubRepoRef
+from issue_assistant.mirror import IssueMirror
+from issue_assistant.models import Issue, IssueAuthor, IssueComment, IssueLabel
+from issue_assistant.retention import retain_raw
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeGitHubClient:
+    """Serves a mutable in-memory repo and honours the `since` filter like the GitHub API."""
+
+    def __init__(self, issues: dict[int, Issue], comments: dict[int, list[IssueComment]]) -> None:
+        self.issues = issues
+        self.comments = comments
+        self.list_calls: list[dict[str, object]] = []
+        self.comment_fetches: list[int] = []
+
+    def list_issues(self, repo: GitHubRepoRef, **kwargs: object) -> list[Issue]:
+        self.list_calls.append(dict(kwargs))
+        since = kwargs.get("since")
+        out = [i for i in self.issues.values() if since is None or (i.updated_at is not None and i.updated_at >= since)]
+        return sorted(out, key=lambda i: i.updated_at or T0)
+
+    def fetch_comments(self, repo: GitHubRepoRef, numbers: list[int]) -> dict[int, list[IssueComment]]:
+        self.comment_fetches.extend(numbers)
+        return {n: list(self.comments.get(n, [])) for n in numbers}
+
+
+def _issue(number: int, *, updated: datetime, state: str = "open", labels: tuple[str, ...] = ()) -> Issue:
+    return Issue(
+        number=number,
+        title=f"Issue {number}",
+        body="body",
+        author=IssueAuthor(login="u", id=1),
+        labels=tuple(IssueLabel(name=l) for l in labels),
+        state=state,
+        created_at=T0,
+        updated_at=updated,
+    )
+
+
+def _comment(cid: int, at: datetime) -> IssueComment:
+    return IssueComment(id=cid, author=IssueAuthor(login="m", id=2), body=f"c{cid}", created_at=at, updated_at=at)
+
+
+def test_sync_transfers_only_changes_and_loads_full_corpus(tmp_path: Path) -> None:
+    repo = GitHubRepoRef(owner="o", name="r")
+    gh = FakeGitHubClient(
+        issues={
+            1: _issue(1, updated=T0 + timedelta(days=1), labels=("bug",)),
+            2: _issue(2, updated=T0 + timedelta(days=2)),
+            3: _issue(3, updated=T0 + timedelta(days=3), state="closed"),
+        },
+        comments={1: [_comment(10, T0)]},
+    )
+
+    with IssueMirror(tmp_path / "mirror.sqlite") as mirror:
+        first = mirror.sync(gh, repo)  # type: ignore[arg-type]
+        assert first.issues_fetched == 3
+        assert first.watermark == T0 + timedelta(days=3)
+        assert gh.list_calls[0]["since"] is None
+        assert gh.list_calls[0]["sort"] == "updated"
+        assert sorted(gh.comment_fetches) == [1, 2, 3]
+
+    # Issue 2 gets a new comment (which bumps updated_at); nothing else changes.
+    gh.issues[2] = _issue(2, updated=T0 + timedelta(days=5))
+    gh.comments[2] = [_comment(20, T0 + timedelta(days=5))]
+    gh.comment_fetches.clear()
+
+    with IssueMirror(tmp_path / "mirror.sqlite") as mirror:
+        second = mirror.sync(gh, repo)  # type: ignore[arg-type]
+        assert gh.list_calls[1]["since"] == T0 + timedelta(days=3)
+        # `since` is inclusive, so the issue at the old watermark is re-listed but its comments are still current.
+        assert second.issues_fetched == 2
+        assert gh.comment_fetches == [2]
+        assert second.issues_total == 3
+
+        issues = mirror.load_issues(repo)
+        assert [i.number for i in issues] == [3, 2, 1]
+        assert [c.id for c in issues[1].comments] == [20]
+        assert [c.id for c in issues[2].comments] == [10]
+        assert [l.name for l in issues[2].labels] == ["bug"]
+        assert issues[2].author == IssueAuthor(login="u", id=1)
+        assert issues[2].updated_at == T0 + timedelta(days=1)
+
+        assert [i.number for i in mirror.load_issues(repo, state="open")] == [2, 1]
+
+
+def test_sync_without_comments_backfills_threads_on_a_later_sync(tmp_path: Path) -> None:
+    repo = GitHubRepoRef(owner="o", name="r")
+    gh = FakeGitHubClient(issues={1: _issue(1, updated=T0)}, comments={1: [_comment(10, T0)]})
+
+    with IssueMirror(tmp_path / "mirror.sqlite") as mirror:
+        mirror.sync(gh, repo, include_comments=False)  # type: ignore[arg-type]
+        assert gh.comment_fetches == []
+        assert mirror.load_issues(repo)[0].comments == ()
+
+        mirror.sync(gh, repo)  # type: ignore[arg-type]
+        assert gh.comment_fetches == [1]
+        assert [c.id for c in mirror.load_issues(repo)[0].comments] == [10]
+
+
+def test_threads_reported_empty_by_the_listing_are_not_fetched(tmp_path: Path) -> None:
+    repo = GitHubRepoRef(owner="o", name="r")
+    quiet = _issue(1, updated=T0 + timedelta(days=1))
+    gh = FakeGitHubClient(
+        issues={
+            # Even the "none" raw-retention policy keeps the listed comment count.
+            1: replace(quiet, raw=retain_raw({"number": 1, "body": "body", "comments": 0}, "none")),
+            2: _issue(2, updated=T0 + timedelta(days=2)),
+        },
+        comments={2: [_comment(20, T0)]},
+    )
+
+    with IssueMirror(tmp_path / "mirror.sqlite3") as mirror:
+        result = mirror.sync(gh, repo)
+        loaded = {i.number: i for i in mirror.load_issues(repo)}
+
+    assert gh.comment_fetches == [2]
+    assert result.comment_threads_fetched == 1
+    assert loaded[1].comments == ()
+    assert [c.id for c in loaded[2].comments] == [20]
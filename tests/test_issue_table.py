@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import dataclasses
+import math
+from datetime import datetime, timezone
+
+from issue_assistant.issue_table import is_low_quality, is_low_signal
+from issue_assistant.models import (
+    AnalysisRun,
+    DuplicateLink,
+    Issue,
+    IssueAnalysis,
+    LifecycleClassification,
+    MaintainerAction,
+    MaintainerCostEstimate,
+    QualityBreakdown,
+    TriageClassification,
+)
+from issue_assistant.phases.normalization import normalize_issue
+
+
+def _analysis(
+    number: int,
+    *,
+    state: str,
+    category: str,
+    cost: str,
+    dup: bool = False,
+    ts: datetime | None = None,
+    completeness: int | None = None,
+    reproducibility: int | None = None,
+    noise: int = 0,
+    body: str = "",
+) -> IssueAnalysis:
+    issue = Issue(number=number, title=f"I{number}", body=body, author=None, created_at=ts)
+    return IssueAnalysis(
+        issue_number=number,
+        normalized=normalize_issue(issue),
+        quality=QualityBreakdown(
+            completeness=40 + number if completeness is None else completeness,
+            clarity=50,
+            reproducibility=10 * number if reproducibility is None else reproducibility,
+            noise=noise,
+        ),
+        triage=TriageClassification(category=category, confidence=0.9),
+        lifecycle=LifecycleClassification(state=state, confidence="HIGH"),
+        maintainer_cost=MaintainerCostEstimate(level=cost),
+        duplicates=DuplicateLink(issue_number=number, likely_duplicates_of=(1,), similarity_reasons=()) if dup else None,
+        maintainer_action=MaintainerAction(recommended_actions=()),
+    )
+
+
+def _run() -> AnalysisRun:
+    now = datetime(2026, 1, 15, tzinfo=timezone.utc)
+    return AnalysisRun(
+        generated_at=now,
+        repo="o/r",
+        issues=(
+            _analysis(1, state="needs-info", category="bug", cost="high", ts=now),
+            _analysis(2, state="stale", category="question", cost="weird", dup=True),
+            _analysis(3, state="needs-info", category="bug", cost="low", ts=datetime(2026, 1, 1)),
+        ),
+    )
+
+
+def test_table_columns_follow_run_order() -> None:
+    t = _run().table
+
+    assert list(t.numbers) == [1, 2, 3]
+    assert t.select(t.lifecycle_mask("needs-info")) == [1, 3]
+    assert t.select(t.lifecycle_mask("blocked")) == []
+    assert t.select(t.triage_mask("bug", "question")) == [1, 2, 3]
+    assert t.select(t.high_cost_mask()) == [1]
+    assert list(t.cost_score) == [3, 2, 1]
+    assert t.select(t.duplicate) == [2]
+    assert list(t.reproducibility) == [10, 20, 30]
+    assert t.lifecycle_counts() == {"needs-info": 2, "stale": 1}
+    assert t.triage_counts([0, 1]) == {"bug": 1, "question": 1}
+    assert math.isnan(t.activity_at[1])
+    # Naive timestamps are read as UTC.
+    assert t.activity_at[2] == datetime(2026, 1, 1, tzinfo=timezone.utc).timestamp()
+
+
+def test_table_is_built_once_and_not_part_of_equality() -> None:
+    run = _run()
+    assert run.table is run.table
+    assert run == _run()
+    assert "_table" not in run.as_json_dict()
+    assert dataclasses.replace(run, repo="x/y").table is not run.table
+
+
+def test_rule_masks_match_the_per_issue_rules() -> None:
+    body = "Steps to reproduce: open the editor and save a file. Expected: saved. Actual: crash with traceback."
+    issues = tuple(
+        _analysis(
+            n,
+            state=state,
+            category="bug",
+            cost="low",
+            completeness=c,
+            reproducibility=r,
+            noise=noise,
+            body="" if n == 7 else body,
+        )
+        for n, (state, c, r, noise) in enumerate(
+            [
+                ("open", 80, 80, 0),
+                ("needs-info", 80, 80, 0),
+                ("open", 49, 80, 0),
+                ("open", 80, 49, 0),
+                ("open", 80, 80, 70),
+                ("open", 50, 50, 69),
+                ("open", 80, 80, 0),
+            ],
+            start=1,
+        )
+    )
+    run = AnalysisRun(generated_at=datetime(2026, 1, 15, tzinfo=timezone.utc), repo="o/r", issues=issues)
+    t = run.table
+
+    assert t.low_signal_mask() == [False, False, False, False, True, False, True]
+    assert t.low_quality_mask() == [False, True, True, True, True, False, True]
+    assert t.low_signal_mask() == [is_low_signal(a.normalized.is_low_signal, a.quality.noise) for a in issues]
+    assert t.low_quality_mask() == [
+        is_low_quality(
+            a.lifecycle.state == "needs-info",
+            a.quality.completeness,
+            a.quality.reproducibility,
+            a.quality.noise,
+            a.normalized.is_low_signal,
+        )
+        for a in issues
+    ]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+import random
+from typing import Iterator
+
+import pytest
+
+from issue_assistant.jsonstream import iter_json_array
+
+
+def _chunks(data: bytes, size: int) -> Iterator[bytes]:
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+def test_decodes_elements_across_arbitrary_chunk_boundaries() -> None:
+    payload = [
+        {"number": 1, "title": "café ☃", "labels": [{"name": "bug"}], "body": "a, b ] c"},
+        12345,
+        -1.5e3,
+        "string with \"quotes\"",
+        None,
+        True,
+        [],
+    ]
+    data = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+    for size in (1, 2, 3, 7, 64, len(data)):
+        assert list(iter_json_array(_chunks(data, size))) == payload
+
+
+def test_bare_number_split_at_chunk_edge_is_not_truncated() -> None:
+    assert list(iter_json_array([b"[12", b"34, 5", b"6]"])) == [1234, 56]
+
+
+@pytest.mark.parametrize(
+    "chunks, expected",
+    [
+        ([b"[1.", b"5]"], [1.5]),
+        ([b"[1e", b"5]"], [1e5]),
+        ([b"[1E", b"+2, 3]"], [100.0, 3]),
+        ([b"[2.5e-", b"1]"], [0.25]),
+        ([b"[-", b"7]"], [-7]),
+    ],
+)
+def test_float_and_exponent_split_at_chunk_edge_are_not_truncated(chunks: list[bytes], expected: list[object]) -> None:
+    assert list(iter_json_array(chunks)) == expected
+
+
+def test_empty_array_and_non_array_payloads_yield_nothing() -> None:
+    assert list(iter_json_array([b"  [ ]  "])) == []
+    assert list(iter_json_array([b'{"message": "Not Found"}'])) == []
+    assert list(iter_json_array([b""])) == []
+
+
+def test_elements_are_yielded_before_the_body_is_fully_read() -> None:
+    read: list[bytes] = []
+
+    def source() -> Iterator[bytes]:
+        for chunk in (b'[{"a": 1},', b' {"a": 2},', b' {"a": 3}]'):
+            read.append(chunk)
+            yield chunk
+
+    it = iter_json_array(source())
+    assert next(it) == {"a": 1}
+    assert len(read) == 1
+    assert list(it) == [{"a": 2}, {"a": 3}]
+
+
+def test_body_is_drained_after_the_closing_bracket() -> None:
+    chunks = iter([b"[1, 2]", b"  ", b"\n"])
+    assert list(iter_json_array(chunks)) == [1, 2]
+    assert next(chunks, None) is None
+
+
+@pytest.mark.parametrize("data", [b"[1, 2", b'[{"a": 1}', b"[1 2]", b"[1] x"])
+def test_malformed_input_raises(data: bytes) -> None:
+    with pytest.raises(ValueError):
+        list(iter_json_array(_chunks(data, 2)))
+
+
+def test_matches_json_loads_on_random_payloads() -> None:
+    rng = random.Random(7)
+    for _ in range(50):
+        payload = [
+            {"id": rng.randint(0, 10**12), "body": "x" * rng.randint(0, 300), "n": [rng.random() for _ in range(3)]}
+            for _ in range(rng.randint(0, 20))
+        ]
+        data = json.dumps(payload).encode("utf-8")
+        assert list(iter_json_array(_chunks(data, rng.randint(1, 97)))) == payload
+
+
+def test_key_streams_the_named_array_member_of_an_object() -> None:
+    payload = {"total_count": 3, "incomplete_results": False, "meta": {"items": [0]}, "items": [{"n": 1}, {"n": 2}, {"n": 3}], "tail": "x"}
+    data = json.dumps(payload).encode("utf-8")
+    for size in (1, 5, len(data)):
+        assert list(iter_json_array(_chunks(data, size), key="items")) == payload["items"]
+    assert list(iter_json_array([b'{"total_count": 0}'], key="items")) == []
+    assert list(iter_json_array([b'{"total_count": 3.', b'5, "items": [1]}'], key="items")) == [1]
+    assert list(iter_json_array([b"[1, 2]"], key="items")) == []
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import dataclasses
+from datetime import datetime, timezone
+
+import pytest
+
+from issue_assistant import models
+from issue_assistant.models import Issue, IssueAuthor, IssueLabel, issue_to_json
+
+
+def test_model_dataclasses_are_slotted() -> None:
+    for name in dir(models):
+        cls = getattr(models, name)
+        if isinstance(cls, type) and dataclasses.is_dataclass(cls) and cls.__module__ == models.__name__:
+            assert "__slots__" in cls.__dict__, name
+
+
+def test_slotted_issue_keeps_its_api() -> None:
+    issue = Issue(number=1, title="T", body="", author=IssueAuthor(login="u"), labels=(IssueLabel(name="bug"),))
+
+    assert not hasattr(issue, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        issue.title = "changed"  # type: ignore[misc]
+    moved = dataclasses.replace(issue, created_at=datetime(2026, 1, 1, tzinfo=timezone.utc))
+    assert issue_to_json(moved)["created_at"] == "2026-01-01T00:00:00+00:00"
+    assert issue == Issue(number=1, title="T", body="", author=IssueAuthor(login="u"), labels=(IssueLabel(name="bug"),))
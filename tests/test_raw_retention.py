@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import issue_assistant.cli as cli
+from issue_assistant.github import GitHubClient, GitHubRepoRef, parse_commit_payload
+from issue_assistant.retention import retain_raw
+from tests.conftest import FakeResponse, FakeSession, make_client
+
+
+ISSUE = {
+    "number": 4,
+    "title": "Crash",
+    "body": "boom",
+    "body_html": "<p>boom</p>",
+    "state": "open",
+    "comments": 0,
+    "html_url": "https://github.com/o/r/issues/4",
+    "reactions": {"+1": 3, "url": "https://api.github.com/repos/o/r/issues/4/reactions"},
+    "user": {"login": "u", "id": 1, "avatar_url": "https://avatars.example/u"},
+}
+
+
+class IssuesSession(FakeSession):
+    def __init__(self) -> None:
+        super().__init__()
+        self.comment_requests = 0
+
+    def get(self, url: str, params: dict[str, Any] | None = None, **kwargs: Any) -> FakeResponse:
+        if url.endswith("/comments"):
+            self.comment_requests += 1
+            return FakeResponse([])
+        return FakeResponse([ISSUE])
+
+
+def test_policies() -> None:
+    assert retain_raw(ISSUE, "full") is ISSUE
+    assert retain_raw(ISSUE, "none") == {"comments": 0}
+    assert retain_raw({"sha": "abc"}, "none") == {}
+    assert retain_raw(ISSUE, "minimal") == {"number": 4, "comments": 0, "html_url": "https://github.com/o/r/issues/4"}
+    assert parse_commit_payload({"sha": "abc", "commit": {"message": "m"}, "files": []}, raw_retention="minimal").raw == {"sha": "abc"}
+
+
+def test_client_defaults_to_minimal_and_keeps_comment_planning() -> None:
+    session = IssuesSession()
+    gh = make_client(session)
+
+    (issue,) = gh.list_issues(GitHubRepoRef(owner="o", name="r"))
+
+    assert issue.raw == {"number": 4, "comments": 0, "html_url": "https://github.com/o/r/issues/4"}
+    assert issue.body == "boom"
+    assert session.comment_requests == 0
+
+
+def test_none_drops_the_payload_but_keeps_comment_planning() -> None:
+    session = IssuesSession()
+    gh = make_client(session, raw_retention="none")
+
+    (issue,) = gh.list_issues(GitHubRepoRef(owner="o", name="r"))
+
+    assert issue.raw == {"comments": 0}
+    # The listed comment count survives, so the empty thread is still skipped.
+    assert session.comment_requests == 0
+
+    with pytest.raises(ValueError):
+        GitHubClient(token="t", raw_retention="some")
+
+
+def test_file_loaders_apply_the_policy(tmp_path: Path) -> None:
+    path = tmp_path / "issues.json"
+    path.write_text(json.dumps([ISSUE]), encoding="utf-8")
+
+    assert cli._load_issues_from_file(path)[0].raw == ISSUE
+    assert cli._load_issues_from_file(path, raw_retention="none")[0].raw == {"comments": 0}
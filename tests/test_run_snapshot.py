@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import json
+import struct
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from issue_assistant.cli import main
+from issue_assistant.models import Commit, Issue, IssueAuthor, IssueComment, IssueLabel
+from issue_assistant.phases.issue_health import DEFAULT_LIMITS as HEALTH_LIMITS
+from issue_assistant.phases.issue_health import compute_issue_health
+from issue_assistant.pipeline import analyze_issues
+from issue_assistant.snapshot import SNAPSHOT_FILENAME, RunSnapshot, load_snapshot, write_snapshot
+
+FIXTURE = Path(__file__).parent / "fixtures" / "issues.json"
+
+
+def _run():
+    t0 = datetime(2026, 1, 10, tzinfo=timezone.utc)
+    issues = [
+        Issue(
+            number=7,
+            title="Crash when saving",
+            body="Steps:\n1. save\n\nExpected: saved\n\nTraceback: ValueError",
+            author=IssueAuthor(login="alice", id=1),
+            labels=(IssueLabel(name="bug"),),
+            state="open",
+            created_at=t0,
+            updated_at=t0,
+            comments=(IssueComment(id=70, author=IssueAuthor(login="bob", id=2), body="same here", created_at=t0, updated_at=None),),
+            raw={"number": 7, "comments": 1},
+        ),
+        Issue(number=8, title="Same crash as #7", body="duplicate of #7", author=IssueAuthor(login="alice", id=1), state="open", created_at=t0),
+    ]
+    commits = [Commit(sha="abc123", message="Fix save crash (fixes #7)")]
+    return analyze_issues(
+        issues=issues,
+        repo="o/r",
+        commits=commits,
+        governance_mode="strict",
+    )
+
+
+def test_round_trip_and_lazy_access(tmp_path: Path) -> None:
+    run = _run()
+    path = tmp_path / SNAPSHOT_FILENAME
+    write_snapshot(run, path)
+
+    loaded = load_snapshot(path)
+    assert loaded == run
+    assert loaded.dependencies and loaded.dependencies == run.dependencies
+    assert loaded.table == run.table
+    # Authors are shared flyweights again after loading.
+    assert loaded.issues[0].normalized.issue.author is loaded.issues[1].normalized.issue.author
+
+    with RunSnapshot(path) as snapshot:
+        assert len(snapshot) == 2
+        assert list(snapshot.numbers) == [7, 8]
+        assert snapshot.governance_mode == "strict"
+        assert snapshot.analysis(1) == run.issues[1]
+
+
+def test_rejects_foreign_and_truncated_files(tmp_path: Path) -> None:
+    path = tmp_path / SNAPSHOT_FILENAME
+    path.write_bytes(b"")
+    with pytest.raises(ValueError, match="not an issue-assistant snapshot"):
+        RunSnapshot(path)
+
+    write_snapshot(_run(), path)
+    data = path.read_bytes()
+
+    path.write_bytes(data[:-5])
+    with pytest.raises(ValueError, match="truncated"):
+        RunSnapshot(path)
+
+    path.write_bytes(data[:8] + struct.pack("<H", 99) + data[10:])
+    with pytest.raises(ValueError, match="re-run the analysis"):
+        RunSnapshot(path)
+
+
+def test_lazy_run_decodes_only_what_is_read(tmp_path: Path) -> None:
+    run = _run()
+    path = tmp_path / SNAPSHOT_FILENAME
+    write_snapshot(run, path)
+
+    with RunSnapshot(path) as snapshot:
+        lazy = snapshot.run(lazy=True)
+        assert compute_issue_health(run=lazy, limits=HEALTH_LIMITS) == compute_issue_health(run=run, limits=HEALTH_LIMITS)
+        assert lazy.issues._decoded == [None, None]  # type: ignore[attr-defined]
+        assert lazy.issues[-1] == run.issues[1]
+        assert lazy.issues[1] is lazy.issues[-1]
+        assert list(lazy.issues) == list(run.issues)
+
+
+def test_snapshot_is_opt_in_and_render_rewrites_artifacts(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    out_dir = tmp_path / "out"
+    snapshot = tmp_path / "runs" / SNAPSHOT_FILENAME
+    monkeypatch.setattr(
+        sys, "argv", ["issue-assistant", "analyze", "--issues-file", str(FIXTURE), "--output-dir", str(out_dir)]
+    )
+    main()
+    assert not (out_dir / SNAPSHOT_FILENAME).exists()
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["issue-assistant", "analyze", "--issues-file", str(FIXTURE), "--output-dir", str(out_dir), "--snapshot", str(snapshot)],
+    )
+    main()
+    assert snapshot.exists()
+    assert not (out_dir / SNAPSHOT_FILENAME).exists()
+
+    rendered = tmp_path / "rendered"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "issue-assistant",
+            "render",
+            "--snapshot",
+            str(snapshot),
+            "--output-dir",
+            str(rendered),
+            "--phases",
+            "issue_health",
+        ],
+    )
+    main()
+
+    for name in ("issues.json", "issue_health.json", "ISSUE_HEALTH.md", "TRIAGE.md"):
+        assert (rendered / name).read_bytes() == (out_dir / name).read_bytes()
+    assert not (rendered / "weekly_digest.json").exists()
+    assert json.loads((rendered / "issues.json").read_text(encoding="utf-8"))["issues"]